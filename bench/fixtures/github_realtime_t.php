@@ -0,0 +1,602 @@
+<!DOCTYPE html><html lang="ja"><head><meta charset="utf-8"><title>ツイ動画 リアルタイム保存ランキング</title><link rel="stylesheet" href="/css/style.css?v=3"><script async src="https://www.googletagmanager.com/gtag/js?id=G-XXXX"></script></head><body><header><h1>リアルタイム保存ランキング</h1><nav><a href="/realtime_t.php">リアルタイム</a><a href="/ranking_t.php">24時間</a><a href="/ko/realtime_t.php">한국</a></nav></header><main id="container">
+<div class="item" data-rank="1">
+  <div class="poster"><a href="https://video.twimg.com/amplify_video/1783805198288314747/vid/avc1/480x852/biR__1fY4qCBi4wo.mp4?tag=16" target="_blank" rel="noopener"><img src="https://pbs.twimg.com/amplify_video_thumb/1783805198288314747/img/4OPwMOqCN_CU.jpg" loading="lazy" alt=""></a></div>
+  <div class="meta"><span class="rank">1</span><span class="count">70351 views</span></div>
+  <div class="saisei"><a href="https://video.twimg.com/amplify_video/1783805198288314747/vid/avc1/480x480/biR__1fY4qCBi4wo.mp4?tag=16">SD</a></div>
+  <div class="tweet"><a href="https://x.com/mio_th/status/1754006927682238605" target="_blank">ちことなそた面みまみ面らくねもはあね画すふ</a></div>
+</div>
+<div class="item" data-rank="2">
+  <div class="poster"><a href="https://video.twimg.com/ext_tw_video/1746046736312070149/pu/vid/avc1/480x852/5TpF3cScLKlmYJ5k.mp4?tag=12" target="_blank" rel="noopener"><img src="https://pbs.twimg.com/ext_tw_video_thumb/1746046736312070149/pu/img/-0PHitA6KS8H.jpg" loading="lazy" alt=""></a></div>
+  <div class="meta"><span class="rank">2</span><span class="count">4790 views</span></div>
+  <div class="saisei"><a href="https://video.twimg.com/ext_tw_video/1746046736312070149/pu/vid/avc1/480x480/5TpF3cScLKlmYJ5k.mp4?tag=12">SD</a></div>
+  <div class="tweet"><a href="https://x.com/sora_h4nz/status/1819180638328705669" target="_blank">つけまほんすしわなり</a></div>
+</div>
+<div class="item" data-rank="3">
+  <div class="poster"><a href="https://video.twimg.com/amplify_video/1774454195007672143/vid/avc1/1280x720/zfWMaXmEJvsBi3h0.mp4?tag=16" target="_blank" rel="noopener"><img src="https://pbs.twimg.com/amplify_video_thumb/1774454195007672143/img/tycixC4_cIiZ.jpg" loading="lazy" alt=""></a></div>
+  <div class="meta"><span class="rank">3</span><span class="count">42398 views</span></div>
+  <div class="saisei"><a href="https://video.twimg.com/amplify_video/1774454195007672143/vid/avc1/640x720/zfWMaXmEJvsBi3h0.mp4?tag=16">SD</a></div>
+  <div class="tweet"><a href="https://x.com/aoi_i1vpxp/status/1774521244037642949" target="_blank">白ほきあせ画けひなてをしりゆ猫へいのみも</a></div>
+</div>
+<div class="item" data-rank="4">
+  <div class="poster"><a href="https://video.twimg.com/ext_tw_video/1714972474597282922/pu/vid/avc1/480x852/kaHrfvOk-RS6cgzy.mp4?tag=16" target="_blank" rel="noopener"><img src="https://pbs.twimg.com/ext_tw_video_thumb/1714972474597282922/pu/img/jjtHIro_98xk.jpg" loading="lazy" alt=""></a></div>
+  <div class="meta"><span class="rank">4</span><span class="count">63545 views</span></div>
+  <div class="saisei"><a href="https://video.twimg.com/ext_tw_video/1714972474597282922/pu/vid/avc1/480x480/kaHrfvOk-RS6cgzy.mp4?tag=16">SD</a></div>
+  <div class="tweet"><a href="https://x.com/riku_k8kdb/status/1806860842808175116" target="_blank">そは白ほさなひさみいんこかむち面ふへんしるやね犬い画く動けうふいそひめせ</a></div>
+</div>
+<div class="item" data-rank="5">
+  <div class="poster"><a href="https://video.twimg.com/ext_tw_video/1845267701877927777/pu/vid/avc1/480x852/QLqiUMdPNGX4y0FK.mp4?tag=12" target="_blank" rel="noopener"><img src="https://pbs.twimg.com/ext_tw_video_thumb/1845267701877927777/pu/img/7C8vR6RyeEA0.jpg" loading="lazy" alt=""></a></div>
+  <div class="meta"><span class="rank">5</span><span class="count">3539 views</span></div>
+  <div class="saisei"><a href="https://video.twimg.com/ext_tw_video/1845267701877927777/pu/vid/avc1/480x480/QLqiUMdPNGX4y0FK.mp4?tag=12">SD</a></div>
+  <div class="tweet"><a href="https://x.com/riku_anfqmem/status/1767855679043151985" target="_blank">のぬみれおしけつち今し猫ちし今おきくえにしけあらうすみ面ゆららわ動けうもへへわこらねねせたみま白たりかやけ画今</a></div>
+</div>
+<div class="item" data-rank="6">
+  <div class="poster"><a href="https://video.twimg.com/amplify_video/1743108123986100482/vid/avc1/480x852/ovxa4fgZ0CAiaHpj.mp4?tag=12" target="_blank" rel="noopener"><img src="https://pbs.twimg.com/amplify_video_thumb/1743108123986100482/img/wvwmjkkBd9Bh.jpg" loading="lazy" alt=""></a></div>
+  <div class="meta"><span class="rank">6</span><span class="count">53872 views</span></div>
+  <div class="saisei"><a href="https://video.twimg.com/amplify_video/1743108123986100482/vid/avc1/480x480/ovxa4fgZ0CAiaHpj.mp4?tag=12">SD</a></div>
+  <div class="tweet"><a href="https://x.com/haru_pdzup/status/1728874817334572103" target="_blank">しけ犬わににいぬおせこ犬れうはか動へのくろうりい今うたねろさ白ぬめのしれににすゆさ面しうあ</a></div>
+</div>
+<div class="item" data-rank="7">
+  <div class="poster"><a href="https://video.twimg.com/amplify_video/1815892817928319406/vid/avc1/480x852/fISaTFlUbSJnEAcr.mp4?tag=14" target="_blank" rel="noopener"><img src="https://pbs.twimg.com/amplify_video_thumb/1815892817928319406/img/jYUbKsS9QFMp.jpg" loading="lazy" alt=""></a></div>
+  <div class="meta"><span class="rank">7</span><span class="count">61394 views</span></div>
+  <div class="saisei"><a href="https://video.twimg.com/amplify_video/1815892817928319406/vid/avc1/480x480/fISaTFlUbSJnEAcr.mp4?tag=14">SD</a></div>
+  <div class="tweet"><a href="https://x.com/nana_rr/status/1738084834390264433" target="_blank">きりえへこまえいもり面よ日くももこくせへわりみおりへこもせちのれかのすゆをそりはしたほをめあろみねせのらそく面のえ面き</a></div>
+</div>
+<div class="item" data-rank="8">
+  <div class="poster"><a href="https://video.twimg.com/amplify_video/1724472106744353426/vid/avc1/720x1280/fAA5fnvhjysFVQ0F.mp4?tag=21" target="_blank" rel="noopener"><img src="https://pbs.twimg.com/amplify_video_thumb/1724472106744353426/img/teCmadHEtPMS.jpg" loading="lazy" alt=""></a></div>
+  <div class="meta"><span class="rank">8</span><span class="count">42444 views</span></div>
+  <div class="saisei"><a href="https://video.twimg.com/amplify_video/1724472106744353426/vid/avc1/360x640/fAA5fnvhjysFVQ0F.mp4?tag=21">SD</a></div>
+  <div class="tweet"><a href="https://x.com/hina_uasaw/status/1840074455224703179" target="_blank">ちはやへうちわをあね</a></div>
+</div>
+<div class="item" data-rank="9">
+  <div class="poster"><a href="https://video.twimg.com/amplify_video/1714471142497366549/vid/avc1/1280x720/ng_dow511OaVm8-e.mp4?tag=14" target="_blank" rel="noopener"><img src="https://pbs.twimg.com/amplify_video_thumb/1714471142497366549/img/g3CsJeBP3h5g.jpg" loading="lazy" alt=""></a></div>
+  <div class="meta"><span class="rank">9</span><span class="count">27159 views</span></div>
+  <div class="saisei"><a href="https://video.twimg.com/amplify_video/1714471142497366549/vid/avc1/640x720/ng_dow511OaVm8-e.mp4?tag=14">SD</a></div>
+  <div class="tweet"><a href="https://x.com/mio_1yi5/status/1744269767106656747" target="_blank">てこかゆにさへきよ今はねになぬこち</a></div>
+</div>
+<div class="item" data-rank="10">
+  <div class="poster"><a href="https://video.twimg.com/ext_tw_video/1808149255164220423/pu/vid/avc1/480x852/gn5703gTh2zFHnK3.mp4?tag=21" target="_blank" rel="noopener"><img src="https://pbs.twimg.com/ext_tw_video_thumb/1808149255164220423/pu/img/a00FrlRU3X0c.jpg" loading="lazy" alt=""></a></div>
+  <div class="meta"><span class="rank">10</span><span class="count">11437 views</span></div>
+  <div class="saisei"><a href="https://video.twimg.com/ext_tw_video/1808149255164220423/pu/vid/avc1/480x480/gn5703gTh2zFHnK3.mp4?tag=21">SD</a></div>
+  <div class="tweet"><a href="https://x.com/kaito_3wwmuos/status/1719027060920486211" target="_blank">けすや猫そちむいおみはとぬいそこせえをあぬこしれ犬今てほねおねめにわのち白みそ白ひめは画るのなろ動め面ほぬつそけいま</a></div>
+</div>
+<div class="item" data-rank="11">
+  <div class="poster"><a href="https://video.twimg.com/ext_tw_video/1841278508564246376/pu/vid/avc1/720x1280/Wv36eBJtpYnJbD9a.mp4?tag=14" target="_blank" rel="noopener"><img src="https://pbs.twimg.com/ext_tw_video_thumb/1841278508564246376/pu/img/6GstULCSgy46.jpg" loading="lazy" alt=""></a></div>
+  <div class="meta"><span class="rank">11</span><span class="count">63772 views</span></div>
+  <div class="saisei"><a href="https://video.twimg.com/ext_tw_video/1841278508564246376/pu/vid/avc1/360x640/Wv36eBJtpYnJbD9a.mp4?tag=14">SD</a></div>
+  <div class="tweet"><a href="https://x.com/aoi_8nxbrs/status/1799464309891978263" target="_blank">わ面へくかゆてへう犬たももとしまつおこう白しいも犬はそ</a></div>
+</div>
+<div class="item" data-rank="12">
+  <div class="poster"><a href="https://video.twimg.com/ext_tw_video/1716495582471806607/pu/vid/avc1/720x1280/Xi5ssqAIkeXpHB1N.mp4?tag=16" target="_blank" rel="noopener"><img src="https://pbs.twimg.com/ext_tw_video_thumb/1716495582471806607/pu/img/jPZS5TCvKaaH.jpg" loading="lazy" alt=""></a></div>
+  <div class="meta"><span class="rank">12</span><span class="count">55028 views</span></div>
+  <div class="saisei"><a href="https://video.twimg.com/ext_tw_video/1716495582471806607/pu/vid/avc1/360x640/Xi5ssqAIkeXpHB1N.mp4?tag=16">SD</a></div>
+  <div class="tweet"><a href="https://x.com/sora_dxz7j/status/1720803755120780004" target="_blank">ちけへううぬす動ききりひこき面けみりしれへゆあぬよ日りれたほしひを今りそきとつのす動</a></div>
+</div>
+<div class="item" data-rank="13">
+  <div class="poster"><a href="https://video.twimg.com/amplify_video/1790630871708326473/vid/avc1/720x720/KM56c-gJF-oc9DDB.mp4?tag=12" target="_blank" rel="noopener"><img src="https://pbs.twimg.com/amplify_video_thumb/1790630871708326473/img/bJnF_-tvhMli.jpg" loading="lazy" alt=""></a></div>
+  <div class="meta"><span class="rank">13</span><span class="count">71507 views</span></div>
+  <div class="saisei"><a href="https://video.twimg.com/amplify_video/1790630871708326473/vid/avc1/360x720/KM56c-gJF-oc9DDB.mp4?tag=12">SD</a></div>
+  <div class="tweet"><a href="https://x.com/kaito_m5bq27/status/1750931403173314702" target="_blank">をぬく面る白せむへさそめととせていみてしへんや白わたきこんのてえほおりをてみ動てけうと日画</a></div>
+</div>
+<div class="item" data-rank="14">
+  <div class="poster"><a href="https://video.twimg.com/amplify_video/1843263093280955483/vid/avc1/720x720/jPGi_6w3CR7OxdDL.mp4?tag=12" target="_blank" rel="noopener"><img src="https://pbs.twimg.com/amplify_video_thumb/1843263093280955483/img/pdUDtYGcDu1_.jpg" loading="lazy" alt=""></a></div>
+  <div class="meta"><span class="rank">14</span><span class="count">29805 views</span></div>
+  <div class="saisei"><a href="https://video.twimg.com/amplify_video/1843263093280955483/vid/avc1/360x720/jPGi_6w3CR7OxdDL.mp4?tag=12">SD</a></div>
+  <div class="tweet"><a href="https://x.com/mio_ddjnr/status/1713980967145997062" target="_blank">日画あへさよらきたいわ犬犬ほ動むちぬむなんくてそけ日めきしへになりこ今ひにとふせすそをうすによん犬のれ犬ほのま今くをんた</a></div>
+</div>
+<div class="item" data-rank="15">
+  <div class="poster"><a href="https://video.twimg.com/amplify_video/1750275246779931110/vid/avc1/480x852/GjdXxfJAsWyGy_gs.mp4?tag=21" target="_blank" rel="noopener"><img src="https://pbs.twimg.com/amplify_video_thumb/1750275246779931110/img/p2a0aMrkViRf.jpg" loading="lazy" alt=""></a></div>
+  <div class="meta"><span class="rank">15</span><span class="count">27374 views</span></div>
+  <div class="saisei"><a href="https://video.twimg.com/amplify_video/1750275246779931110/vid/avc1/480x480/GjdXxfJAsWyGy_gs.mp4?tag=21">SD</a></div>
+  <div class="tweet"><a href="https://x.com/hina_kj7l/status/1741116312502245081" target="_blank">にみゆと画いさにめや面とや</a></div>
+</div>
+<div class="item" data-rank="16">
+  <div class="poster"><a href="https://video.twimg.com/amplify_video/1724185674495728002/vid/avc1/720x1280/UoLcnqMLIkGV3xC3.mp4?tag=21" target="_blank" rel="noopener"><img src="https://pbs.twimg.com/amplify_video_thumb/1724185674495728002/img/gZRec8tLLygU.jpg" loading="lazy" alt=""></a></div>
+  <div class="meta"><span class="rank">16</span><span class="count">43979 views</span></div>
+  <div class="saisei"><a href="https://video.twimg.com/amplify_video/1724185674495728002/vid/avc1/360x640/UoLcnqMLIkGV3xC3.mp4?tag=21">SD</a></div>
+  <div class="tweet"><a href="https://x.com/hina_tehld/status/1823743305394824519" target="_blank">ねを猫たてろの白なうた白み今んよこぬいてす猫けていけらぬふんらしれよむ</a></div>
+</div>
+<div class="item" data-rank="17">
+  <div class="poster"><a href="https://video.twimg.com/ext_tw_video/1812044696651694838/pu/vid/avc1/720x1280/e3YoCPC-gogq9pxj.mp4?tag=16" target="_blank" rel="noopener"><img src="https://pbs.twimg.com/ext_tw_video_thumb/1812044696651694838/pu/img/sJ_hBBTmRh9f.jpg" loading="lazy" alt=""></a></div>
+  <div class="meta"><span class="rank">17</span><span class="count">84657 views</span></div>
+  <div class="saisei"><a href="https://video.twimg.com/ext_tw_video/1812044696651694838/pu/vid/avc1/360x640/e3YoCPC-gogq9pxj.mp4?tag=16">SD</a></div>
+  <div class="tweet"><a href="https://x.com/sora_170r3c/status/1739906515370463046" target="_blank">れまそと白はま犬ひをむんもくすたすむぬない日ひしゆかけ猫ゆとくり</a></div>
+</div>
+<div class="item" data-rank="18">
+  <div class="poster"><a href="https://video.twimg.com/ext_tw_video/1779463003455758382/pu/vid/avc1/720x720/J5bgnShJYzQcExRz.mp4?tag=16" target="_blank" rel="noopener"><img src="https://pbs.twimg.com/ext_tw_video_thumb/1779463003455758382/pu/img/9BbZxv8zi5ad.jpg" loading="lazy" alt=""></a></div>
+  <div class="meta"><span class="rank">18</span><span class="count">22723 views</span></div>
+  <div class="saisei"><a href="https://video.twimg.com/ext_tw_video/1779463003455758382/pu/vid/avc1/360x720/J5bgnShJYzQcExRz.mp4?tag=16">SD</a></div>
+  <div class="tweet"><a href="https://x.com/sora_wib4tec/status/1779128468823295420" target="_blank">りあちにもるよさ動うのうろはの猫せ</a></div>
+</div>
+<div class="item" data-rank="19">
+  <div class="poster"><a href="https://video.twimg.com/amplify_video/1736723012572052684/vid/avc1/720x1280/jDsAki6c1TwZG0v9.mp4?tag=16" target="_blank" rel="noopener"><img src="https://pbs.twimg.com/amplify_video_thumb/1736723012572052684/img/pssth65IpRAZ.jpg" loading="lazy" alt=""></a></div>
+  <div class="meta"><span class="rank">19</span><span class="count">10535 views</span></div>
+  <div class="saisei"><a href="https://video.twimg.com/amplify_video/1736723012572052684/vid/avc1/360x640/jDsAki6c1TwZG0v9.mp4?tag=16">SD</a></div>
+  <div class="tweet"><a href="https://x.com/mio_gtmi/status/1751360391756573353" target="_blank">み日にくなふししいやおさわろよからもつしるまめたあいろ</a></div>
+</div>
+<div class="item" data-rank="20">
+  <div class="poster"><a href="https://video.twimg.com/ext_tw_video/1728608490722783998/pu/vid/avc1/720x1280/AwC1y8twsYhkZVjB.mp4?tag=14" target="_blank" rel="noopener"><img src="https://pbs.twimg.com/ext_tw_video_thumb/1728608490722783998/pu/img/4cYp-j8sJJYw.jpg" loading="lazy" alt=""></a></div>
+  <div class="meta"><span class="rank">20</span><span class="count">70051 views</span></div>
+  <div class="saisei"><a href="https://video.twimg.com/ext_tw_video/1728608490722783998/pu/vid/avc1/360x640/AwC1y8twsYhkZVjB.mp4?tag=14">SD</a></div>
+  <div class="tweet"><a href="https://x.com/ren_xz3fw8/status/1815256563396146518" target="_blank">こうやたてこほのえや面さなめるえこきへと面せえせろひくえかいよえんしはとつ犬れねとよわら日れ猫はむぬるゆ</a></div>
+</div>
+<div class="item" data-rank="21">
+  <div class="poster"><a href="https://video.twimg.com/ext_tw_video/1770222212941921912/pu/vid/avc1/1280x720/I6v0Vi6S7H4I5Zm4.mp4?tag=12" target="_blank" rel="noopener"><img src="https://pbs.twimg.com/ext_tw_video_thumb/1770222212941921912/pu/img/vCstVzHjkSAK.jpg" loading="lazy" alt=""></a></div>
+  <div class="meta"><span class="rank">21</span><span class="count">11786 views</span></div>
+  <div class="saisei"><a href="https://video.twimg.com/ext_tw_video/1770222212941921912/pu/vid/avc1/640x720/I6v0Vi6S7H4I5Zm4.mp4?tag=12">SD</a></div>
+  <div class="tweet"><a href="https://x.com/ren_yrp7mo/status/1809492716572581852" target="_blank">そ動よをけね動今り今てゆ猫けめつへ面のきへむたをちひまい白も</a></div>
+</div>
+<div class="item" data-rank="22">
+  <div class="poster"><a href="https://video.twimg.com/amplify_video/1743617448443799317/vid/avc1/480x852/H2OVQzUl-NCRCtO9.mp4?tag=12" target="_blank" rel="noopener"><img src="https://pbs.twimg.com/amplify_video_thumb/1743617448443799317/img/f6KD0L1Kl7oH.jpg" loading="lazy" alt=""></a></div>
+  <div class="meta"><span class="rank">22</span><span class="count">29784 views</span></div>
+  <div class="saisei"><a href="https://video.twimg.com/amplify_video/1743617448443799317/vid/avc1/480x480/H2OVQzUl-NCRCtO9.mp4?tag=12">SD</a></div>
+  <div class="tweet"><a href="https://x.com/ren_qab/status/1762947056540126406" target="_blank">しもにいくめほぬ犬にはいかや</a></div>
+</div>
+<div class="item" data-rank="23">
+  <div class="poster"><a href="https://video.twimg.com/amplify_video/1760571205640577328/vid/avc1/480x852/5tS0Uk-lcLsvjZcu.mp4?tag=14" target="_blank" rel="noopener"><img src="https://pbs.twimg.com/amplify_video_thumb/1760571205640577328/img/KTslb4rRaQFp.jpg" loading="lazy" alt=""></a></div>
+  <div class="meta"><span class="rank">23</span><span class="count">57566 views</span></div>
+  <div class="saisei"><a href="https://video.twimg.com/amplify_video/1760571205640577328/vid/avc1/480x480/5tS0Uk-lcLsvjZcu.mp4?tag=14">SD</a></div>
+  <div class="tweet"><a href="https://x.com/yuki_t5ao0/status/1777717534347096525" target="_blank">てろれ白すまほもま白</a></div>
+</div>
+<div class="item" data-rank="24">
+  <div class="poster"><a href="https://video.twimg.com/ext_tw_video/1812493825148208010/pu/vid/avc1/720x720/K4MqGQhvWPei-i4V.mp4?tag=16" target="_blank" rel="noopener"><img src="https://pbs.twimg.com/ext_tw_video_thumb/1812493825148208010/pu/img/ryim_F1YnVZf.jpg" loading="lazy" alt=""></a></div>
+  <div class="meta"><span class="rank">24</span><span class="count">46653 views</span></div>
+  <div class="saisei"><a href="https://video.twimg.com/ext_tw_video/1812493825148208010/pu/vid/avc1/360x720/K4MqGQhvWPei-i4V.mp4?tag=16">SD</a></div>
+  <div class="tweet"><a href="https://x.com/hina_hh/status/1724001347056879774" target="_blank">にままは白今ひ面すいうりむよちやはすねゆ日画らはらせなんつえうい</a></div>
+</div>
+<div class="item" data-rank="25">
+  <div class="poster"><a href="https://video.twimg.com/amplify_video/1811964948623753065/vid/avc1/480x852/VeZd7UfrB6ks266S.mp4?tag=14" target="_blank" rel="noopener"><img src="https://pbs.twimg.com/amplify_video_thumb/1811964948623753065/img/uzvJ--gLAzXH.jpg" loading="lazy" alt=""></a></div>
+  <div class="meta"><span class="rank">25</span><span class="count">14956 views</span></div>
+  <div class="saisei"><a href="https://video.twimg.com/amplify_video/1811964948623753065/vid/avc1/480x480/VeZd7UfrB6ks266S.mp4?tag=14">SD</a></div>
+  <div class="tweet"><a href="https://x.com/nana_sn00xt/status/1810296696416925476" target="_blank">わくいせのれら動あやまはてゆりこなせいふのむみ画い面うぬは</a></div>
+</div>
+<div class="item" data-rank="26">
+  <div class="poster"><a href="https://video.twimg.com/amplify_video/1728052946407595111/vid/avc1/1280x720/XRRObEn9UWd2sSSQ.mp4?tag=16" target="_blank" rel="noopener"><img src="https://pbs.twimg.com/amplify_video_thumb/1728052946407595111/img/ElXX7ATboDIG.jpg" loading="lazy" alt=""></a></div>
+  <div class="meta"><span class="rank">26</span><span class="count">74203 views</span></div>
+  <div class="saisei"><a href="https://video.twimg.com/amplify_video/1728052946407595111/vid/avc1/640x720/XRRObEn9UWd2sSSQ.mp4?tag=16">SD</a></div>
+  <div class="tweet"><a href="https://x.com/aoi_xbt/status/1792751791246151859" target="_blank">動ら動猫い面いわか猫すきこみぬはちきむえきわやしよこの猫白ほけわめ猫けけこやすたあしわきむつ</a></div>
+</div>
+<div class="item" data-rank="27">
+  <div class="poster"><a href="https://video.twimg.com/ext_tw_video/1737485484519380946/pu/vid/avc1/1280x720/LC8tiNHk-hyw3kyT.mp4?tag=14" target="_blank" rel="noopener"><img src="https://pbs.twimg.com/ext_tw_video_thumb/1737485484519380946/pu/img/hOeAfPWLhSbN.jpg" loading="lazy" alt=""></a></div>
+  <div class="meta"><span class="rank">27</span><span class="count">16167 views</span></div>
+  <div class="saisei"><a href="https://video.twimg.com/ext_tw_video/1737485484519380946/pu/vid/avc1/640x720/LC8tiNHk-hyw3kyT.mp4?tag=14">SD</a></div>
+  <div class="tweet"><a href="https://x.com/yuki_dv4/status/1748217318184826080" target="_blank">ちひつ猫つきおきら動ろ白</a></div>
+</div>
+<div class="item" data-rank="28">
+  <div class="poster"><a href="https://video.twimg.com/ext_tw_video/1830641903179742642/pu/vid/avc1/720x1280/mniyOMUnHsI2FD_N.mp4?tag=21" target="_blank" rel="noopener"><img src="https://pbs.twimg.com/ext_tw_video_thumb/1830641903179742642/pu/img/eY7Kbfjkm9ny.jpg" loading="lazy" alt=""></a></div>
+  <div class="meta"><span class="rank">28</span><span class="count">7109 views</span></div>
+  <div class="saisei"><a href="https://video.twimg.com/ext_tw_video/1830641903179742642/pu/vid/avc1/360x640/mniyOMUnHsI2FD_N.mp4?tag=21">SD</a></div>
+  <div class="tweet"><a href="https://x.com/nana_9j/status/1721359135685851548" target="_blank">め猫ねひ動画をむうへろひむ</a></div>
+</div>
+<div class="item" data-rank="29">
+  <div class="poster"><a href="https://video.twimg.com/amplify_video/1840131412090997564/vid/avc1/720x720/14EAg1V3wqvQpaBw.mp4?tag=12" target="_blank" rel="noopener"><img src="https://pbs.twimg.com/amplify_video_thumb/1840131412090997564/img/_j6-QGu9F5Oh.jpg" loading="lazy" alt=""></a></div>
+  <div class="meta"><span class="rank">29</span><span class="count">64138 views</span></div>
+  <div class="saisei"><a href="https://video.twimg.com/amplify_video/1840131412090997564/vid/avc1/360x720/14EAg1V3wqvQpaBw.mp4?tag=12">SD</a></div>
+  <div class="tweet"><a href="https://x.com/sora_ki/status/1833331109181115934" target="_blank">おたやのこいほ画えへ日しね日ゆ動犬を面動そお犬ろせりこはりむやお動</a></div>
+</div>
+<div class="item" data-rank="30">
+  <div class="poster"><a href="https://video.twimg.com/ext_tw_video/1743458410136970089/pu/vid/avc1/480x852/tQonYpJCu1-MveX7.mp4?tag=12" target="_blank" rel="noopener"><img src="https://pbs.twimg.com/ext_tw_video_thumb/1743458410136970089/pu/img/D45ahNPICDgA.jpg" loading="lazy" alt=""></a></div>
+  <div class="meta"><span class="rank">30</span><span class="count">53909 views</span></div>
+  <div class="saisei"><a href="https://video.twimg.com/ext_tw_video/1743458410136970089/pu/vid/avc1/480x480/tQonYpJCu1-MveX7.mp4?tag=12">SD</a></div>
+  <div class="tweet"><a href="https://x.com/yuki_xyfh/status/1837334833937762456" target="_blank">くすきそ画にん猫めま動きと</a></div>
+</div>
+<div class="item" data-rank="31">
+  <div class="poster"><a href="https://video.twimg.com/ext_tw_video/1724320980323201045/pu/vid/avc1/720x720/szdUbPHQU-R4fGQ-.mp4?tag=14" target="_blank" rel="noopener"><img src="https://pbs.twimg.com/ext_tw_video_thumb/1724320980323201045/pu/img/4K6xu2MPM0wd.jpg" loading="lazy" alt=""></a></div>
+  <div class="meta"><span class="rank">31</span><span class="count">81695 views</span></div>
+  <div class="saisei"><a href="https://video.twimg.com/ext_tw_video/1724320980323201045/pu/vid/avc1/360x720/szdUbPHQU-R4fGQ-.mp4?tag=14">SD</a></div>
+  <div class="tweet"><a href="https://x.com/aoi_4x8b/status/1742033882406590874" target="_blank">え犬いまつれを動みわ犬らねくそま犬きめ動なねろなあてう猫ね面くとらくねね</a></div>
+</div>
+<div class="item" data-rank="32">
+  <div class="poster"><a href="https://video.twimg.com/amplify_video/1822031045944873457/vid/avc1/720x720/IKbVET5q75dPziG8.mp4?tag=14" target="_blank" rel="noopener"><img src="https://pbs.twimg.com/amplify_video_thumb/1822031045944873457/img/HkIku_VRXU-U.jpg" loading="lazy" alt=""></a></div>
+  <div class="meta"><span class="rank">32</span><span class="count">57369 views</span></div>
+  <div class="saisei"><a href="https://video.twimg.com/amplify_video/1822031045944873457/vid/avc1/360x720/IKbVET5q75dPziG8.mp4?tag=14">SD</a></div>
+  <div class="tweet"><a href="https://x.com/kaito_uetd5/status/1770307930385207799" target="_blank">動を犬か画ははわあつをいわまあえちゆいれいもへのて動や今さとけすけゆつをやけなんれい</a></div>
+</div>
+<div class="item" data-rank="33">
+  <div class="poster"><a href="https://video.twimg.com/ext_tw_video/1804991078696268454/pu/vid/avc1/720x1280/iX5hh59NYcF8iAiy.mp4?tag=14" target="_blank" rel="noopener"><img src="https://pbs.twimg.com/ext_tw_video_thumb/1804991078696268454/pu/img/Zm9mGvvgb_Nj.jpg" loading="lazy" alt=""></a></div>
+  <div class="meta"><span class="rank">33</span><span class="count">62701 views</span></div>
+  <div class="saisei"><a href="https://video.twimg.com/ext_tw_video/1804991078696268454/pu/vid/avc1/360x640/iX5hh59NYcF8iAiy.mp4?tag=14">SD</a></div>
+  <div class="tweet"><a href="https://x.com/hina_zlf0oqw/status/1731089077595256399" target="_blank">わるよぬひわりえみて犬いこくのしあねつとにさすれち犬な</a></div>
+</div>
+<div class="item" data-rank="34">
+  <div class="poster"><a href="https://video.twimg.com/amplify_video/1818382126326109634/vid/avc1/720x1280/K8QaB6mq3YrRG3cd.mp4?tag=21" target="_blank" rel="noopener"><img src="https://pbs.twimg.com/amplify_video_thumb/1818382126326109634/img/cwFfE50lqiK4.jpg" loading="lazy" alt=""></a></div>
+  <div class="meta"><span class="rank">34</span><span class="count">28017 views</span></div>
+  <div class="saisei"><a href="https://video.twimg.com/amplify_video/1818382126326109634/vid/avc1/360x640/K8QaB6mq3YrRG3cd.mp4?tag=21">SD</a></div>
+  <div class="tweet"><a href="https://x.com/aoi_axac/status/1705588038333339449" target="_blank">おちははにめくぬむ画もはあ動いせ日ゆ画さるふねへひむのしろへへへんおいしを</a></div>
+</div>
+<div class="item" data-rank="35">
+  <div class="poster"><a href="https://video.twimg.com/amplify_video/1731185736997286457/vid/avc1/480x852/zdUi2_yv2WLFDvci.mp4?tag=14" target="_blank" rel="noopener"><img src="https://pbs.twimg.com/amplify_video_thumb/1731185736997286457/img/SwcdepKdQDfF.jpg" loading="lazy" alt=""></a></div>
+  <div class="meta"><span class="rank">35</span><span class="count">75964 views</span></div>
+  <div class="saisei"><a href="https://video.twimg.com/amplify_video/1731185736997286457/vid/avc1/480x480/zdUi2_yv2WLFDvci.mp4?tag=14">SD</a></div>
+  <div class="tweet"><a href="https://x.com/mio_zlyb3/status/1756364305260551271" target="_blank">よえひかゆ面せ今ちぬまおおせはのあてそけれあとねめみへえかちおほ日ちくちのさ画動あか日とひなさをそわない</a></div>
+</div>
+<div class="item" data-rank="36">
+  <div class="poster"><a href="https://video.twimg.com/amplify_video/1838836163250896456/vid/avc1/720x1280/5-11HOJkjEXTjw-F.mp4?tag=16" target="_blank" rel="noopener"><img src="https://pbs.twimg.com/amplify_video_thumb/1838836163250896456/img/h7kQzARUVHok.jpg" loading="lazy" alt=""></a></div>
+  <div class="meta"><span class="rank">36</span><span class="count">16840 views</span></div>
+  <div class="saisei"><a href="https://video.twimg.com/amplify_video/1838836163250896456/vid/avc1/360x640/5-11HOJkjEXTjw-F.mp4?tag=16">SD</a></div>
+  <div class="tweet"><a href="https://x.com/haru_fy9/status/1754344029531435495" target="_blank">け画うねう猫ははゆへこれおみ白わ</a></div>
+</div>
+<div class="item" data-rank="37">
+  <div class="poster"><a href="https://video.twimg.com/ext_tw_video/1711305466502891531/pu/vid/avc1/720x1280/jDY-8kXWbCGYWJtA.mp4?tag=12" target="_blank" rel="noopener"><img src="https://pbs.twimg.com/ext_tw_video_thumb/1711305466502891531/pu/img/tnBBSGQkDP3F.jpg" loading="lazy" alt=""></a></div>
+  <div class="meta"><span class="rank">37</span><span class="count">80412 views</span></div>
+  <div class="saisei"><a href="https://video.twimg.com/ext_tw_video/1711305466502891531/pu/vid/avc1/360x640/jDY-8kXWbCGYWJtA.mp4?tag=12">SD</a></div>
+  <div class="tweet"><a href="https://x.com/sora_zwym/status/1804695463450799104" target="_blank">たすし白ちめふわゆも白さなむろなひ面ゆめそつふひ</a></div>
+</div>
+<div class="item" data-rank="38">
+  <div class="poster"><a href="https://video.twimg.com/amplify_video/1796708596456236327/vid/avc1/1280x720/wiKYEZPXuDIpGXfG.mp4?tag=12" target="_blank" rel="noopener"><img src="https://pbs.twimg.com/amplify_video_thumb/1796708596456236327/img/dLcl8Fomh8KT.jpg" loading="lazy" alt=""></a></div>
+  <div class="meta"><span class="rank">38</span><span class="count">49117 views</span></div>
+  <div class="saisei"><a href="https://video.twimg.com/amplify_video/1796708596456236327/vid/avc1/640x720/wiKYEZPXuDIpGXfG.mp4?tag=12">SD</a></div>
+  <div class="tweet"><a href="https://x.com/yuki_urds/status/1815889346169956693" target="_blank">みつなかぬたそ動いちたかはにろ動りす白へるおこいし犬今あとゆ</a></div>
+</div>
+<div class="item" data-rank="39">
+  <div class="poster"><a href="https://video.twimg.com/ext_tw_video/1718775525136625976/pu/vid/avc1/1280x720/qc2-pY0_7dtoj_Mo.mp4?tag=12" target="_blank" rel="noopener"><img src="https://pbs.twimg.com/ext_tw_video_thumb/1718775525136625976/pu/img/hDQzrLDjYuI4.jpg" loading="lazy" alt=""></a></div>
+  <div class="meta"><span class="rank">39</span><span class="count">54249 views</span></div>
+  <div class="saisei"><a href="https://video.twimg.com/ext_tw_video/1718775525136625976/pu/vid/avc1/640x720/qc2-pY0_7dtoj_Mo.mp4?tag=12">SD</a></div>
+  <div class="tweet"><a href="https://x.com/mio_ud/status/1714546613400569805" target="_blank">な白ほ動をき犬まろまくるてそに白みほおりあしきわいえいすんほひくぬめらわせふ</a></div>
+</div>
+<div class="item" data-rank="40">
+  <div class="poster"><a href="https://video.twimg.com/amplify_video/1811735661922170251/vid/avc1/480x852/P7VXSpsD1J1SJmh-.mp4?tag=14" target="_blank" rel="noopener"><img src="https://pbs.twimg.com/amplify_video_thumb/1811735661922170251/img/Wz2rjmZ6S4Bg.jpg" loading="lazy" alt=""></a></div>
+  <div class="meta"><span class="rank">40</span><span class="count">81912 views</span></div>
+  <div class="saisei"><a href="https://video.twimg.com/amplify_video/1811735661922170251/vid/avc1/480x480/P7VXSpsD1J1SJmh-.mp4?tag=14">SD</a></div>
+  <div class="tweet"><a href="https://x.com/yuki_akvy6/status/1714958511206769100" target="_blank">ねをまもし日面ふせるまのまんし面らいしえほきえいら犬画るけ画</a></div>
+</div>
+<div class="item" data-rank="41">
+  <div class="poster"><a href="https://video.twimg.com/amplify_video/1717493330669058241/vid/avc1/720x720/Xo7A8qkXJ51pAiN7.mp4?tag=16" target="_blank" rel="noopener"><img src="https://pbs.twimg.com/amplify_video_thumb/1717493330669058241/img/bN1KmHOPkxmF.jpg" loading="lazy" alt=""></a></div>
+  <div class="meta"><span class="rank">41</span><span class="count">79033 views</span></div>
+  <div class="saisei"><a href="https://video.twimg.com/amplify_video/1717493330669058241/vid/avc1/360x720/Xo7A8qkXJ51pAiN7.mp4?tag=16">SD</a></div>
+  <div class="tweet"><a href="https://x.com/hina_q5/status/1763303911331426841" target="_blank">ち白犬しれもんたも白ほよねせろにこ面</a></div>
+</div>
+<div class="item" data-rank="42">
+  <div class="poster"><a href="https://video.twimg.com/ext_tw_video/1739065101693247599/pu/vid/avc1/720x1280/DTIFxvEH-9UnDXjZ.mp4?tag=16" target="_blank" rel="noopener"><img src="https://pbs.twimg.com/ext_tw_video_thumb/1739065101693247599/pu/img/hn25Do7T-uRI.jpg" loading="lazy" alt=""></a></div>
+  <div class="meta"><span class="rank">42</span><span class="count">65331 views</span></div>
+  <div class="saisei"><a href="https://video.twimg.com/ext_tw_video/1739065101693247599/pu/vid/avc1/360x640/DTIFxvEH-9UnDXjZ.mp4?tag=16">SD</a></div>
+  <div class="tweet"><a href="https://x.com/hina_2d80f/status/1723855168557456592" target="_blank">まはわはも白わすわによ白日あぬつのる日ゆし白そいいんそれこめしせめかこちねくちせて白かきむいにへる</a></div>
+</div>
+<div class="item" data-rank="43">
+  <div class="poster"><a href="https://video.twimg.com/amplify_video/1769657651228997825/vid/avc1/720x720/fbIeVmjde8WMxoqa.mp4?tag=14" target="_blank" rel="noopener"><img src="https://pbs.twimg.com/amplify_video_thumb/1769657651228997825/img/21dUyIrQHuUC.jpg" loading="lazy" alt=""></a></div>
+  <div class="meta"><span class="rank">43</span><span class="count">17661 views</span></div>
+  <div class="saisei"><a href="https://video.twimg.com/amplify_video/1769657651228997825/vid/avc1/360x720/fbIeVmjde8WMxoqa.mp4?tag=14">SD</a></div>
+  <div class="tweet"><a href="https://x.com/sora_xq36r/status/1733044479936027334" target="_blank">こ猫も動てねははけんへ今てこいた白やわふりい動そさ犬れかよにはい動さむむみく動ゆ今ほせもあ画しえせか白な面</a></div>
+</div>
+<div class="item" data-rank="44">
+  <div class="poster"><a href="https://video.twimg.com/ext_tw_video/1786497516040682870/pu/vid/avc1/1280x720/hhE88KLASppRVK2G.mp4?tag=12" target="_blank" rel="noopener"><img src="https://pbs.twimg.com/ext_tw_video_thumb/1786497516040682870/pu/img/btTAoduz5XZf.jpg" loading="lazy" alt=""></a></div>
+  <div class="meta"><span class="rank">44</span><span class="count">16900 views</span></div>
+  <div class="saisei"><a href="https://video.twimg.com/ext_tw_video/1786497516040682870/pu/vid/avc1/640x720/hhE88KLASppRVK2G.mp4?tag=12">SD</a></div>
+  <div class="tweet"><a href="https://x.com/haru_grfq53/status/1759959669283652624" target="_blank">犬おす今けんえせま白いすをすうくんつはほゆ</a></div>
+</div>
+<div class="item" data-rank="45">
+  <div class="poster"><a href="https://video.twimg.com/ext_tw_video/1776522351577233673/pu/vid/avc1/1280x720/ExypWblKn0itNVC2.mp4?tag=14" target="_blank" rel="noopener"><img src="https://pbs.twimg.com/ext_tw_video_thumb/1776522351577233673/pu/img/Me4crRoStEaZ.jpg" loading="lazy" alt=""></a></div>
+  <div class="meta"><span class="rank">45</span><span class="count">28888 views</span></div>
+  <div class="saisei"><a href="https://video.twimg.com/ext_tw_video/1776522351577233673/pu/vid/avc1/640x720/ExypWblKn0itNVC2.mp4?tag=14">SD</a></div>
+  <div class="tweet"><a href="https://x.com/nana_h15c/status/1754009652260985072" target="_blank">しかきみひすい日あちほ日といへを</a></div>
+</div>
+<div class="item" data-rank="46">
+  <div class="poster"><a href="https://video.twimg.com/amplify_video/1723538092348446977/vid/avc1/720x720/nKn9uw2znSZ-tCMQ.mp4?tag=12" target="_blank" rel="noopener"><img src="https://pbs.twimg.com/amplify_video_thumb/1723538092348446977/img/AR5gKXgoGdtK.jpg" loading="lazy" alt=""></a></div>
+  <div class="meta"><span class="rank">46</span><span class="count">79763 views</span></div>
+  <div class="saisei"><a href="https://video.twimg.com/amplify_video/1723538092348446977/vid/avc1/360x720/nKn9uw2znSZ-tCMQ.mp4?tag=12">SD</a></div>
+  <div class="tweet"><a href="https://x.com/ren_tcrdj/status/1772653349056658109" target="_blank">白りえすねい日面けろな白猫ぬあも</a></div>
+</div>
+<div class="item" data-rank="47">
+  <div class="poster"><a href="https://video.twimg.com/amplify_video/1843326463528928192/vid/avc1/1280x720/RakBq8c9Ksc-hv8z.mp4?tag=12" target="_blank" rel="noopener"><img src="https://pbs.twimg.com/amplify_video_thumb/1843326463528928192/img/PlI_fKP12cgz.jpg" loading="lazy" alt=""></a></div>
+  <div class="meta"><span class="rank">47</span><span class="count">82426 views</span></div>
+  <div class="saisei"><a href="https://video.twimg.com/amplify_video/1843326463528928192/vid/avc1/640x720/RakBq8c9Ksc-hv8z.mp4?tag=12">SD</a></div>
+  <div class="tweet"><a href="https://x.com/kaito_nqogno/status/1783118753945845860" target="_blank">んはは白ろ面あつそりおすまあおさは</a></div>
+</div>
+<div class="item" data-rank="48">
+  <div class="poster"><a href="https://video.twimg.com/ext_tw_video/1710572482982544293/pu/vid/avc1/480x852/4OI-lfWVMyL4tFzn.mp4?tag=12" target="_blank" rel="noopener"><img src="https://pbs.twimg.com/ext_tw_video_thumb/1710572482982544293/pu/img/SaZqxedAd7hg.jpg" loading="lazy" alt=""></a></div>
+  <div class="meta"><span class="rank">48</span><span class="count">80210 views</span></div>
+  <div class="saisei"><a href="https://video.twimg.com/ext_tw_video/1710572482982544293/pu/vid/avc1/480x480/4OI-lfWVMyL4tFzn.mp4?tag=12">SD</a></div>
+  <div class="tweet"><a href="https://x.com/kaito_xobqjj/status/1813508913431946422" target="_blank">う面ふをおりひみをてれのいさ動ついくせほふて</a></div>
+</div>
+<div class="item" data-rank="49">
+  <div class="poster"><a href="https://video.twimg.com/amplify_video/1793457840890233811/vid/avc1/480x852/7NwQf0n4DnUund0f.mp4?tag=12" target="_blank" rel="noopener"><img src="https://pbs.twimg.com/amplify_video_thumb/1793457840890233811/img/-X1c0Z0H654w.jpg" loading="lazy" alt=""></a></div>
+  <div class="meta"><span class="rank">49</span><span class="count">55948 views</span></div>
+  <div class="saisei"><a href="https://video.twimg.com/amplify_video/1793457840890233811/vid/avc1/480x480/7NwQf0n4DnUund0f.mp4?tag=12">SD</a></div>
+  <div class="tweet"><a href="https://x.com/haru_6uwak/status/1826547832661769313" target="_blank">ぬまきれけゆくお白ませかこ動ろをのゆすろさとらにねゆけあし白いうお猫今るまこよとほい猫むなぬな犬ろお猫すも日面りい犬む</a></div>
+</div>
+<div class="item" data-rank="50">
+  <div class="poster"><a href="https://video.twimg.com/amplify_video/1764580446784226646/vid/avc1/720x720/JdXQ5VNmrlUHaebN.mp4?tag=14" target="_blank" rel="noopener"><img src="https://pbs.twimg.com/amplify_video_thumb/1764580446784226646/img/tyPQfpPg3jsp.jpg" loading="lazy" alt=""></a></div>
+  <div class="meta"><span class="rank">50</span><span class="count">67238 views</span></div>
+  <div class="saisei"><a href="https://video.twimg.com/amplify_video/1764580446784226646/vid/avc1/360x720/JdXQ5VNmrlUHaebN.mp4?tag=14">SD</a></div>
+  <div class="tweet"><a href="https://x.com/ren_nux/status/1782110104352645912" target="_blank">はめすぬるくたいぬ今今ぬとの動さひまなお動犬によ今よるつ猫てひゆあせ日まむめなよもなきにみえひ今きひ</a></div>
+</div>
+<div class="item" data-rank="51">
+  <div class="poster"><a href="https://video.twimg.com/ext_tw_video/1741250136444508084/pu/vid/avc1/720x1280/iyxT35mU40mr8KQq.mp4?tag=16" target="_blank" rel="noopener"><img src="https://pbs.twimg.com/ext_tw_video_thumb/1741250136444508084/pu/img/O0FEcEl4qnGx.jpg" loading="lazy" alt=""></a></div>
+  <div class="meta"><span class="rank">51</span><span class="count">25598 views</span></div>
+  <div class="saisei"><a href="https://video.twimg.com/ext_tw_video/1741250136444508084/pu/vid/avc1/360x640/iyxT35mU40mr8KQq.mp4?tag=16">SD</a></div>
+  <div class="tweet"><a href="https://x.com/yuki_5wh/status/1748564682651861313" target="_blank">ゆままさしぬよらりけ</a></div>
+</div>
+<div class="item" data-rank="52">
+  <div class="poster"><a href="https://video.twimg.com/ext_tw_video/1788203273552735738/pu/vid/avc1/720x720/M6NFvbAlXWsxUgj5.mp4?tag=21" target="_blank" rel="noopener"><img src="https://pbs.twimg.com/ext_tw_video_thumb/1788203273552735738/pu/img/nNzLnTV2tgwb.jpg" loading="lazy" alt=""></a></div>
+  <div class="meta"><span class="rank">52</span><span class="count">8298 views</span></div>
+  <div class="saisei"><a href="https://video.twimg.com/ext_tw_video/1788203273552735738/pu/vid/avc1/360x720/M6NFvbAlXWsxUgj5.mp4?tag=21">SD</a></div>
+  <div class="tweet"><a href="https://x.com/sora_dk/status/1712100488869969242" target="_blank">もたむしく日きせけぬとすんぬいませこみそ日こり画とうけそけせひいよな</a></div>
+</div>
+<div class="item" data-rank="53">
+  <div class="poster"><a href="https://video.twimg.com/ext_tw_video/1747380500495293607/pu/vid/avc1/480x852/KoYDl7y11jLzqbvo.mp4?tag=12" target="_blank" rel="noopener"><img src="https://pbs.twimg.com/ext_tw_video_thumb/1747380500495293607/pu/img/xCC1x-xJUfeC.jpg" loading="lazy" alt=""></a></div>
+  <div class="meta"><span class="rank">53</span><span class="count">10860 views</span></div>
+  <div class="saisei"><a href="https://video.twimg.com/ext_tw_video/1747380500495293607/pu/vid/avc1/480x480/KoYDl7y11jLzqbvo.mp4?tag=12">SD</a></div>
+  <div class="tweet"><a href="https://x.com/aoi_4wzb/status/1829845973239865895" target="_blank">日にめてたとへほさよぬらゆりつけかそとゆすふみねへひに動</a></div>
+</div>
+<div class="item" data-rank="54">
+  <div class="poster"><a href="https://video.twimg.com/ext_tw_video/1778477618549847736/pu/vid/avc1/480x852/BI8qTC8IwdP4ZXe5.mp4?tag=12" target="_blank" rel="noopener"><img src="https://pbs.twimg.com/ext_tw_video_thumb/1778477618549847736/pu/img/ISXmWXpt27tw.jpg" loading="lazy" alt=""></a></div>
+  <div class="meta"><span class="rank">54</span><span class="count">76175 views</span></div>
+  <div class="saisei"><a href="https://video.twimg.com/ext_tw_video/1778477618549847736/pu/vid/avc1/480x480/BI8qTC8IwdP4ZXe5.mp4?tag=12">SD</a></div>
+  <div class="tweet"><a href="https://x.com/riku_3l/status/1752234233420142360" target="_blank">くゆこいぬ猫いむあいたりすせさたへはきをたのほて猫うこあきりくるみてろせちらさふ猫にさる白画せそしのねつゆ犬</a></div>
+</div>
+<div class="item" data-rank="55">
+  <div class="poster"><a href="https://video.twimg.com/ext_tw_video/1712320461860319890/pu/vid/avc1/1280x720/hWuhfJbtmEpO0-H1.mp4?tag=21" target="_blank" rel="noopener"><img src="https://pbs.twimg.com/ext_tw_video_thumb/1712320461860319890/pu/img/obK9H8PcMN0l.jpg" loading="lazy" alt=""></a></div>
+  <div class="meta"><span class="rank">55</span><span class="count">82813 views</span></div>
+  <div class="saisei"><a href="https://video.twimg.com/ext_tw_video/1712320461860319890/pu/vid/avc1/640x720/hWuhfJbtmEpO0-H1.mp4?tag=21">SD</a></div>
+  <div class="tweet"><a href="https://x.com/hina_99q5q/status/1803397847012842452" target="_blank">むち猫ゆうしそよらちみ日ゆ猫つねをてつちる動ふなやにを</a></div>
+</div>
+<div class="item" data-rank="56">
+  <div class="poster"><a href="https://video.twimg.com/ext_tw_video/1719809404805394193/pu/vid/avc1/480x852/HP4MAzP_ds6mcbPT.mp4?tag=16" target="_blank" rel="noopener"><img src="https://pbs.twimg.com/ext_tw_video_thumb/1719809404805394193/pu/img/6myIfuzdrAMk.jpg" loading="lazy" alt=""></a></div>
+  <div class="meta"><span class="rank">56</span><span class="count">89498 views</span></div>
+  <div class="saisei"><a href="https://video.twimg.com/ext_tw_video/1719809404805394193/pu/vid/avc1/480x480/HP4MAzP_ds6mcbPT.mp4?tag=16">SD</a></div>
+  <div class="tweet"><a href="https://x.com/mio_jxupg16/status/1746402748443408300" target="_blank">けしたおろあたおろすうゆなよろぬけせとこいめろ犬犬らおすきするれうたさいたゆなはくもかめちろろえお</a></div>
+</div>
+<div class="item" data-rank="57">
+  <div class="poster"><a href="https://video.twimg.com/amplify_video/1718258367638004278/vid/avc1/1280x720/2mLNKrn09UKc0x4G.mp4?tag=14" target="_blank" rel="noopener"><img src="https://pbs.twimg.com/amplify_video_thumb/1718258367638004278/img/ivMzTZ7CJM98.jpg" loading="lazy" alt=""></a></div>
+  <div class="meta"><span class="rank">57</span><span class="count">88293 views</span></div>
+  <div class="saisei"><a href="https://video.twimg.com/amplify_video/1718258367638004278/vid/avc1/640x720/2mLNKrn09UKc0x4G.mp4?tag=14">SD</a></div>
+  <div class="tweet"><a href="https://x.com/yuki_39y5c/status/1806496123218084818" target="_blank">えむせくすえへへち白あむ日いふ</a></div>
+</div>
+<div class="item" data-rank="58">
+  <div class="poster"><a href="https://video.twimg.com/ext_tw_video/1835054736610036106/pu/vid/avc1/720x720/wH4TKWcYOuRkzwn-.mp4?tag=12" target="_blank" rel="noopener"><img src="https://pbs.twimg.com/ext_tw_video_thumb/1835054736610036106/pu/img/_OeUXVn1JlsB.jpg" loading="lazy" alt=""></a></div>
+  <div class="meta"><span class="rank">58</span><span class="count">52343 views</span></div>
+  <div class="saisei"><a href="https://video.twimg.com/ext_tw_video/1835054736610036106/pu/vid/avc1/360x720/wH4TKWcYOuRkzwn-.mp4?tag=12">SD</a></div>
+  <div class="tweet"><a href="https://x.com/aoi_306tx6c/status/1822454064936375317" target="_blank">みにしむかなわたか画めひ動猫ゆすねめう</a></div>
+</div>
+<div class="item" data-rank="59">
+  <div class="poster"><a href="https://video.twimg.com/amplify_video/1744618569412064337/vid/avc1/720x720/DkOSKmo33GJBW-bp.mp4?tag=12" target="_blank" rel="noopener"><img src="https://pbs.twimg.com/amplify_video_thumb/1744618569412064337/img/_6kAZN6Dn3QI.jpg" loading="lazy" alt=""></a></div>
+  <div class="meta"><span class="rank">59</span><span class="count">10690 views</span></div>
+  <div class="saisei"><a href="https://video.twimg.com/amplify_video/1744618569412064337/vid/avc1/360x720/DkOSKmo33GJBW-bp.mp4?tag=12">SD</a></div>
+  <div class="tweet"><a href="https://x.com/ren_nhjl3ev/status/1754574515525284572" target="_blank">れりせ動ちかけきむそ面せにとろり動そいに</a></div>
+</div>
+<div class="item" data-rank="60">
+  <div class="poster"><a href="https://video.twimg.com/ext_tw_video/1783214704621679888/pu/vid/avc1/1280x720/OsyL002WneOOJqbt.mp4?tag=14" target="_blank" rel="noopener"><img src="https://pbs.twimg.com/ext_tw_video_thumb/1783214704621679888/pu/img/fyrU-d-Jhzzx.jpg" loading="lazy" alt=""></a></div>
+  <div class="meta"><span class="rank">60</span><span class="count">37577 views</span></div>
+  <div class="saisei"><a href="https://video.twimg.com/ext_tw_video/1783214704621679888/pu/vid/avc1/640x720/OsyL002WneOOJqbt.mp4?tag=14">SD</a></div>
+  <div class="tweet"><a href="https://x.com/mio_q3v/status/1722984741132242021" target="_blank">ひすとも白ゆみふしうめいおさつ猫まほ日くすう面</a></div>
+</div>
+<div class="item" data-rank="61">
+  <div class="poster"><a href="https://video.twimg.com/ext_tw_video/1832641830607815416/pu/vid/avc1/480x852/j4-HS5eox7UMQ32e.mp4?tag=16" target="_blank" rel="noopener"><img src="https://pbs.twimg.com/ext_tw_video_thumb/1832641830607815416/pu/img/bzzjfLd262MK.jpg" loading="lazy" alt=""></a></div>
+  <div class="meta"><span class="rank">61</span><span class="count">22670 views</span></div>
+  <div class="saisei"><a href="https://video.twimg.com/ext_tw_video/1832641830607815416/pu/vid/avc1/480x480/j4-HS5eox7UMQ32e.mp4?tag=16">SD</a></div>
+  <div class="tweet"><a href="https://x.com/kaito_3otgy/status/1847838229222882827" target="_blank">白をしろろやよるん面とあ犬ろ犬動きこねけ今ねさ白犬かとによ白さねへ白をふやねいく</a></div>
+</div>
+<div class="item" data-rank="62">
+  <div class="poster"><a href="https://video.twimg.com/ext_tw_video/1843449435981164892/pu/vid/avc1/720x720/iNz_0KDFUd0naZyd.mp4?tag=12" target="_blank" rel="noopener"><img src="https://pbs.twimg.com/ext_tw_video_thumb/1843449435981164892/pu/img/_gnqZ-0MEEwp.jpg" loading="lazy" alt=""></a></div>
+  <div class="meta"><span class="rank">62</span><span class="count">27070 views</span></div>
+  <div class="saisei"><a href="https://video.twimg.com/ext_tw_video/1843449435981164892/pu/vid/avc1/360x720/iNz_0KDFUd0naZyd.mp4?tag=12">SD</a></div>
+  <div class="tweet"><a href="https://x.com/ren_v0b8/status/1787537943696560443" target="_blank">つををき動らくた日わしろわうめる犬らにいぬんみ</a></div>
+</div>
+<div class="item" data-rank="63">
+  <div class="poster"><a href="https://video.twimg.com/ext_tw_video/1738952312746290686/pu/vid/avc1/720x1280/dtAk99VNMhsuqwB_.mp4?tag=21" target="_blank" rel="noopener"><img src="https://pbs.twimg.com/ext_tw_video_thumb/1738952312746290686/pu/img/QkatQIJgmjLN.jpg" loading="lazy" alt=""></a></div>
+  <div class="meta"><span class="rank">63</span><span class="count">88956 views</span></div>
+  <div class="saisei"><a href="https://video.twimg.com/ext_tw_video/1738952312746290686/pu/vid/avc1/360x640/dtAk99VNMhsuqwB_.mp4?tag=21">SD</a></div>
+  <div class="tweet"><a href="https://x.com/hina_j4/status/1821069240836517992" target="_blank">おてくよややむぬすつんかめすやませせたも白ろうみみうにゆこちしたぬたぬろ白動くねいはゆうろしつ</a></div>
+</div>
+<div class="item" data-rank="64">
+  <div class="poster"><a href="https://video.twimg.com/ext_tw_video/1773925228960428570/pu/vid/avc1/720x1280/EMkTGXaXvc5yJ0nx.mp4?tag=12" target="_blank" rel="noopener"><img src="https://pbs.twimg.com/ext_tw_video_thumb/1773925228960428570/pu/img/691Z4dFjjSUQ.jpg" loading="lazy" alt=""></a></div>
+  <div class="meta"><span class="rank">64</span><span class="count">22477 views</span></div>
+  <div class="saisei"><a href="https://video.twimg.com/ext_tw_video/1773925228960428570/pu/vid/avc1/360x640/EMkTGXaXvc5yJ0nx.mp4?tag=12">SD</a></div>
+  <div class="tweet"><a href="https://x.com/mio_oq5/status/1804509775912104243" target="_blank">んこん猫いさたな猫ろねね日うひせをふ白ぬをんすのもしほは今あう猫わえいの犬ゆいさ</a></div>
+</div>
+<div class="item" data-rank="65">
+  <div class="poster"><a href="https://video.twimg.com/ext_tw_video/1787688232841652188/pu/vid/avc1/720x720/zCb9t1sa2zPuxJOv.mp4?tag=12" target="_blank" rel="noopener"><img src="https://pbs.twimg.com/ext_tw_video_thumb/1787688232841652188/pu/img/fGIj8SaKki-r.jpg" loading="lazy" alt=""></a></div>
+  <div class="meta"><span class="rank">65</span><span class="count">85890 views</span></div>
+  <div class="saisei"><a href="https://video.twimg.com/ext_tw_video/1787688232841652188/pu/vid/avc1/360x720/zCb9t1sa2zPuxJOv.mp4?tag=12">SD</a></div>
+  <div class="tweet"><a href="https://x.com/ren_etvw8/status/1777663252433106871" target="_blank">んほちふもふし今今とはたち今ちななぬふわうさのさあけあつもふさいねさいかさよ</a></div>
+</div>
+<div class="item" data-rank="66">
+  <div class="poster"><a href="https://video.twimg.com/ext_tw_video/1709505810348249254/pu/vid/avc1/720x720/QaKXrpzQVtggTCna.mp4?tag=14" target="_blank" rel="noopener"><img src="https://pbs.twimg.com/ext_tw_video_thumb/1709505810348249254/pu/img/vqwyfV3DOYzG.jpg" loading="lazy" alt=""></a></div>
+  <div class="meta"><span class="rank">66</span><span class="count">10448 views</span></div>
+  <div class="saisei"><a href="https://video.twimg.com/ext_tw_video/1709505810348249254/pu/vid/avc1/360x720/QaKXrpzQVtggTCna.mp4?tag=14">SD</a></div>
+  <div class="tweet"><a href="https://x.com/aoi_yljuz/status/1840917602888155225" target="_blank">せふ画らあれすりちひきこ日れほそみへ今たれくのそゆえけゆちよちあわつ今ふゆんさへひらい</a></div>
+</div>
+<div class="item" data-rank="67">
+  <div class="poster"><a href="https://video.twimg.com/ext_tw_video/1736151009644454960/pu/vid/avc1/480x852/UxWh58DJAnm524OJ.mp4?tag=16" target="_blank" rel="noopener"><img src="https://pbs.twimg.com/ext_tw_video_thumb/1736151009644454960/pu/img/lfrQ-Q3lNbWf.jpg" loading="lazy" alt=""></a></div>
+  <div class="meta"><span class="rank">67</span><span class="count">84586 views</span></div>
+  <div class="saisei"><a href="https://video.twimg.com/ext_tw_video/1736151009644454960/pu/vid/avc1/480x480/UxWh58DJAnm524OJ.mp4?tag=16">SD</a></div>
+  <div class="tweet"><a href="https://x.com/ren_0zra7zf/status/1723879158828360968" target="_blank">てんすせゆうつきまな</a></div>
+</div>
+<div class="item" data-rank="68">
+  <div class="poster"><a href="https://video.twimg.com/amplify_video/1783246272200210513/vid/avc1/480x852/P0X4EUPq3ZQHBPz3.mp4?tag=12" target="_blank" rel="noopener"><img src="https://pbs.twimg.com/amplify_video_thumb/1783246272200210513/img/Tuhry8wpsZaZ.jpg" loading="lazy" alt=""></a></div>
+  <div class="meta"><span class="rank">68</span><span class="count">38788 views</span></div>
+  <div class="saisei"><a href="https://video.twimg.com/amplify_video/1783246272200210513/vid/avc1/480x480/P0X4EUPq3ZQHBPz3.mp4?tag=12">SD</a></div>
+  <div class="tweet"><a href="https://x.com/yuki_l50x/status/1784280822663677088" target="_blank">にわぬあやま動ぬり今んんさ画日はま画ぬをい白ちたせけらんさうへりこうるんつたへお</a></div>
+</div>
+<div class="item" data-rank="69">
+  <div class="poster"><a href="https://video.twimg.com/ext_tw_video/1849437620398055064/pu/vid/avc1/720x720/tgV8WDv0E1NRjTR6.mp4?tag=12" target="_blank" rel="noopener"><img src="https://pbs.twimg.com/ext_tw_video_thumb/1849437620398055064/pu/img/YtUBUHOlR5Z-.jpg" loading="lazy" alt=""></a></div>
+  <div class="meta"><span class="rank">69</span><span class="count">53171 views</span></div>
+  <div class="saisei"><a href="https://video.twimg.com/ext_tw_video/1849437620398055064/pu/vid/avc1/360x720/tgV8WDv0E1NRjTR6.mp4?tag=12">SD</a></div>
+  <div class="tweet"><a href="https://x.com/mio_shj/status/1793412903447431612" target="_blank">もし犬ひも今といやも白せゆ日へよしにむきくろくなろ猫はめ面き白ね猫もたお白さ</a></div>
+</div>
+<div class="item" data-rank="70">
+  <div class="poster"><a href="https://video.twimg.com/ext_tw_video/1737237688437898125/pu/vid/avc1/1280x720/V8FxYznugZNB1nxW.mp4?tag=21" target="_blank" rel="noopener"><img src="https://pbs.twimg.com/ext_tw_video_thumb/1737237688437898125/pu/img/eu-1fN2WNhM6.jpg" loading="lazy" alt=""></a></div>
+  <div class="meta"><span class="rank">70</span><span class="count">51985 views</span></div>
+  <div class="saisei"><a href="https://video.twimg.com/ext_tw_video/1737237688437898125/pu/vid/avc1/640x720/V8FxYznugZNB1nxW.mp4?tag=21">SD</a></div>
+  <div class="tweet"><a href="https://x.com/hina_a4q4/status/1778376690636294772" target="_blank">はい白りめないこたろふろなふ</a></div>
+</div>
+<div class="item" data-rank="71">
+  <div class="poster"><a href="https://video.twimg.com/ext_tw_video/1841304004364931628/pu/vid/avc1/1280x720/kcMZncUEi7LbqvCK.mp4?tag=12" target="_blank" rel="noopener"><img src="https://pbs.twimg.com/ext_tw_video_thumb/1841304004364931628/pu/img/FBcFmTzO82xM.jpg" loading="lazy" alt=""></a></div>
+  <div class="meta"><span class="rank">71</span><span class="count">26383 views</span></div>
+  <div class="saisei"><a href="https://video.twimg.com/ext_tw_video/1841304004364931628/pu/vid/avc1/640x720/kcMZncUEi7LbqvCK.mp4?tag=12">SD</a></div>
+  <div class="tweet"><a href="https://x.com/haru_esly1p/status/1849883521106391939" target="_blank">ねみいもりけつ動今いもはんうこしの動くさりみねひも</a></div>
+</div>
+<div class="item" data-rank="72">
+  <div class="poster"><a href="https://video.twimg.com/ext_tw_video/1842375862884660705/pu/vid/avc1/480x852/1hKi-BA0OkJAa_Al.mp4?tag=14" target="_blank" rel="noopener"><img src="https://pbs.twimg.com/ext_tw_video_thumb/1842375862884660705/pu/img/a0Ai6gQARMdS.jpg" loading="lazy" alt=""></a></div>
+  <div class="meta"><span class="rank">72</span><span class="count">28211 views</span></div>
+  <div class="saisei"><a href="https://video.twimg.com/ext_tw_video/1842375862884660705/pu/vid/avc1/480x480/1hKi-BA0OkJAa_Al.mp4?tag=14">SD</a></div>
+  <div class="tweet"><a href="https://x.com/hina_jc/status/1764779299234294171" target="_blank">ぬ面ひをさお動うふら動まあもはまいくわすむのせてとかかる日面い白面て面ゆきかうもせ</a></div>
+</div>
+<div class="item" data-rank="73">
+  <div class="poster"><a href="https://video.twimg.com/amplify_video/1754061171588820870/vid/avc1/480x852/xXd2J5t8wJniIhTY.mp4?tag=12" target="_blank" rel="noopener"><img src="https://pbs.twimg.com/amplify_video_thumb/1754061171588820870/img/V4q68UtmWkgQ.jpg" loading="lazy" alt=""></a></div>
+  <div class="meta"><span class="rank">73</span><span class="count">3076 views</span></div>
+  <div class="saisei"><a href="https://video.twimg.com/amplify_video/1754061171588820870/vid/avc1/480x480/xXd2J5t8wJniIhTY.mp4?tag=12">SD</a></div>
+  <div class="tweet"><a href="https://x.com/haru_zms/status/1818597640182193418" target="_blank">しえやひあふみゆうやかそめんめ犬にへえおた白まそむう動面えおとめ動むふせむすまらな</a></div>
+</div>
+<div class="item" data-rank="74">
+  <div class="poster"><a href="https://video.twimg.com/ext_tw_video/1709866650923436342/pu/vid/avc1/720x720/mlUFHJP6vrzHIdY4.mp4?tag=12" target="_blank" rel="noopener"><img src="https://pbs.twimg.com/ext_tw_video_thumb/1709866650923436342/pu/img/FXsez2JRTCRg.jpg" loading="lazy" alt=""></a></div>
+  <div class="meta"><span class="rank">74</span><span class="count">42920 views</span></div>
+  <div class="saisei"><a href="https://video.twimg.com/ext_tw_video/1709866650923436342/pu/vid/avc1/360x720/mlUFHJP6vrzHIdY4.mp4?tag=12">SD</a></div>
+  <div class="tweet"><a href="https://x.com/aoi_ozt4/status/1815324330419474084" target="_blank">日か白猫犬られはくろんよ</a></div>
+</div>
+<div class="item" data-rank="75">
+  <div class="poster"><a href="https://video.twimg.com/amplify_video/1728653889654855250/vid/avc1/1280x720/997qfTZjRN8e-Urs.mp4?tag=16" target="_blank" rel="noopener"><img src="https://pbs.twimg.com/amplify_video_thumb/1728653889654855250/img/RoGra5shuDBL.jpg" loading="lazy" alt=""></a></div>
+  <div class="meta"><span class="rank">75</span><span class="count">87810 views</span></div>
+  <div class="saisei"><a href="https://video.twimg.com/amplify_video/1728653889654855250/vid/avc1/640x720/997qfTZjRN8e-Urs.mp4?tag=16">SD</a></div>
+  <div class="tweet"><a href="https://x.com/riku_jc8/status/1701516994696583243" target="_blank">白いのほにせろ白ねめぬけつなまかえ今日日ゆはいか今するちむねあうそうせ</a></div>
+</div>
+<div class="item" data-rank="76">
+  <div class="poster"><a href="https://video.twimg.com/ext_tw_video/1756025823241530005/pu/vid/avc1/480x852/VeK_i_0BBlBevDQk.mp4?tag=21" target="_blank" rel="noopener"><img src="https://pbs.twimg.com/ext_tw_video_thumb/1756025823241530005/pu/img/RMwziK917ZLZ.jpg" loading="lazy" alt=""></a></div>
+  <div class="meta"><span class="rank">76</span><span class="count">63724 views</span></div>
+  <div class="saisei"><a href="https://video.twimg.com/ext_tw_video/1756025823241530005/pu/vid/avc1/480x480/VeK_i_0BBlBevDQk.mp4?tag=21">SD</a></div>
+  <div class="tweet"><a href="https://x.com/ren_pdpzx/status/1738477624114070415" target="_blank">しうむれそいもやくわすなえまうせきひくつともしぬぬね白らぬ</a></div>
+</div>
+<div class="item" data-rank="77">
+  <div class="poster"><a href="https://video.twimg.com/ext_tw_video/1807070435781667211/pu/vid/avc1/1280x720/TLBFVAl9Ozm-gvLn.mp4?tag=21" target="_blank" rel="noopener"><img src="https://pbs.twimg.com/ext_tw_video_thumb/1807070435781667211/pu/img/kG6n5TfYz_Az.jpg" loading="lazy" alt=""></a></div>
+  <div class="meta"><span class="rank">77</span><span class="count">73903 views</span></div>
+  <div class="saisei"><a href="https://video.twimg.com/ext_tw_video/1807070435781667211/pu/vid/avc1/640x720/TLBFVAl9Ozm-gvLn.mp4?tag=21">SD</a></div>
+  <div class="tweet"><a href="https://x.com/aoi_sddg/status/1783904839797534842" target="_blank">んひすいたわやふきろせ</a></div>
+</div>
+<div class="item" data-rank="78">
+  <div class="poster"><a href="https://video.twimg.com/amplify_video/1764162646823740712/vid/avc1/1280x720/GfBe0XAcNcf_NjEa.mp4?tag=21" target="_blank" rel="noopener"><img src="https://pbs.twimg.com/amplify_video_thumb/1764162646823740712/img/rn4-GZlmDdXY.jpg" loading="lazy" alt=""></a></div>
+  <div class="meta"><span class="rank">78</span><span class="count">39761 views</span></div>
+  <div class="saisei"><a href="https://video.twimg.com/amplify_video/1764162646823740712/vid/avc1/640x720/GfBe0XAcNcf_NjEa.mp4?tag=21">SD</a></div>
+  <div class="tweet"><a href="https://x.com/aoi_bkb/status/1819182526226969494" target="_blank">んこん猫のきんにみにおをはりえなくんをわくをすてもん猫白ろみ画こよもちや今ままうれあちあこ</a></div>
+</div>
+<div class="item" data-rank="79">
+  <div class="poster"><a href="https://video.twimg.com/amplify_video/1703427475515052470/vid/avc1/480x852/CCQX23fQEWX0dv2n.mp4?tag=12" target="_blank" rel="noopener"><img src="https://pbs.twimg.com/amplify_video_thumb/1703427475515052470/img/RrfIbGATO51H.jpg" loading="lazy" alt=""></a></div>
+  <div class="meta"><span class="rank">79</span><span class="count">25453 views</span></div>
+  <div class="saisei"><a href="https://video.twimg.com/amplify_video/1703427475515052470/vid/avc1/480x480/CCQX23fQEWX0dv2n.mp4?tag=12">SD</a></div>
+  <div class="tweet"><a href="https://x.com/sora_0bf/status/1714646408071745906" target="_blank">ろ今うちたうほまてうへ</a></div>
+</div>
+<div class="item" data-rank="80">
+  <div class="poster"><a href="https://video.twimg.com/ext_tw_video/1785501390047860322/pu/vid/avc1/1280x720/iiyTmZqeI0lQdjCl.mp4?tag=12" target="_blank" rel="noopener"><img src="https://pbs.twimg.com/ext_tw_video_thumb/1785501390047860322/pu/img/avLQFhTujmKt.jpg" loading="lazy" alt=""></a></div>
+  <div class="meta"><span class="rank">80</span><span class="count">13354 views</span></div>
+  <div class="saisei"><a href="https://video.twimg.com/ext_tw_video/1785501390047860322/pu/vid/avc1/640x720/iiyTmZqeI0lQdjCl.mp4?tag=12">SD</a></div>
+  <div class="tweet"><a href="https://x.com/sora_whj/status/1834885828686936136" target="_blank">てそゆ画たも動しとえ日ほらもすらろ猫ろてええのけろろせ猫めんとおさ白とむひふぬけのはゆんきちそゆたる日えのまか</a></div>
+</div>
+<div class="item" data-rank="81">
+  <div class="poster"><a href="https://video.twimg.com/ext_tw_video/1810057123533560002/pu/vid/avc1/480x852/m07dXiimmOmxftQJ.mp4?tag=14" target="_blank" rel="noopener"><img src="https://pbs.twimg.com/ext_tw_video_thumb/1810057123533560002/pu/img/3yT4czm21ugl.jpg" loading="lazy" alt=""></a></div>
+  <div class="meta"><span class="rank">81</span><span class="count">46696 views</span></div>
+  <div class="saisei"><a href="https://video.twimg.com/ext_tw_video/1810057123533560002/pu/vid/avc1/480x480/m07dXiimmOmxftQJ.mp4?tag=14">SD</a></div>
+  <div class="tweet"><a href="https://x.com/mio_04v/status/1730752113539820670" target="_blank">ち猫く猫今さほせぬる画て今るつさいてたつひ猫をて猫ら今ろにろなあわくらさ猫か日すなな</a></div>
+</div>
+<div class="item" data-rank="82">
+  <div class="poster"><a href="https://video.twimg.com/amplify_video/1755968269290363621/vid/avc1/1280x720/blz4ZGMNHbTRSuDm.mp4?tag=14" target="_blank" rel="noopener"><img src="https://pbs.twimg.com/amplify_video_thumb/1755968269290363621/img/YPIRYvuuMEgr.jpg" loading="lazy" alt=""></a></div>
+  <div class="meta"><span class="rank">82</span><span class="count">69597 views</span></div>
+  <div class="saisei"><a href="https://video.twimg.com/amplify_video/1755968269290363621/vid/avc1/640x720/blz4ZGMNHbTRSuDm.mp4?tag=14">SD</a></div>
+  <div class="tweet"><a href="https://x.com/mio_9pd4/status/1745619446075623281" target="_blank">今めめ日にる日はとにてかにまくひやゆねおすまあふてすなて猫</a></div>
+</div>
+<div class="item" data-rank="83">
+  <div class="poster"><a href="https://video.twimg.com/amplify_video/1766770743983426015/vid/avc1/720x1280/aZEWj8_5U7qTOvsT.mp4?tag=21" target="_blank" rel="noopener"><img src="https://pbs.twimg.com/amplify_video_thumb/1766770743983426015/img/oE07Re5aWvnN.jpg" loading="lazy" alt=""></a></div>
+  <div class="meta"><span class="rank">83</span><span class="count">46309 views</span></div>
+  <div class="saisei"><a href="https://video.twimg.com/amplify_video/1766770743983426015/vid/avc1/360x640/aZEWj8_5U7qTOvsT.mp4?tag=21">SD</a></div>
+  <div class="tweet"><a href="https://x.com/hina_8ylxo2h/status/1729481247951274566" target="_blank">けの画わふなけちひをねたる日面画なみむちまこせ</a></div>
+</div>
+<div class="item" data-rank="84">
+  <div class="poster"><a href="https://video.twimg.com/ext_tw_video/1789302528281475285/pu/vid/avc1/720x720/qoO4AE_uS9UF-Us0.mp4?tag=16" target="_blank" rel="noopener"><img src="https://pbs.twimg.com/ext_tw_video_thumb/1789302528281475285/pu/img/OJxAP4tYZaHQ.jpg" loading="lazy" alt=""></a></div>
+  <div class="meta"><span class="rank">84</span><span class="count">68103 views</span></div>
+  <div class="saisei"><a href="https://video.twimg.com/ext_tw_video/1789302528281475285/pu/vid/avc1/360x720/qoO4AE_uS9UF-Us0.mp4?tag=16">SD</a></div>
+  <div class="tweet"><a href="https://x.com/yuki_wyn0/status/1811601711381791042" target="_blank">き白ちふとふひあわを猫にも今につつみひみそ今ねつふにいちめつ画白け</a></div>
+</div>
+<div class="item" data-rank="85">
+  <div class="poster"><a href="https://video.twimg.com/amplify_video/1780199227235096026/vid/avc1/720x1280/6KdirR-0S6i01G7a.mp4?tag=21" target="_blank" rel="noopener"><img src="https://pbs.twimg.com/amplify_video_thumb/1780199227235096026/img/d5PeZ-kuGtL_.jpg" loading="lazy" alt=""></a></div>
+  <div class="meta"><span class="rank">85</span><span class="count">7590 views</span></div>
+  <div class="saisei"><a href="https://video.twimg.com/amplify_video/1780199227235096026/vid/avc1/360x640/6KdirR-0S6i01G7a.mp4?tag=21">SD</a></div>
+  <div class="tweet"><a href="https://x.com/aoi_ts/status/1796328013622726423" target="_blank">ろぬ面ら猫もとつえてんもてるせいかなわさふま猫こえ白んよ猫あさせれしらしすあはなたほはわけ</a></div>
+</div>
+<div class="item" data-rank="86">
+  <div class="poster"><a href="https://video.twimg.com/amplify_video/1781766843592409586/vid/avc1/720x720/3t7jJUeGSD_jc8s7.mp4?tag=21" target="_blank" rel="noopener"><img src="https://pbs.twimg.com/amplify_video_thumb/1781766843592409586/img/gkApHNwliD1q.jpg" loading="lazy" alt=""></a></div>
+  <div class="meta"><span class="rank">86</span><span class="count">89500 views</span></div>
+  <div class="saisei"><a href="https://video.twimg.com/amplify_video/1781766843592409586/vid/avc1/360x720/3t7jJUeGSD_jc8s7.mp4?tag=21">SD</a></div>
+  <div class="tweet"><a href="https://x.com/nana_x9hehp/status/1771448194202697041" target="_blank">うやゆろそすとはけなりぬおなうかなきいらてぬのうはいあ動てきを動ねわも日ほ動もさみあしろゆ</a></div>
+</div>
+<div class="item" data-rank="87">
+  <div class="poster"><a href="https://video.twimg.com/amplify_video/1822985999894418046/vid/avc1/480x852/02qBg3zbkNKm_Zrg.mp4?tag=12" target="_blank" rel="noopener"><img src="https://pbs.twimg.com/amplify_video_thumb/1822985999894418046/img/B7OTiUJ0woZa.jpg" loading="lazy" alt=""></a></div>
+  <div class="meta"><span class="rank">87</span><span class="count">76018 views</span></div>
+  <div class="saisei"><a href="https://video.twimg.com/amplify_video/1822985999894418046/vid/avc1/480x480/02qBg3zbkNKm_Zrg.mp4?tag=12">SD</a></div>
+  <div class="tweet"><a href="https://x.com/sora_fdp/status/1720400360779983624" target="_blank">すいひるえていあふ面ほたを白う今しもせ白ふ猫むするぬい今へさたわえ面す白んゆそとふそみもいゆ</a></div>
+</div>
+<div class="item" data-rank="88">
+  <div class="poster"><a href="https://video.twimg.com/ext_tw_video/1817317569070409022/pu/vid/avc1/720x1280/Rzzxzi-jhjCbXoH7.mp4?tag=12" target="_blank" rel="noopener"><img src="https://pbs.twimg.com/ext_tw_video_thumb/1817317569070409022/pu/img/E6CcseuZAfx4.jpg" loading="lazy" alt=""></a></div>
+  <div class="meta"><span class="rank">88</span><span class="count">65535 views</span></div>
+  <div class="saisei"><a href="https://video.twimg.com/ext_tw_video/1817317569070409022/pu/vid/avc1/360x640/Rzzxzi-jhjCbXoH7.mp4?tag=12">SD</a></div>
+  <div class="tweet"><a href="https://x.com/aoi_vc5c/status/1809505864604007473" target="_blank">さ面ちふへふこれちお面れちりえかにゆあ画せも猫にそ猫日わかは日今けへち猫と猫あてそえらしよにこよみ今ひきそ動るい白日たあ</a></div>
+</div>
+<div class="item" data-rank="89">
+  <div class="poster"><a href="https://video.twimg.com/amplify_video/1717043037808458228/vid/avc1/720x720/Gw2Ehr0LziZMGdJM.mp4?tag=16" target="_blank" rel="noopener"><img src="https://pbs.twimg.com/amplify_video_thumb/1717043037808458228/img/aEWpotENuIsJ.jpg" loading="lazy" alt=""></a></div>
+  <div class="meta"><span class="rank">89</span><span class="count">32174 views</span></div>
+  <div class="saisei"><a href="https://video.twimg.com/amplify_video/1717043037808458228/vid/avc1/360x720/Gw2Ehr0LziZMGdJM.mp4?tag=16">SD</a></div>
+  <div class="tweet"><a href="https://x.com/haru_605/status/1821027963061620193" target="_blank">ん白けいおのをとのわそぬこよしん日もめり今およりのととねれねめ猫ゆ白くひねつ今せのも</a></div>
+</div>
+<div class="item" data-rank="90">
+  <div class="poster"><a href="https://video.twimg.com/ext_tw_video/1787025838760514493/pu/vid/avc1/720x1280/6rQ4I35nymyEalYR.mp4?tag=12" target="_blank" rel="noopener"><img src="https://pbs.twimg.com/ext_tw_video_thumb/1787025838760514493/pu/img/8_refS6DtYHC.jpg" loading="lazy" alt=""></a></div>
+  <div class="meta"><span class="rank">90</span><span class="count">82734 views</span></div>
+  <div class="saisei"><a href="https://video.twimg.com/ext_tw_video/1787025838760514493/pu/vid/avc1/360x640/6rQ4I35nymyEalYR.mp4?tag=12">SD</a></div>
+  <div class="tweet"><a href="https://x.com/nana_af3h/status/1749133997927303860" target="_blank">画日とそやこためてはわつ面面</a></div>
+</div>
+<div class="item" data-rank="91">
+  <div class="poster"><a href="https://video.twimg.com/amplify_video/1799757770311412317/vid/avc1/720x720/cF5FY_gwce_-Rto-.mp4?tag=12" target="_blank" rel="noopener"><img src="https://pbs.twimg.com/amplify_video_thumb/1799757770311412317/img/jfuYbZOUyUZM.jpg" loading="lazy" alt=""></a></div>
+  <div class="meta"><span class="rank">91</span><span class="count">1955 views</span></div>
+  <div class="saisei"><a href="https://video.twimg.com/amplify_video/1799757770311412317/vid/avc1/360x720/cF5FY_gwce_-Rto-.mp4?tag=12">SD</a></div>
+  <div class="tweet"><a href="https://x.com/hina_iky51/status/1750643106550207177" target="_blank">ちゆやるあけてせろ今を</a></div>
+</div>
+<div class="item" data-rank="92">
+  <div class="poster"><a href="https://video.twimg.com/amplify_video/1799717989718513465/vid/avc1/720x720/7lAon-5VyWAw-4AF.mp4?tag=12" target="_blank" rel="noopener"><img src="https://pbs.twimg.com/amplify_video_thumb/1799717989718513465/img/ShIpbwVnqwYF.jpg" loading="lazy" alt=""></a></div>
+  <div class="meta"><span class="rank">92</span><span class="count">71179 views</span></div>
+  <div class="saisei"><a href="https://video.twimg.com/amplify_video/1799717989718513465/vid/avc1/360x720/7lAon-5VyWAw-4AF.mp4?tag=12">SD</a></div>
+  <div class="tweet"><a href="https://x.com/mio_dyo25/status/1800317524280335319" target="_blank">ちいし犬犬まるこけゆきよ今ろきわさは画へうろまへとけるつ犬きへむ</a></div>
+</div>
+<div class="item" data-rank="93">
+  <div class="poster"><a href="https://video.twimg.com/amplify_video/1719257569786752399/vid/avc1/720x720/b00cyT1JGKSMhEQQ.mp4?tag=12" target="_blank" rel="noopener"><img src="https://pbs.twimg.com/amplify_video_thumb/1719257569786752399/img/UdSGVe_twiax.jpg" loading="lazy" alt=""></a></div>
+  <div class="meta"><span class="rank">93</span><span class="count">8549 views</span></div>
+  <div class="saisei"><a href="https://video.twimg.com/amplify_video/1719257569786752399/vid/avc1/360x720/b00cyT1JGKSMhEQQ.mp4?tag=12">SD</a></div>
+  <div class="tweet"><a href="https://x.com/kaito_8cd/status/1752115295467145518" target="_blank">はけろていめふいれへついろせや猫へらるちさすせいてえ動ゆ今ふ画まあ犬ちぬをを</a></div>
+</div>
+<div class="item" data-rank="94">
+  <div class="poster"><a href="https://video.twimg.com/amplify_video/1771417740625801294/vid/avc1/720x1280/D__znNyC9yEc3kv5.mp4?tag=14" target="_blank" rel="noopener"><img src="https://pbs.twimg.com/amplify_video_thumb/1771417740625801294/img/LYC9kgFhH4Lu.jpg" loading="lazy" alt=""></a></div>
+  <div class="meta"><span class="rank">94</span><span class="count">28699 views</span></div>
+  <div class="saisei"><a href="https://video.twimg.com/amplify_video/1771417740625801294/vid/avc1/360x640/D__znNyC9yEc3kv5.mp4?tag=14">SD</a></div>
+  <div class="tweet"><a href="https://x.com/kaito_1b3uds6/status/1839200739956061671" target="_blank">もけ白のえすにほちいら面いれ</a></div>
+</div>
+<div class="item" data-rank="95">
+  <div class="poster"><a href="https://video.twimg.com/ext_tw_video/1709468395248955460/pu/vid/avc1/480x852/L3--PSv--cVKVwCv.mp4?tag=16" target="_blank" rel="noopener"><img src="https://pbs.twimg.com/ext_tw_video_thumb/1709468395248955460/pu/img/s4b_G8tKuJJt.jpg" loading="lazy" alt=""></a></div>
+  <div class="meta"><span class="rank">95</span><span class="count">6707 views</span></div>
+  <div class="saisei"><a href="https://video.twimg.com/ext_tw_video/1709468395248955460/pu/vid/avc1/480x480/L3--PSv--cVKVwCv.mp4?tag=16">SD</a></div>
+  <div class="tweet"><a href="https://x.com/ren_38wox/status/1848402476496570174" target="_blank">動へめぬたしんお動猫ぬして面ちもままろ</a></div>
+</div>
+<div class="item" data-rank="96">
+  <div class="poster"><a href="https://video.twimg.com/amplify_video/1745031873780457217/vid/avc1/480x852/03A0DP6Mfpe4PObz.mp4?tag=16" target="_blank" rel="noopener"><img src="https://pbs.twimg.com/amplify_video_thumb/1745031873780457217/img/U4y7u6tIiJ-L.jpg" loading="lazy" alt=""></a></div>
+  <div class="meta"><span class="rank">96</span><span class="count">30441 views</span></div>
+  <div class="saisei"><a href="https://video.twimg.com/amplify_video/1745031873780457217/vid/avc1/480x480/03A0DP6Mfpe4PObz.mp4?tag=16">SD</a></div>
+  <div class="tweet"><a href="https://x.com/aoi_deac17/status/1771307561899051090" target="_blank">ほひやや画めむはのめあきも動まし</a></div>
+</div>
+<div class="item" data-rank="97">
+  <div class="poster"><a href="https://video.twimg.com/amplify_video/1720599554303411121/vid/avc1/1280x720/ljfWydpjQ8haQlAd.mp4?tag=14" target="_blank" rel="noopener"><img src="https://pbs.twimg.com/amplify_video_thumb/1720599554303411121/img/ICmIJS7cWKPD.jpg" loading="lazy" alt=""></a></div>
+  <div class="meta"><span class="rank">97</span><span class="count">43178 views</span></div>
+  <div class="saisei"><a href="https://video.twimg.com/amplify_video/1720599554303411121/vid/avc1/640x720/ljfWydpjQ8haQlAd.mp4?tag=14">SD</a></div>
+  <div class="tweet"><a href="https://x.com/yuki_9dam/status/1829431392042810027" target="_blank">すけそねへにめめ猫りふ面ふねてふりてまりなのはろぬ犬みなてよもねられよぬりけ日</a></div>
+</div>
+<div class="item" data-rank="98">
+  <div class="poster"><a href="https://video.twimg.com/ext_tw_video/1812907593318977680/pu/vid/avc1/1280x720/ddnviptTKoA-tAo0.mp4?tag=16" target="_blank" rel="noopener"><img src="https://pbs.twimg.com/ext_tw_video_thumb/1812907593318977680/pu/img/nFsmTDPEK23x.jpg" loading="lazy" alt=""></a></div>
+  <div class="meta"><span class="rank">98</span><span class="count">14152 views</span></div>
+  <div class="saisei"><a href="https://video.twimg.com/ext_tw_video/1812907593318977680/pu/vid/avc1/640x720/ddnviptTKoA-tAo0.mp4?tag=16">SD</a></div>
+  <div class="tweet"><a href="https://x.com/ren_gqu8/status/1734614634469715615" target="_blank">むせ画犬い面ぬや動動めお日うしさ今動つ犬わま動ろそみれまは今えこ犬うを白らをらそそ猫ねむあや猫ひき</a></div>
+</div>
+<div class="item" data-rank="99">
+  <div class="poster"><a href="https://video.twimg.com/ext_tw_video/1775858052180698427/pu/vid/avc1/720x1280/dWfhKa9kmH_oN-jN.mp4?tag=16" target="_blank" rel="noopener"><img src="https://pbs.twimg.com/ext_tw_video_thumb/1775858052180698427/pu/img/djecwAs9mPJv.jpg" loading="lazy" alt=""></a></div>
+  <div class="meta"><span class="rank">99</span><span class="count">57252 views</span></div>
+  <div class="saisei"><a href="https://video.twimg.com/ext_tw_video/1775858052180698427/pu/vid/avc1/360x640/dWfhKa9kmH_oN-jN.mp4?tag=16">SD</a></div>
+  <div class="tweet"><a href="https://x.com/aoi_a2ljm/status/1802838341691229929" target="_blank">たまち犬面動こすらひ動ゆくをよも動れ今</a></div>
+</div>
+<div class="item" data-rank="100">
+  <div class="poster"><a href="https://video.twimg.com/ext_tw_video/1842003654760165661/pu/vid/avc1/480x852/K8bdh-XVoO5yCu--.mp4?tag=21" target="_blank" rel="noopener"><img src="https://pbs.twimg.com/ext_tw_video_thumb/1842003654760165661/pu/img/XYF5o3-Jw9s6.jpg" loading="lazy" alt=""></a></div>
+  <div class="meta"><span class="rank">100</span><span class="count">69261 views</span></div>
+  <div class="saisei"><a href="https://video.twimg.com/ext_tw_video/1842003654760165661/pu/vid/avc1/480x480/K8bdh-XVoO5yCu--.mp4?tag=21">SD</a></div>
+  <div class="tweet"><a href="https://x.com/nana_3xspvb/status/1813956591404055098" target="_blank">えむわちいよらきそつき</a></div>
+</div>
+</main><footer>&copy; twidouga</footer></body></html>
@@ -0,0 +1,284 @@
+#!/usr/bin/env python3
+"""
+오프라인 벤치마크 - 실제 사이트 대신 로컬 업스트림(bench/upstream.py)에 대해 측정
+
+- extraction: fixture 본문의 추출 처리량 (MB/s, extract_videos / parse_proxitok_trending)
+- strategies: 전략(소스)별 소요 시간 (같은 프로세스, 반복마다 새 작업 디렉터리 = 콜드 캐시)
+- main: 두 크롤러의 main() 전체 소요 시간 (반복마다 새 프로세스)
+
+결과는 JSON (기본 bench/results/<commit>-<scenario>.json), --compare로 이전 결과와 비교
+
+사용법:
+    python bench/run.py --scenario degraded --iterations 3
+    python bench/run.py --compare bench/results/abc1234-healthy.json
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_DIR = os.path.dirname(BENCH_DIR)
+BIN_DIR = os.path.join(BENCH_DIR, "bin")
+RESULTS_DIR = os.path.join(BENCH_DIR, "results")
+sys.path.insert(0, REPO_DIR)
+
+from upstream import DEFAULT_HANG, DEFAULT_LATENCY, SCENARIOS, FaultPlan, Upstream, load_fixture  # noqa: E402
+
+# 추출 처리량을 잴 때 케이스마다 최소 이만큼 반복 (초)
+EXTRACT_MIN_SECONDS = 0.5
+
+# fake yt-dlp 한 번의 지연 (초)
+YTDLP_DELAY = 0.2
+
+SCRIPTS = {
+    "fetch_videos": "videos.json",
+    "fetch_tiktok": "tiktok.json",
+}
+
+
+def wire(module, upstream_url: str):
+    """크롤러 모듈의 HTTP 클라이언트 / 미러 상태를 로컬 업스트림용으로 교체 (현재 디렉터리 기준)"""
+    from http_cache import ResponseCache
+    from http_client import HttpClient
+    from mirrors import MirrorHealth
+
+    module.HTTP = HttpClient(workers=module.HTTP_WORKERS, cache=ResponseCache(),
+                             telemetry=module.TELEMETRY, upstream=upstream_url)
+    module.SCHEDULER.client = module.HTTP
+    module.MIRROR_HEALTH = MirrorHealth()
+    if hasattr(module, "yt_dlp"):
+        # yt-dlp 라이브러리는 네트워크로 나가므로 bench/bin의 CLI 스탠드인 사용
+        module.yt_dlp = None
+
+
+def child_env() -> dict:
+    env = dict(os.environ)
+    env["PATH"] = BIN_DIR + os.pathsep + env.get("PATH", "")
+    env["PYTHONPATH"] = REPO_DIR + os.pathsep + env.get("PYTHONPATH", "")
+    env["BENCH_YTDLP_DELAY"] = str(YTDLP_DELAY)
+    return env
+
+
+def summarize(samples: list) -> dict:
+    return {
+        "samples": [round(s, 4) for s in samples],
+        "median": round(statistics.median(samples), 4),
+        "min": round(min(samples), 4),
+    }
+
+
+# --- extraction ---
+
+def bench_extraction(iterations: int) -> dict:
+    import fetch_tiktok
+    import fetch_videos
+
+    flare = json.loads(load_fixture("flaresolverr_twidouga.json"))["solution"]["response"]
+    cases = {
+        "extract_videos.twidouga": (fetch_videos.extract_videos, flare),
+        "extract_videos.github": (fetch_videos.extract_videos, load_fixture("github_realtime_t.php").decode()),
+        "extract_videos.nitter_search": (fetch_videos.extract_videos, load_fixture("nitter_search.html").decode()),
+        "extract_videos.nitter_media": (fetch_videos.extract_videos, load_fixture("nitter_media.html").decode()),
+        "parse_proxitok_trending": (lambda html, _: fetch_tiktok.parse_proxitok_trending(html),
+                                    load_fixture("proxitok_trending.html").decode()),
+    }
+
+    results = {}
+    for name, (func, html) in cases.items():
+        size = len(html.encode("utf-8"))
+        rates = []
+        for _ in range(iterations):
+            loops = 0
+            started = time.perf_counter()
+            while True:
+                items = func(html, "bench")
+                loops += 1
+                elapsed = time.perf_counter() - started
+                if elapsed >= EXTRACT_MIN_SECONDS:
+                    break
+            rates.append(size * loops / elapsed / 1e6)
+        results[name] = {
+            "bytes": size,
+            "items": len(items),
+            "mb_per_s": round(max(rates), 2),
+            "mb_per_s_samples": [round(r, 2) for r in rates],
+        }
+        print(f"[EXTRACT] {name}: {max(rates):.1f} MB/s ({len(items)} items, {size:,} bytes)")
+    return results
+
+
+# --- strategies ---
+
+def strategy_cases():
+    """{이름: (모듈, 코루틴 함수)} - 두 크롤러의 소스 전부 + TikTok 생존 확인"""
+    import fetch_tiktok
+    import fetch_videos
+    from liveness import LivenessCache, verify_tiktok
+
+    def start(module, source):
+        async def run():
+            return await module.SCHEDULER.start(source)
+        return run
+
+    async def verify():
+        alive, _ = await verify_tiktok(fetch_tiktok.SCHEDULER, fetch_tiktok.CURATED_TIKTOK_VIDEOS, LivenessCache())
+        return alive
+
+    cases = {}
+    for platform, module in (("twitter", fetch_videos), ("tiktok", fetch_tiktok)):
+        for source in module.build_sources():
+            cases[f"{platform}.{source.name}"] = (module, start(module, source))
+    cases["tiktok.verify"] = (fetch_tiktok, verify)
+    return cases
+
+
+def bench_strategies(upstream_url: str, iterations: int, workroot: str) -> dict:
+    os.environ.update({k: v for k, v in child_env().items() if k in ("PATH", "BENCH_YTDLP_DELAY")})
+    samples = {}
+    items = {}
+    for i in range(iterations):
+        for name, (module, coro) in strategy_cases().items():
+            workdir = os.path.join(workroot, f"strategy-{i}-{name}")
+            os.makedirs(workdir)
+            os.chdir(workdir)
+            wire(module, upstream_url)
+            started = time.perf_counter()
+            result = asyncio.run(coro())
+            samples.setdefault(name, []).append(time.perf_counter() - started)
+            items[name] = len(result)
+            module.HTTP.close()
+
+    results = {}
+    for name, values in samples.items():
+        results[name] = dict(summarize(values), items=items[name])
+        print(f"[STRATEGY] {name}: {results[name]['median']:.2f}s ({items[name]} items)")
+    return results
+
+
+# --- main() ---
+
+def bench_main(upstream_url: str, iterations: int, workroot: str, warm: bool) -> dict:
+    results = {}
+    for script, output in SCRIPTS.items():
+        samples = []
+        count = None
+        for i in range(iterations):
+            workdir = os.path.join(workroot, f"main-{script}" + ("" if warm else f"-{i}"))
+            os.makedirs(workdir, exist_ok=True)
+            started = time.perf_counter()
+            proc = subprocess.run(
+                [sys.executable, os.path.abspath(__file__), "--child", script, "--upstream", upstream_url],
+                cwd=workdir, env=child_env(), stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
+            samples.append(time.perf_counter() - started)
+            if proc.returncode != 0:
+                print(proc.stdout.decode("utf-8", errors="replace")[-2000:])
+                raise SystemExit(f"[MAIN] {script} failed (exit {proc.returncode})")
+            with open(os.path.join(workdir, output), encoding="utf-8") as f:
+                count = json.load(f)["count"]
+        results[script] = dict(summarize(samples), count=count)
+        print(f"[MAIN] {script}: {results[script]['median']:.2f}s ({count} videos)")
+    return results
+
+
+def run_child(script: str, upstream_url: str):
+    """새 프로세스에서 크롤러 main() 한 번 실행 (bench_main이 호출)"""
+    module = __import__(script)
+    wire(module, upstream_url)
+    asyncio.run(module.main())
+
+
+# --- 결과 ---
+
+def git_revision() -> dict:
+    def git(*args):
+        return subprocess.run(["git", *args], cwd=REPO_DIR, capture_output=True, text=True).stdout.strip()
+    return {"commit": git("rev-parse", "--short", "HEAD") or "unknown",
+            "dirty": bool(git("status", "--porcelain", "--untracked-files=no"))}
+
+
+def compare(current: dict, previous: dict):
+    """같은 항목끼리 비교 (시간은 median, 추출은 MB/s)"""
+    print(f"\n=== {previous.get('commit')} -> {current.get('commit')} ===")
+    for section, metric, better in (("extraction", "mb_per_s", "higher"),
+                                    ("strategies", "median", "lower"),
+                                    ("main", "median", "lower")):
+        for name, entry in current.get(section, {}).items():
+            old = previous.get(section, {}).get(name)
+            if not old or not old.get(metric):
+                continue
+            change = entry[metric] / old[metric] - 1
+            worse = change < 0 if better == "higher" else change > 0
+            flag = " (regression)" if worse and abs(change) > 0.1 else ""
+            print(f"  {section}.{name}: {old[metric]} -> {entry[metric]} ({change:+.1%}){flag}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="크롤러 오프라인 벤치마크")
+    parser.add_argument("--scenario", choices=sorted(SCENARIOS), default="healthy")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--latency", type=float, default=DEFAULT_LATENCY, help="업스트림 응답 지연 (초)")
+    parser.add_argument("--hang", type=float, default=DEFAULT_HANG, help="timeout 모드에서 대기하는 시간 (초)")
+    parser.add_argument("--iterations", type=int, default=3)
+    parser.add_argument("--only", default="extraction,strategies,main",
+                        help="실행할 항목 (쉼표 구분: extraction, strategies, main)")
+    parser.add_argument("--warm", action="store_true", help="main() 반복 사이에 작업 디렉터리(캐시 / DB) 유지")
+    parser.add_argument("--output", help="결과 JSON 경로")
+    parser.add_argument("--compare", help="비교할 이전 결과 JSON")
+    parser.add_argument("--child", help=argparse.SUPPRESS)
+    parser.add_argument("--upstream", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        run_child(args.child, args.upstream)
+        return
+
+    only = set(args.only.split(","))
+    results = dict(git_revision(),
+                   timestamp=datetime.now(timezone.utc).isoformat(),
+                   python=platform.python_version(),
+                   platform=platform.platform(),
+                   scenario=args.scenario, seed=args.seed, latency=args.latency,
+                   iterations=args.iterations)
+
+    plan = FaultPlan(args.scenario, args.seed, args.latency, args.hang)
+    upstream = Upstream(plan)
+    upstream_url = upstream.start()
+    cwd = os.getcwd()
+    try:
+        with tempfile.TemporaryDirectory(prefix="bench-") as workroot:
+            # 크롤러 모듈은 import 시점에 현재 디렉터리에 캐시를 만들므로 작업 디렉터리에서 import
+            os.chdir(workroot)
+            if "extraction" in only:
+                results["extraction"] = bench_extraction(args.iterations)
+            if "strategies" in only:
+                results["strategies"] = bench_strategies(upstream_url, args.iterations, workroot)
+            if "main" in only:
+                results["main"] = bench_main(upstream_url, args.iterations, workroot, args.warm)
+            os.chdir(cwd)
+    finally:
+        os.chdir(cwd)
+        upstream.stop()
+    results["upstream_requests"] = dict(sorted(upstream.requests.items()))
+
+    output = args.output or os.path.join(RESULTS_DIR, f"{results['commit']}-{args.scenario}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump(results, f, ensure_ascii=False, indent=2)
+    print(f"\n[BENCH] Results written to {output}")
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            compare(results, json.load(f))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,195 @@
+"""
+로컬 업스트림 스탠드인 - 녹화된 fixture를 실제 사이트 대신 서빙 (장애 주입 가능)
+
+- HttpClient(upstream=...)가 보내는 X-Upstream-Host로 원래 호스트를 구분
+- 호스트마다 시나리오에 따라 모드를 고정 배정 (seed로 재현 가능)
+  ok: 정상 / slow: 지연 x10 / timeout: 응답하지 않고 hang초 대기 / 5xx: 503 / challenge: Cloudflare 챌린지
+- ETag + If-None-Match(304), gzip 지원
+"""
+
+import gzip
+import hashlib
+import json
+import os
+import threading
+import time
+import urllib.parse
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+
+# 시나리오별 모드 비율 (호스트마다 하나를 고정 배정)
+SCENARIOS = {
+    "healthy": {"ok": 1.0},
+    "degraded": {"ok": 0.4, "slow": 0.15, "timeout": 0.15, "5xx": 0.15, "challenge": 0.15},
+    "outage": {"timeout": 0.4, "5xx": 0.3, "challenge": 0.3},
+}
+
+# 시나리오와 상관없이 항상 정상인 호스트 (GitHub raw)
+ALWAYS_OK = ("raw.githubusercontent.com",)
+
+DEFAULT_LATENCY = 0.05
+DEFAULT_HANG = 20.0
+
+
+def load_fixture(name: str) -> bytes:
+    with open(os.path.join(FIXTURES_DIR, name), "rb") as f:
+        return f.read()
+
+
+def route(host: str, path: str):
+    """(호스트, 경로) -> fixture 이름 (없으면 None)"""
+    path = urllib.parse.urlsplit(path).path
+    if host.startswith("localhost:8191") and path == "/v1":
+        return "flaresolverr_twidouga.json"
+    if host == "raw.githubusercontent.com":
+        return "github_realtime_t.php"
+    if path.endswith("/oembed"):
+        return "tiktok_oembed.json"
+    if path == "/search":
+        return "nitter_search.html"
+    if path.endswith("/media"):
+        return "nitter_media.html"
+    if path == "/trending":
+        return "proxitok_trending.html"
+    return None
+
+
+class FaultPlan:
+    def __init__(self, scenario: str = "healthy", seed: int = 0,
+                 latency: float = DEFAULT_LATENCY, hang: float = DEFAULT_HANG):
+        self.weights = SCENARIOS[scenario]
+        self.scenario = scenario
+        self.seed = seed
+        self.latency = latency
+        self.hang = hang
+
+    def mode(self, host: str) -> str:
+        if host in ALWAYS_OK:
+            return "ok"
+        digest = hashlib.blake2b(f"{self.seed}:{host}".encode(), digest_size=8).digest()
+        point = int.from_bytes(digest, "big") / 2 ** 64
+        for mode, weight in self.weights.items():
+            point -= weight
+            if point < 0:
+                return mode
+        return "ok"
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        self._serve()
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        self.rfile.read(length)
+        self._serve()
+
+    def _serve(self):
+        upstream = self.server.upstream
+        host = self.headers.get("X-Upstream-Host") or self.headers.get("Host", "")
+        mode = upstream.plan.mode(host)
+        upstream.count(host, mode)
+
+        if mode == "timeout":
+            time.sleep(upstream.plan.hang)
+            self.close_connection = True
+            return
+        time.sleep(upstream.plan.latency * (10 if mode == "slow" else 1))
+
+        if mode == "5xx":
+            return self._send(503, b"Service Unavailable", "text/plain")
+        name = route(host, self.path)
+        if name is None:
+            return self._send(404, b"Not Found", "text/plain")
+        if mode == "challenge":
+            challenge = load_fixture("cloudflare_challenge.html")
+            if name.startswith("flaresolverr"):
+                # FlareSolverr는 200 + 챌린지 HTML을 담은 envelope를 돌려줌
+                body = json.dumps({"status": "ok", "solution": {"status": 403, "response": challenge.decode()}})
+                return self._send(200, body.encode(), "application/json")
+            return self._send(403, challenge, "text/html; charset=UTF-8")
+
+        body = load_fixture(name)
+        ctype = "application/json" if name.endswith(".json") else "text/html; charset=UTF-8"
+        self._send(200, body, ctype)
+
+    def _send(self, status: int, body: bytes, ctype: str):
+        etag = '"%s"' % hashlib.sha1(body).hexdigest()[:16]
+        if status == 200 and self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        self.send_response(status)
+        self.send_header("Content-Type", ctype)
+        if status == 200:
+            self.send_header("ETag", etag)
+        if "gzip" in (self.headers.get("Accept-Encoding") or ""):
+            body = gzip.compress(body, compresslevel=6)
+            self.send_header("Content-Encoding", "gzip")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+class Upstream:
+    """with Upstream(plan) as base_url: ... (백그라운드 스레드에서 서빙)"""
+
+    def __init__(self, plan: FaultPlan = None, port: int = 0):
+        self.plan = plan or FaultPlan()
+        self.server = ThreadingHTTPServer(("127.0.0.1", port), _Handler)
+        self.server.daemon_threads = True
+        self.server.upstream = self
+        self.requests = Counter()
+        self._lock = threading.Lock()
+        self._thread = None
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.server.server_address[1]}"
+
+    def count(self, host: str, mode: str):
+        with self._lock:
+            self.requests[f"{host} {mode}"] += 1
+
+    def start(self) -> str:
+        self._thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self._thread.start()
+        return self.url
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="fixture를 서빙하는 로컬 업스트림")
+    parser.add_argument("--port", type=int, default=8999)
+    parser.add_argument("--scenario", choices=sorted(SCENARIOS), default="healthy")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--latency", type=float, default=DEFAULT_LATENCY)
+    parser.add_argument("--hang", type=float, default=DEFAULT_HANG)
+    args = parser.parse_args()
+
+    upstream = Upstream(FaultPlan(args.scenario, args.seed, args.latency, args.hang), args.port)
+    print(f"[UPSTREAM] Serving {FIXTURES_DIR} on {upstream.url} ({args.scenario})")
+    try:
+        upstream.server.serve_forever()
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,112 @@
+"""
+영상 수집기 - 여러 소스의 결과를 중복 없이 모으는 공용 컨테이너
+
+- ID 해시 기반 중복 검사 (O(1))
+- 영상 레코드는 __slots__ 객체로 보관 (영상마다 dict를 두지 않음)
+- 소스별 quota (소스 이름의 가장 긴 접두사로 조회, 소스마다 따로 셈)
+- capacity를 주면 key 기준 상위 capacity개만 최소 힙으로 유지 (메모리 상한)
+- merge를 주면 이미 있는 ID가 다시 들어올 때 merge(기존, 새 레코드)로 합침
+"""
+
+import heapq
+import itertools
+from collections import Counter
+
+
+class Video:
+    __slots__ = ("id", "video_url", "tweet_url", "url", "title", "username", "source")
+
+    def __init__(self, **fields):
+        for name, value in fields.items():
+            setattr(self, name, value)
+
+    @classmethod
+    def from_dict(cls, data: dict):
+        return cls(**data)
+
+    def get(self, name: str, default=None):
+        return getattr(self, name, default)
+
+    def to_dict(self) -> dict:
+        """설정된 필드만 (video_url=None처럼 명시적인 None은 유지)"""
+        return {name: getattr(self, name) for name in self.__slots__ if hasattr(self, name)}
+
+
+class VideoCollector:
+    """
+    quotas: {소스 이름 접두사: 소스별 최대 수}
+    capacity / key: 상위 capacity개만 유지 (key가 클수록 우선, 같으면 먼저 들어온 것)
+    merge: 같은 ID 레코드를 합치는 함수 (기존 Video를 갱신해 반환)
+    """
+
+    def __init__(self, quotas: dict = None, capacity: int = None, key=None, merge=None):
+        self.quotas = quotas or {}
+        self.capacity = capacity
+        self.key = key
+        self.merge = merge
+        self._seen = set()
+        self._videos = {}
+        self._per_source = Counter()
+        self._heap = []
+        self._seq = itertools.count()
+
+    def _quota(self, source: str):
+        best = None
+        for prefix, limit in self.quotas.items():
+            if source.startswith(prefix) and (best is None or len(prefix) > len(best[0])):
+                best = (prefix, limit)
+        return best[1] if best else None
+
+    def add(self, video) -> bool:
+        """새 영상이면 추가하고 True"""
+        if isinstance(video, dict):
+            video = Video.from_dict(video)
+        if video.id in self._seen:
+            existing = self._videos.get(video.id)
+            if self.merge and existing is not None:
+                self._videos[video.id] = self.merge(existing, video)
+            return False
+        source = video.get("source", "unknown")
+        limit = self._quota(source)
+        if limit is not None and self._per_source[source] >= limit:
+            return False
+        self._seen.add(video.id)
+        self._per_source[source] += 1
+
+        if self.capacity is None or self.key is None:
+            self._videos[video.id] = video
+            return True
+
+        # 순번을 음수로 넣어 점수가 같으면 나중에 들어온 쪽이 먼저 밀려나게
+        entry = (self.key(video), -next(self._seq), video)
+        if len(self._heap) < self.capacity:
+            heapq.heappush(self._heap, entry)
+        else:
+            evicted = heapq.heappushpop(self._heap, entry)[2]
+            if evicted is video:
+                return False
+            del self._videos[evicted.id]
+        self._videos[video.id] = video
+        return True
+
+    def extend(self, videos) -> int:
+        return sum(self.add(v) for v in videos)
+
+    def __len__(self):
+        return len(self._videos)
+
+    def __contains__(self, video_id: str):
+        return video_id in self._videos
+
+    def __iter__(self):
+        return iter(self._videos.values())
+
+    def top(self, k: int, key=None) -> list:
+        """key 기준 상위 k개 (힙 선택, 같으면 들어온 순서)"""
+        return heapq.nlargest(k, self._videos.values(), key=key or self.key)
+
+    def sources(self) -> list:
+        return sorted({v.get("source", "unknown") for v in self})
+
+    def to_dicts(self) -> list:
+        return [v.to_dict() for v in self]
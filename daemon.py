@@ -0,0 +1,266 @@
+#!/usr/bin/env python3
+"""
+상주 모드 - 두 크롤러를 계속 실행하면서 소스마다 자기 주기로 폴링하고, 결과를 로컬 HTTP로 서빙
+
+- 커넥션 풀 / 응답 캐시 / 미러 상태를 프로세스 안에서 유지 (실행마다 콜드 스타트하지 않음)
+- 소스마다 적응형 주기: 내용(ID 집합)이 바뀌면 주기를 줄이고, 그대로거나 실패하면 늘림
+- 플랫폼마다 각 소스의 최신 결과를 합쳐 공개 (바뀐 소스가 있을 때만, 잠시 모았다가 한 번에)
+- 공개 파일(videos.json, urls.txt, tiktok.json, ...)을 ETag / gzip으로 서빙
+
+사용법:
+    python daemon.py --port 8080
+    python daemon.py --platforms tiktok
+"""
+
+import argparse
+import asyncio
+import gzip
+import hashlib
+import json
+import os
+import signal
+import threading
+import time
+import urllib.parse
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import fetch_tiktok
+import fetch_videos
+
+PLATFORMS = {
+    "twitter": fetch_videos,
+    "tiktok": fetch_tiktok,
+}
+
+SERVED_FILES = (
+    "videos.json", "videos.min.json", "videos.ndjson", "urls.txt", "delta.json",
+    "tiktok.json", "tiktok.min.json", "tiktok.ndjson", "tiktok_urls.txt", "tiktok_delta.json",
+)
+CONTENT_TYPES = {
+    ".json": "application/json",
+    ".ndjson": "application/x-ndjson",
+}
+
+# 소스별 폴링 주기 (초): 바뀌면 SPEEDUP배, 그대로거나 실패하면 SLOWDOWN배
+INITIAL_INTERVAL = 10 * 60
+MIN_INTERVAL = 2 * 60
+MAX_INTERVAL = 2 * 3600
+SPEEDUP = 0.5
+SLOWDOWN = 1.5
+
+# 바뀐 소스가 생기면 이만큼 기다렸다가 같은 플랫폼의 다른 결과와 함께 공개 (초)
+PUBLISH_DEBOUNCE = 5.0
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8080
+
+
+class SourceSchedule:
+    """소스 하나의 폴링 상태 (최신 결과 / 다음 폴링 시각)"""
+
+    def __init__(self, platform: str, source):
+        self.platform = platform
+        self.source = source
+        self.interval = INITIAL_INTERVAL
+        self.due = time.monotonic()
+        self.fingerprint = None
+        self.records = []
+
+    @property
+    def name(self) -> str:
+        return f"{self.platform}.{self.source.name}"
+
+    def update(self, records: list) -> bool:
+        """폴링 결과 반영 후 다음 주기 계산, 내용이 바뀌었으면 True (실패 / 빈 결과면 이전 결과 유지)"""
+        changed = False
+        if records:
+            ids = sorted(str(r.get("id")) for r in records)
+            fingerprint = hashlib.sha1("\n".join(ids).encode()).hexdigest()
+            changed = fingerprint != self.fingerprint
+            self.fingerprint = fingerprint
+            self.records = records
+        factor = SPEEDUP if changed else SLOWDOWN
+        self.interval = min(MAX_INTERVAL, max(MIN_INTERVAL, self.interval * factor))
+        self.due = time.monotonic() + self.interval
+        return changed
+
+
+class OutputFiles:
+    """공개 파일을 바뀔 때만 다시 읽고 ETag / gzip 본문을 함께 보관"""
+
+    def __init__(self, directory: str = "."):
+        self.directory = directory
+        self._entries = {}
+        self._lock = threading.Lock()
+
+    def get(self, name: str):
+        """(본문, gzip 본문, ETag, 수정 시각) 또는 None"""
+        path = os.path.join(self.directory, name)
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        key = (stat.st_mtime_ns, stat.st_size)
+        with self._lock:
+            entry = self._entries.get(name)
+            if entry and entry[0] == key:
+                return entry[1]
+        with open(path, "rb") as f:
+            body = f.read()
+        value = (body, gzip.compress(body, compresslevel=6),
+                 '"%s"' % hashlib.sha1(body).hexdigest()[:16], stat.st_mtime)
+        with self._lock:
+            self._entries[name] = (key, value)
+        return value
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        self._serve(send_body=True)
+
+    def do_HEAD(self):
+        self._serve(send_body=False)
+
+    def _serve(self, send_body: bool):
+        name = urllib.parse.urlsplit(self.path).path.lstrip("/")
+        if name == "":
+            body = json.dumps({"files": [f for f in SERVED_FILES if self.server.files.get(f)]}).encode()
+            return self._send(200, body, "application/json", send_body=send_body)
+        entry = self.server.files.get(name) if name in SERVED_FILES else None
+        if entry is None:
+            return self._send(404, b"Not Found", "text/plain", send_body=send_body)
+
+        body, gzipped, etag, mtime = entry
+        headers = {
+            "ETag": etag,
+            "Last-Modified": self.date_time_string(mtime),
+            "Cache-Control": "no-cache",
+            "Vary": "Accept-Encoding",
+        }
+        if etag in (self.headers.get("If-None-Match") or ""):
+            return self._send(304, b"", None, headers, send_body=False)
+        if "gzip" in (self.headers.get("Accept-Encoding") or ""):
+            body = gzipped
+            headers["Content-Encoding"] = "gzip"
+        ctype = CONTENT_TYPES.get(os.path.splitext(name)[1], "text/plain; charset=utf-8")
+        self._send(200, body, ctype, headers, send_body=send_body)
+
+    def _send(self, status: int, body: bytes, ctype: str, headers: dict = None, send_body: bool = True):
+        self.send_response(status)
+        if ctype:
+            self.send_header("Content-Type", ctype)
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        if send_body:
+            self.wfile.write(body)
+
+
+def serve(host: str, port: int, directory: str = ".") -> ThreadingHTTPServer:
+    """백그라운드 스레드에서 공개 파일 서빙 시작"""
+    server = ThreadingHTTPServer((host, port), _Handler)
+    server.daemon_threads = True
+    server.files = OutputFiles(directory)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    print(f"[DAEMON] Serving {', '.join(SERVED_FILES)} on http://{host}:{port}/")
+    return server
+
+
+class Daemon:
+    def __init__(self, platforms: list):
+        self.platforms = platforms
+        self.schedules = [SourceSchedule(platform, source)
+                          for platform in platforms
+                          for source in PLATFORMS[platform].build_sources()]
+        self.dirty = set()
+        self.changed = asyncio.Event()
+
+    async def poll(self, schedule: SourceSchedule, stop: asyncio.Event):
+        module = PLATFORMS[schedule.platform]
+        while not stop.is_set():
+            delay = schedule.due - time.monotonic()
+            if delay > 0:
+                try:
+                    await asyncio.wait_for(stop.wait(), timeout=delay)
+                    return
+                except asyncio.TimeoutError:
+                    pass
+            records = await module.SCHEDULER.start(schedule.source)
+            changed = schedule.update(records)
+            print(f"[DAEMON] {schedule.name}: {len(records)} records, "
+                  f"{'changed' if changed else 'unchanged'}, next in {schedule.interval:.0f}s")
+            if changed:
+                self.dirty.add(schedule.platform)
+                self.changed.set()
+
+    async def publish(self, platform: str):
+        """플랫폼의 모든 소스 최신 결과를 합쳐 공개"""
+        module = PLATFORMS[platform]
+        collector = module.new_collector()
+        for schedule in sorted(self.schedules, key=lambda s: -s.source.priority):
+            if schedule.platform == platform:
+                collector.extend(schedule.records)
+        output = await module.publish(collector.to_dicts())
+        print(f"[DAEMON] Published {platform}: {output['count']} videos")
+        module.MIRROR_HEALTH.save()
+        module.HTTP.cache.evict()
+        module.TELEMETRY.save(module.HTTP.stats)
+        module.TELEMETRY.reset()
+
+    async def publisher(self, stop: asyncio.Event):
+        while not stop.is_set():
+            await self.changed.wait()
+            await asyncio.sleep(PUBLISH_DEBOUNCE)
+            self.changed.clear()
+            dirty, self.dirty = self.dirty, set()
+            for platform in sorted(dirty):
+                try:
+                    await self.publish(platform)
+                except Exception as e:
+                    print(f"[DAEMON] Publishing {platform} failed: {e}")
+
+    async def run(self, stop: asyncio.Event):
+        tasks = [asyncio.create_task(self.poll(s, stop), name=s.name) for s in self.schedules]
+        tasks.append(asyncio.create_task(self.publisher(stop), name="publisher"))
+        await stop.wait()
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        for platform in self.platforms:
+            module = PLATFORMS[platform]
+            module.MIRROR_HEALTH.save()
+            module.HTTP.close()
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="크롤러 상주 모드")
+    parser.add_argument("--host", default=DEFAULT_HOST)
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--platforms", default=",".join(PLATFORMS),
+                        help="실행할 플랫폼 (쉼표 구분: twitter, tiktok)")
+    args = parser.parse_args()
+
+    server = serve(args.host, args.port)
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, stop.set)
+
+    daemon = Daemon([p for p in args.platforms.split(",") if p in PLATFORMS])
+    print(f"[DAEMON] Polling {len(daemon.schedules)} sources "
+          f"(interval {MIN_INTERVAL}s ~ {MAX_INTERVAL}s, start {INITIAL_INTERVAL}s)")
+    try:
+        await daemon.run(stop)
+    finally:
+        server.shutdown()
+        print("[DAEMON] Stopped")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,127 @@
+"""
+스트리밍 추출기 - 응답을 청크 단위로 받으면서 하나의 결합 패턴으로 한 번만 스캔
+
+- 매치 종류: twimg (video.twimg.com mp4), tweet (트윗 상태 링크), status (사용자 없는 /status/<id>),
+  tiktok (TikTok 영상 링크)
+- 소스별 quota에 도달하면 더 이상 받지 않도록 feed()가 True를 반환
+- 청크 경계에 걸친 매치는 마지막 TAIL_CHARS 글자를 다음 청크와 이어서 다시 스캔
+- 같은 ID가 다시 나오면 건너뛰되, 먼저 나온 매치에 사용자명이 없으면 채워 넣음
+  (twimg는 해상도 / tag 변형을 모두 남기도록 URL 단위로 중복 제거)
+"""
+
+import re
+from collections import namedtuple
+
+from ids import video_id
+
+COMBINED_PATTERN = re.compile(
+    r'(?P<twimg>https://video\.twimg\.com/[^"\'<>\s]+\.mp4[^"\'<>\s]*)'
+    r'|(?:twitter\.com|x\.com)/(?P<tw_user>\w+)/status/(?P<tw_id>\d+)'
+    r'|href="/(?P<nt_user>[^/"\'<>\s]+)/status/(?P<nt_id>\d+)'
+    r'|/@(?P<tt_user>[^/"\'<>\s]+)/video/(?P<tt_id>\d{18,20})'
+    r'|/video/(?P<tt_bare>\d{18,20})'
+    r'|/status/(?P<st_id>\d+)'
+)
+
+# 청크 끝에서 아직 완결되지 않았을 수 있는 매치를 위해 남겨두는 길이
+TAIL_CHARS = 1024
+
+ALL_KINDS = frozenset({"twimg", "tweet", "status", "tiktok"})
+
+# pos: 응답 본문에서의 문자 위치
+Match = namedtuple("Match", ["kind", "id", "user", "url", "pos"])
+
+
+def _to_match(m, offset: int):
+    g = m.groupdict()
+    pos = offset + m.start()
+    if g["twimg"]:
+        url = g["twimg"]
+        return Match("twimg", video_id(url), None, url, pos)
+    if g["tw_id"]:
+        return Match("tweet", g["tw_id"], g["tw_user"], None, pos)
+    if g["nt_id"]:
+        return Match("tweet", g["nt_id"], g["nt_user"], None, pos)
+    if g["tt_id"]:
+        return Match("tiktok", g["tt_id"], g["tt_user"], None, pos)
+    if g["tt_bare"]:
+        return Match("tiktok", g["tt_bare"], None, None, pos)
+    return Match("status", g["st_id"], None, None, pos)
+
+
+class StreamExtractor:
+    """
+    kinds: 수집할 매치 종류 (None이면 전부)
+    quota: 수집할 최대 매치 수 (None이면 제한 없음)
+    """
+
+    def __init__(self, kinds=None, quota: int = None):
+        self.kinds = frozenset(kinds) if kinds else ALL_KINDS
+        self.quota = quota
+        self.matches = []
+        self.streamed = False
+        self._seen = {}
+        self._buf = ""
+        self._offset = 0
+
+    @property
+    def done(self) -> bool:
+        return self.quota is not None and len(self.matches) >= self.quota
+
+    def _scan(self, final: bool):
+        buf = self._buf
+        cut = len(buf) if final else len(buf) - TAIL_CHARS
+        keep_from = 0
+        for m in COMBINED_PATTERN.finditer(buf):
+            if m.end() > cut:
+                keep_from = m.start()
+                break
+            keep_from = m.end()
+            match = _to_match(m, self._offset)
+            if match.kind not in self.kinds:
+                continue
+            # tweet / status는 같은 트윗 ID 공간, twimg는 변형마다 따로
+            if match.kind == "twimg":
+                key = ("twimg", match.url)
+            else:
+                key = ("tweet" if match.kind == "status" else match.kind, match.id)
+            index = self._seen.get(key)
+            if index is not None:
+                if match.user and not self.matches[index].user:
+                    self.matches[index] = self.matches[index]._replace(kind=match.kind, user=match.user)
+                continue
+            self._seen[key] = len(self.matches)
+            self.matches.append(match)
+            if self.done:
+                break
+        else:
+            keep_from = max(keep_from, cut, 0)
+        self._buf = buf[keep_from:]
+        self._offset += keep_from
+
+    def feed(self, text: str) -> bool:
+        """청크 추가, quota에 도달했으면 True (더 받을 필요 없음)"""
+        self.streamed = True
+        if self.done:
+            return True
+        self._buf += text
+        if len(self._buf) > TAIL_CHARS:
+            self._scan(final=False)
+        return self.done
+
+    def finish(self) -> list:
+        if not self.done:
+            self._scan(final=True)
+        self._buf = ""
+        return self.matches
+
+    def drain(self, html: str) -> list:
+        """스트리밍으로 받았으면 그 결과, 아니면 (캐시된) 전체 본문을 스캔한 결과"""
+        if not self.streamed:
+            self.feed(html)
+        return self.finish()
+
+
+def extract(html: str, kinds=None, quota: int = None) -> list:
+    """전체 본문에서 한 번에 추출"""
+    return StreamExtractor(kinds, quota).drain(html)
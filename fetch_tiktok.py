@@ -6,15 +6,85 @@ TikTok 트렌딩 영상 크롤러
 - GitHub Actions에서 안정적으로 동작
 """
 
+import argparse
 import json
-import re
-import subprocess
+import asyncio
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
-import urllib.request
 import random
 import time
 
+try:
+    import yt_dlp
+except ImportError:
+    yt_dlp = None
+
+from collector import VideoCollector
+from extractor import StreamExtractor, extract
+from http_cache import ResponseCache
+from http_client import HttpClient
+from liveness import LivenessCache, verify_tiktok
+from mirrors import MirrorHealth, race
+from output import canonical_hash, write_json, write_text
+from sources import Scheduler, Source
+from telemetry import Telemetry
+from video_store import VideoStore, write_delta
+
+# 요청별 기록 + 실행 요약
+TELEMETRY = Telemetry("tiktok_request_log.jsonl", "tiktok_run_summary.json")
+
+# 공용 HTTP 클라이언트 (keep-alive 풀 + 압축 + 조건부 요청 캐시, 동시 요청 수 상한)
+HTTP_WORKERS = 8
+HTTP = HttpClient(workers=HTTP_WORKERS, cache=ResponseCache(), telemetry=TELEMETRY)
+
+# 모든 소스의 요청에 호스트별 동시 요청 수 / 속도 제한 / 재시도 적용
+# (www.tiktok.com은 oEmbed 생존 확인 + yt-dlp가 함께 사용)
+TIKTOK_HOST = "www.tiktok.com"
+HOST_LIMITS = {TIKTOK_HOST: 16}
+HOST_RATES = {TIKTOK_HOST: (50.0, 50)}
+SCHEDULER = Scheduler(HTTP, concurrency=HTTP_WORKERS, host_limits=HOST_LIMITS, rates=HOST_RATES)
+
+# ProxiTok 트렌딩 페이지 캐시 TTL (초)
+PROXITOK_CACHE_TTL = 10 * 60
+
+# 소스별 상한 (ytdlp_tag_*는 해시태그마다 따로)
+SOURCE_QUOTAS = {
+    "proxitok_": 100,
+    "ytdlp_tag_": 30,
+}
+
+# yt-dlp 해시태그 수집 (태그별 병렬, 태그마다 제한 시간)
+TRENDING_TAGS = [
+    "fyp", "foryou", "viral", "trending", "funny", "comedy", "meme",
+    "food", "cooking", "recipe", "asmr", "satisfying",
+    "dance", "challenge", "music", "kpop",
+    "cat", "dog", "pets", "animals",
+    "fitness", "sports", "football", "basketball",
+    "travel", "nature", "art", "diy", "lifehack",
+    "gaming", "anime", "fashion", "beauty", "makeup",
+    "science", "learnontiktok",
+]
+YTDLP_PLAYLIST_END = 5
+YTDLP_TAG_TIMEOUT = 30
+YTDLP_WORKERS = 8
+
+# 공개 목록: 저장소에서 가장 최근 PUBLISH_LIMIT개
+PUBLISH_LIMIT = 200
+
+# 공개 목록 셔플 시드 (비우면 영상 ID 목록에서 만듦 → 목록이 같으면 순서도 같아 파일이 바뀌지 않음)
+SHUFFLE_SEED = os.environ.get("TIKTOK_SHUFFLE_SEED")
+
+# ProxiTok 미러 레이스 설정 (동시 요청 수 / 헤지 간격 / 전체 제한 시간)
+PROXITOK_FANOUT = 3
+PROXITOK_HEDGE_DELAY = 1.0
+PROXITOK_DEADLINE = 30.0
+
+# 미러별 상태 기록 (mirror_health.json)
+MIRROR_HEALTH = MirrorHealth()
+
+
 # =============================================================================
 # 인기 TikTok 영상 정적 목록 (검증된 바이럴/트렌딩 영상들)
 # 카테고리: 재미, 동물, 음식, 댄스, 밈 등 다양하게
@@ -81,10 +151,48 @@ CURATED_TIKTOK_VIDEOS = [
 ]
 
 
-def get_trending_from_proxitok():
-    """ProxiTok 트렌딩 페이지에서 영상 가져오기"""
+def to_tiktok_videos(matches: list) -> list:
+    """추출기 매치(tiktok)를 ProxiTok 트렌딩 레코드로"""
     videos = []
+    for m in matches:
+        if m.user:
+            videos.append({
+                "id": m.id,
+                "url": f"https://www.tiktok.com/@{m.user}/video/{m.id}",
+                "title": "",
+                "source": "proxitok_trending",
+                "username": m.user
+            })
+        else:
+            videos.append({
+                "id": m.id,
+                "url": f"https://www.tiktok.com/@a/video/{m.id}",
+                "title": "",
+                "source": "proxitok_trending"
+            })
+    return videos
+
+
+def parse_proxitok_trending(html: str) -> list:
+    """ProxiTok 트렌딩 페이지 HTML에서 영상 추출"""
+    return to_tiktok_videos(extract(html, kinds=("tiktok",)))
+
+
+class CuratedSource(Source):
+    """정적 인기 영상 목록 (항상 포함 - 최소 보장)"""
+    name = "curated"
+    priority = 3
     
+    async def stream(self):
+        for video in CURATED_TIKTOK_VIDEOS:
+            yield video
+
+
+class ProxiTokSource(Source):
+    """ProxiTok 트렌딩 페이지에서 영상 가져오기 (미러 레이스)"""
+    name = "proxitok"
+    priority = 2
+    retries = 0
     instances = [
         "https://proxitok.pabloferreiro.es",
         "https://tok.habedieeh.re",
@@ -94,142 +202,193 @@ def get_trending_from_proxitok():
         "https://tok.artemislena.eu",
     ]
     
-    print("[PROXITOK] Scanning trending pages...")
+    async def scan(self, instance):
+        url = f"{instance}/trending"
+        extractor = StreamExtractor(kinds=("tiktok",))
+        resp = await self.fetch(url, timeout=15, ttl=PROXITOK_CACHE_TTL, on_chunk=extractor.feed)
+        videos = self.extracted(resp, "proxitok_trending", lambda html: to_tiktok_videos(extractor.drain(html)))
+        
+        if len(videos) > 0:
+            print(f"  {instance}: found {len(videos)} trending videos" + (" (cached)" if resp.cached else ""))
+        return videos
     
-    for instance in instances:
-        try:
-            url = f"{instance}/trending"
-            
-            req = urllib.request.Request(url, headers={
-                "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 Chrome/120.0.0.0",
-                "Accept": "text/html,application/xhtml+xml",
-            })
-            
-            with urllib.request.urlopen(req, timeout=15) as resp:
-                html = resp.read().decode('utf-8', errors='ignore')
-                
-                patterns = [
-                    r'/@([^/]+)/video/(\d{18,20})',
-                    r'/video/(\d{18,20})',
-                ]
-                
-                found_videos = set()
-                
-                for pattern in patterns:
-                    matches = re.findall(pattern, html)
-                    for match in matches:
-                        if isinstance(match, tuple):
-                            username, video_id = match
-                            if video_id not in found_videos and len(video_id) >= 18:
-                                found_videos.add(video_id)
-                                videos.append({
-                                    "id": video_id,
-                                    "url": f"https://www.tiktok.com/@{username}/video/{video_id}",
-                                    "title": "",
-                                    "source": f"proxitok_trending",
-                                    "username": username
-                                })
-                        else:
-                            video_id = match
-                            if video_id not in found_videos and len(video_id) >= 18:
-                                found_videos.add(video_id)
-                                videos.append({
-                                    "id": video_id,
-                                    "url": f"https://www.tiktok.com/@a/video/{video_id}",
-                                    "title": "",
-                                    "source": "proxitok_trending"
-                                })
-                
-                if len(found_videos) > 0:
-                    print(f"  {instance}: found {len(found_videos)} trending videos")
-                    break
-                    
-        except Exception as e:
-            print(f"  {instance}: {str(e)[:40]}")
-    
-    print(f"[PROXITOK] Total: {len(videos)} trending videos")
-    return videos
+    async def stream(self):
+        print("[PROXITOK] Scanning trending pages...")
+        
+        _, videos = await race(self.instances, self.scan, fanout=PROXITOK_FANOUT,
+                               hedge_delay=PROXITOK_HEDGE_DELAY, deadline=PROXITOK_DEADLINE,
+                               label="PROXITOK", health=MIRROR_HEALTH)
+        videos = videos or []
+        
+        print(f"[PROXITOK] Total: {len(videos)} trending videos")
+        for v in videos:
+            yield v
 
 
-def get_trending_hashtags():
-    """yt-dlp로 트렌딩 해시태그 영상 가져오기"""
-    videos = []
-    
-    trending_tags = ["fyp", "food", "challenge", "dance", "funny"]
+def ytdlp_entry_to_video(data: dict, tag: str):
+    """yt-dlp 항목(-j 한 줄 / flat 엔트리)을 영상 레코드로"""
+    video_url = data.get("url") or data.get("webpage_url")
+    video_id = data.get("id")
+    if not (video_url and video_id):
+        return None
+    return {
+        "id": video_id,
+        "url": video_url,
+        "title": (data.get("title") or "")[:80],
+        "username": data.get("uploader") or "",
+        "source": f"ytdlp_tag_{tag}"
+    }
+
+
+_ytdlp_local = threading.local()
+
+
+def _ytdlp_extract_tag(tag: str, playlist_end: int) -> list:
+    """워커 스레드마다 YoutubeDL 하나를 만들어 두고 여러 태그에 재사용"""
+    ydl = getattr(_ytdlp_local, "ydl", None)
+    if ydl is None:
+        ydl = yt_dlp.YoutubeDL({
+            "extract_flat": "in_playlist",
+            "playlistend": playlist_end,
+            "quiet": True,
+            "no_warnings": True,
+            "skip_download": True,
+            "socket_timeout": YTDLP_TAG_TIMEOUT,
+        })
+        _ytdlp_local.ydl = ydl
+    info = ydl.extract_info(f"https://www.tiktok.com/tag/{tag}", download=False)
+    return list((info or {}).get("entries") or [])[:playlist_end]
+
+
+async def _ytdlp_tag_subprocess(tag: str, playlist_end: int) -> list:
+    """yt-dlp 라이브러리가 없을 때: CLI를 비동기 서브프로세스로"""
+    proc = await asyncio.create_subprocess_exec(
+        "yt-dlp",
+        "--flat-playlist",
+        "--playlist-end", str(playlist_end),
+        "-j",
+        "--no-warnings",
+        f"https://www.tiktok.com/tag/{tag}",
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.DEVNULL,
+    )
+    try:
+        stdout, _ = await proc.communicate()
+    except asyncio.CancelledError:
+        proc.kill()
+        raise
+    if proc.returncode != 0:
+        return []
+    entries = []
+    for line in stdout.decode("utf-8", errors="ignore").splitlines():
+        if line:
+            try:
+                entries.append(json.loads(line))
+            except json.JSONDecodeError:
+                continue
+    return entries
+
+
+class HashtagSource(Source):
+    """yt-dlp로 트렌딩 해시태그 영상 가져오기 (태그별 병렬, 태그마다 제한 시간)"""
+    name = "hashtags"
+    priority = 1
     
-    print(f"[YTDLP] Fetching from trending hashtags: {trending_tags}")
+    def __init__(self, tags: list = None, playlist_end: int = YTDLP_PLAYLIST_END):
+        self.tags = tags or TRENDING_TAGS
+        self.playlist_end = playlist_end
     
-    for tag in trending_tags:
-        try:
-            url = f"https://www.tiktok.com/tag/{tag}"
+    async def stream(self):
+        if yt_dlp is not None:
+            mode = "library"
+            pool = ThreadPoolExecutor(max_workers=YTDLP_WORKERS, thread_name_prefix="ytdlp")
+            loop = asyncio.get_running_loop()
             
-            result = subprocess.run([
-                "yt-dlp",
-                "--flat-playlist",
-                "--playlist-end", "5",
-                "-j",
-                "--no-warnings",
-                url
-            ], capture_output=True, text=True, timeout=30)
+            def fetch(tag):
+                return loop.run_in_executor(pool, _ytdlp_extract_tag, tag, self.playlist_end)
+        else:
+            mode = "subprocess"
+            pool = None
             
-            if result.returncode == 0:
-                for line in result.stdout.strip().split('\n'):
-                    if line:
-                        try:
-                            data = json.loads(line)
-                            video_url = data.get("url") or data.get("webpage_url")
-                            video_id = data.get("id")
-                            
-                            if video_url and video_id:
-                                if video_id not in [v["id"] for v in videos]:
-                                    videos.append({
-                                        "id": video_id,
-                                        "url": video_url,
-                                        "title": data.get("title", "")[:80],
-                                        "username": data.get("uploader", ""),
-                                        "source": f"ytdlp_tag_{tag}"
-                                    })
-                        except json.JSONDecodeError:
-                            continue
-                            
-        except Exception as e:
-            print(f"  #{tag}: {str(e)[:30]}")
-    
-    print(f"[YTDLP] Total from hashtags: {len(videos)} videos")
-    return videos
+            def fetch(tag):
+                return _ytdlp_tag_subprocess(tag, self.playlist_end)
+        
+        print(f"[YTDLP] Fetching {len(self.tags)} trending hashtags ({mode}, {YTDLP_WORKERS} workers)")
+        
+        # 제한 시간은 대기열이 아니라 실제 작업에만 적용
+        # (yt-dlp 요청도 www.tiktok.com 호스트 제한 / 속도 제한을 함께 받음)
+        semaphore = asyncio.Semaphore(YTDLP_WORKERS)
+        
+        async def harvest(tag):
+            # yt-dlp 내부 요청은 HttpClient를 거치지 않으므로 태그 단위로 기록
+            async with semaphore, self.slot(TIKTOK_HOST):
+                started = time.perf_counter()
+                try:
+                    entries = await asyncio.wait_for(fetch(tag), timeout=YTDLP_TAG_TIMEOUT)
+                    error = None
+                except Exception as e:
+                    entries, error = [], e
+            record = TELEMETRY.record(host=TIKTOK_HOST, method=f"yt-dlp:{mode}", status=None,
+                                      total_ms=round((time.perf_counter() - started) * 1000, 1),
+                                      error=type(error).__name__ if error else None)
+            if isinstance(error, asyncio.TimeoutError):
+                print(f"  #{tag}: timed out")
+            elif error:
+                print(f"  #{tag}: {str(error)[:30]}")
+            videos = [v for v in (ytdlp_entry_to_video(e, tag) for e in entries) if v]
+            record["matches"] = len(videos)
+            return videos
+        
+        tasks = [asyncio.create_task(harvest(tag)) for tag in self.tags]
+        total = 0
+        try:
+            for done in asyncio.as_completed(tasks):
+                videos = await done
+                total += len(videos)
+                for v in videos:
+                    yield v
+        finally:
+            for task in tasks:
+                task.cancel()
+            if pool:
+                pool.shutdown(wait=False, cancel_futures=True)
+        
+        print(f"[YTDLP] Total from hashtags: {total} videos")
 
 
-async def main():
-    all_videos = []
-    seen_ids = set()
-    
-    # 1. 정적 인기 영상 목록 (항상 포함 - 최소 보장)
-    print("[CURATED] Adding curated viral videos...")
-    for v in CURATED_TIKTOK_VIDEOS:
-        if v["id"] not in seen_ids:
-            seen_ids.add(v["id"])
-            all_videos.append(v.copy())
-    print(f"[CURATED] Added {len(all_videos)} curated videos")
-    
-    # 2. ProxiTok 트렌딩 (성공하면 추가)
-    proxitok_videos = get_trending_from_proxitok()
-    for v in proxitok_videos:
-        if v["id"] not in seen_ids:
-            seen_ids.add(v["id"])
-            all_videos.append(v)
+def build_sources() -> list:
+    return [CuratedSource(), ProxiTokSource(), HashtagSource()]
+
+
+def new_collector() -> VideoCollector:
+    return VideoCollector(SOURCE_QUOTAS)
+
+
+async def publish(records: list) -> dict:
+    """생존 확인 후 저장소에 반영하고 tiktok.json / tiktok_delta.json / tiktok_urls.txt 작성"""
+    # 생존 확인 (죽은 링크 제외, 임시 사용자명 교체)
+    liveness = LivenessCache()
+    alive, dead = await TELEMETRY.track("verify", verify_tiktok(SCHEDULER, records, liveness))
+    liveness.save()
     
-    # 3. yt-dlp 해시태그 (성공하면 추가)
-    hashtag_videos = get_trending_hashtags()
-    for v in hashtag_videos:
-        if v["id"] not in seen_ids:
-            seen_ids.add(v["id"])
-            all_videos.append(v)
+    # 저장소 반영 (공개 목록은 저장소의 최신 행)
+    with TELEMETRY.stage("store"):
+        store = VideoStore("tiktok")
+        new_count = store.upsert(alive)
+        store.remove(dead)
+        pruned = store.prune()
+        all_videos = store.freshest(PUBLISH_LIMIT)
+        delta = store.publish(all_videos)
+        store.close()
+    print(f"[STORE] {new_count} new, {pruned} pruned, "
+          f"delta +{len(delta['added'])} / -{len(delta['removed'])}")
     
-    # 결과 셔플 (랜덤화)
-    random.shuffle(all_videos)
+    # 결과 셔플 (랜덤화, 시드가 같으면 같은 순서)
+    seed = SHUFFLE_SEED or canonical_hash(sorted(v["id"] for v in all_videos))
+    random.Random(seed).shuffle(all_videos)
     
     # 소스 분류
-    sources_used = list(set(v.get("source", "unknown") for v in all_videos))
+    sources_used = sorted(set(v.get("source", "unknown") for v in all_videos))
     
     output = {
         "updated_at": datetime.now(timezone.utc).isoformat(),
@@ -240,13 +399,13 @@ async def main():
         "videos": all_videos,
     }
     
-    with open("tiktok.json", "w", encoding="utf-8") as f:
-        json.dump(output, f, ensure_ascii=False, indent=2)
+    # 내용이 그대로면 이전 파일(updated_at 포함)을 그대로 두고 delta도 건드리지 않음
+    if write_json("tiktok.json", output, records_key="videos"):
+        write_delta("tiktok_delta.json", delta, output["updated_at"])
     
     # URL만 추출
     urls = [v["url"] for v in all_videos]
-    with open("tiktok_urls.txt", "w", encoding="utf-8") as f:
-        f.write("\n".join(urls))
+    write_text("tiktok_urls.txt", "\n".join(urls))
     
     # 디버그 로그
     with open("tiktok_debug.log", "w", encoding="utf-8") as f:
@@ -257,10 +416,32 @@ async def main():
         f.write(f"ProxiTok: {len([v for v in all_videos if 'proxitok' in v['source']])}\n")
         f.write(f"YT-DLP: {len([v for v in all_videos if 'ytdlp' in v['source']])}\n")
     
-    print(f"\n=== FINAL: {len(all_videos)} TikTok trending videos ===")
-    print(f"Sources: {sources_used}")
+    return output
+
+
+async def main():
+    collector = new_collector()
+    
+    # 1~3. 정적 목록 / ProxiTok 트렌딩 / yt-dlp 해시태그를 동시에 (성공한 만큼 추가)
+    with TELEMETRY.stage("collect"):
+        await SCHEDULER.run(build_sources(), collector)
+    
+    # 4. 생존 확인 + 저장
+    output = await publish(collector.to_dicts())
+    
+    MIRROR_HEALTH.save()
+    HTTP.close()
+    
+    print(f"\n=== FINAL: {output['count']} TikTok trending videos ===")
+    print(f"Sources: {output['sources_used']}")
+    print(f"HTTP: {HTTP.summary()}")
+    TELEMETRY.save(HTTP.stats)
 
 
 if __name__ == "__main__":
-    import asyncio
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--profile", action="store_true",
+                        help="전략마다 cProfile, 전체에 tracemalloc을 걸고 hotspot 출력")
+    if parser.parse_args().profile:
+        TELEMETRY.enable_profiling()
     asyncio.run(main())
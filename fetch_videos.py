@@ -8,57 +8,124 @@ Twitter 비디오 크롤러 - 다중 소스 전략
 5. GitHub 캐시 fallback
 """
 
+import argparse
 import json
-import re
 import asyncio
 import os
+import time
 from datetime import datetime, timezone
-import urllib.request
 import urllib.parse
 
-VIDEO_PATTERN = re.compile(r'https://video\.twimg\.com/[^"\'<>\s]+\.mp4[^"\'<>\s]*')
-TWEET_PATTERN = re.compile(r'(?:twitter\.com|x\.com)/(\w+)/status/(\d+)')
+from http_cache import ResponseCache
+from http_client import HttpClient
+from collector import VideoCollector
+from extractor import StreamExtractor, extract
+from media_index import canonicalize, drop_linked_tweets, merge_variants
+from video_store import VideoStore, write_delta
+from output import write_json, write_text
+from mirrors import MirrorHealth, race
+from sources import Scheduler, Source
+from telemetry import Telemetry
 
+# 요청별 기록 (request_log.jsonl) + 실행 요약 (run_summary.json)
+TELEMETRY = Telemetry()
 
-def extract_videos(html: str, source: str) -> list:
+# 공용 HTTP 클라이언트 (keep-alive 풀 + 압축 + 조건부 요청 캐시, 동시 요청 수 상한)
+HTTP_WORKERS = 16
+HTTP = HttpClient(workers=HTTP_WORKERS, cache=ResponseCache(), telemetry=TELEMETRY)
+
+# 모든 소스의 요청에 호스트별 동시 요청 수 / 속도 제한 / 재시도 적용
+# (FlareSolverr는 브라우저 하나라 한 번에 하나씩)
+HOST_LIMITS = {"localhost": 1}
+HOST_RATES = {}
+SCHEDULER = Scheduler(HTTP, concurrency=HTTP_WORKERS, host_limits=HOST_LIMITS, rates=HOST_RATES)
+
+# 소스별 캐시 TTL (초, 0이면 매번 ETag/Last-Modified로 재검증)
+NITTER_CACHE_TTL = 10 * 60
+ACCOUNT_CACHE_TTL = 30 * 60
+GITHUB_CACHE_TTL = 0
+
+# 페이지당 수집할 최대 매치 수 (도달하면 나머지 본문은 받지 않음)
+NITTER_SEARCH_QUOTA = 30
+ACCOUNT_MEDIA_QUOTA = 10
+
+# 같은 미디어의 여러 변형 중 선택할 해상도 상한 (픽셀 수, None이면 최대 해상도)
+VARIANT_MAX_PIXELS = None
+
+# 이번 실행 후보 풀: 직접 mp4가 있는 영상 우선으로 최대 MAX_CANDIDATES개, 소스별 상한
+MAX_CANDIDATES = 2000
+SOURCE_QUOTAS = {
+    "account_": 30,
+    "nitter_": 200,
+}
+
+# 공개 목록: 저장소에서 가장 최근 PUBLISH_LIMIT개, 처음 발견된 지 PUBLISH_MAX_AGE 이내만
+PUBLISH_LIMIT = 100
+PUBLISH_MAX_AGE = 3 * 24 * 3600
+
+# 유명 계정 크롤링을 생략하는 기준 (FlareSolverr + Nitter 결과 수)
+ENOUGH_PRIMARY_VIDEOS = 20
+
+# Nitter 미러 레이스 설정 (동시 요청 수 / 헤지 간격 / 전체 제한 시간)
+NITTER_FANOUT = 4
+NITTER_HEDGE_DELAY = 1.0
+NITTER_DEADLINE = 30.0
+
+# 미러별 상태 기록 (mirror_health.json)
+MIRROR_HEALTH = MirrorHealth()
+
+# 일본에서 인기 있는 비디오 공유 계정들 (Nitter /media)
+FAMOUS_ACCOUNTS = [
+    "video_japan",
+    "bazvideo",
+    "gifmagazine",
+]
+
+GITHUB_SOURCES = [
+    ("https://raw.githubusercontent.com/PineAppleHollyday1/twitter-realtime-100-twidouga.net-/main/realtime_t.php", "github_pineapple"),
+]
+
+
+def to_videos(matches: list, source: str) -> list:
+    """추출기 매치(twimg / tweet)를 영상 레코드로 (미디어당 하나, 연결된 트윗은 tweet_url로)"""
+    media, tweets = canonicalize(matches, VARIANT_MAX_PIXELS)
     videos = []
-    seen_ids = set()
-    
-    for match in VIDEO_PATTERN.finditer(html):
-        url = match.group(0)
-        vid = hash(url) % 10000000000
-        if vid not in seen_ids:
-            seen_ids.add(vid)
-            videos.append({"id": str(vid), "video_url": url, "tweet_url": url, "source": source})
-    
-    for match in TWEET_PATTERN.finditer(html):
-        username, tid = match.groups()
-        if tid not in seen_ids:
-            seen_ids.add(tid)
-            videos.append({"id": tid, "video_url": None, "tweet_url": f"https://twitter.com/{username}/status/{tid}", "source": source})
-    
+    for key, url, tweet in media:
+        tweet_url = f"https://twitter.com/{tweet.user}/status/{tweet.id}" if tweet else url
+        videos.append({"id": key, "video_url": url, "tweet_url": tweet_url, "source": source})
+    for m in tweets:
+        videos.append({"id": m.id, "video_url": None, "tweet_url": f"https://twitter.com/{m.user}/status/{m.id}", "source": source})
     return videos
 
 
-async def try_flaresolverr(url: str) -> str:
-    """FlareSolverr (Cloudflare 우회)"""
-    try:
-        print(f"[FLARESOLVERR] Requesting {url}...")
-        
-        payload = json.dumps({
-            "cmd": "request.get",
-            "url": url,
-            "maxTimeout": 60000
-        }).encode('utf-8')
-        
-        req = urllib.request.Request(
-            "http://localhost:8191/v1",
-            data=payload,
-            headers={"Content-Type": "application/json"}
-        )
-        
-        with urllib.request.urlopen(req, timeout=120) as resp:
-            result = json.loads(resp.read().decode('utf-8'))
+def extract_videos(html: str, source: str) -> list:
+    return to_videos(extract(html, kinds=("twimg", "tweet")), source)
+
+
+class TwidougaSource(Source):
+    """FlareSolverr (Cloudflare 우회)로 twidouga 페이지 수집"""
+    name = "flaresolverr"
+    priority = 3
+    retries = 0
+    urls = ["https://twidouga.net/realtime_t.php"]
+
+    async def solve(self, url: str) -> str:
+        try:
+            print(f"[FLARESOLVERR] Requesting {url}...")
+            
+            payload = json.dumps({
+                "cmd": "request.get",
+                "url": url,
+                "maxTimeout": 60000
+            }).encode('utf-8')
+            
+            resp = await self.fetch(
+                "http://localhost:8191/v1",
+                data=payload,
+                timeout=120,
+                profile="json",
+            )
+            result = resp.json()
             if result.get("status") == "ok":
                 html = result.get("solution", {}).get("response", "")
                 
@@ -74,16 +141,26 @@ async def try_flaresolverr(url: str) -> str:
                     
                 print(f"[FLARESOLVERR] Got error page or empty content")
                 
-    except Exception as e:
-        print(f"[FLARESOLVERR] Error: {e}")
+        except Exception as e:
+            print(f"[FLARESOLVERR] Error: {e}")
+        
+        return ""
     
-    return ""
+    async def stream(self):
+        for url in self.urls:
+            html = await self.solve(url)
+            vids = extract_videos(html, "twidouga_flaresolverr") if html else []
+            for v in vids:
+                yield v
+            if vids:
+                return
 
 
-async def try_nitter_search() -> list:
-    """Nitter 검색 - 더 많은 인스턴스"""
-    videos = []
-    
+class NitterSearchSource(Source):
+    """Nitter 검색 - 여러 인스턴스를 동시에 경쟁시켜 첫 성공 결과 사용"""
+    name = "nitter"
+    priority = 2
+    retries = 0
     # 더 많은 Nitter 미러들
     instances = [
         "https://nitter.privacydev.net",
@@ -96,42 +173,30 @@ async def try_nitter_search() -> list:
         "https://nitter.moomoo.me",
     ]
     
-    print(f"[NITTER] Trying {len(instances)} instances...")
-    
-    for instance in instances:
-        try:
-            # 비디오 검색 (일본어)
-            url = f"{instance}/search?f=videos&q=lang%3Aja"
-            
-            req = urllib.request.Request(url, headers={
-                "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) Chrome/120.0.0.0",
-                "Accept": "text/html",
-            })
-            
-            with urllib.request.urlopen(req, timeout=15) as resp:
-                html = resp.read().decode('utf-8', errors='ignore')
-                
-                # /username/status/id 패턴
-                matches = re.findall(r'href="(/([^/]+)/status/(\d+))"', html)
-                
-                for full, username, tweet_id in matches[:30]:
-                    if tweet_id not in [v["id"] for v in videos]:
-                        videos.append({
-                            "id": tweet_id,
-                            "video_url": None,
-                            "tweet_url": f"https://twitter.com/{username}/status/{tweet_id}",
-                            "source": f"nitter_{instance.split('//')[1].split('.')[0]}"
-                        })
-                
-                if len(matches) > 0:
-                    print(f"[NITTER] {instance}: found {len(matches)} tweets")
-                    break
-                    
-        except Exception as e:
-            print(f"[NITTER] {instance}: {str(e)[:30]}")
+    async def search(self, instance: str) -> list:
+        # 비디오 검색 (일본어)
+        url = f"{instance}/search?f=videos&q=lang%3Aja"
+        
+        # /username/status/id 패턴
+        extractor = StreamExtractor(kinds=("tweet",), quota=NITTER_SEARCH_QUOTA)
+        source = f"nitter_{instance.split('//')[1].split('.')[0]}"
+        
+        resp = await self.fetch(url, timeout=15, ttl=NITTER_CACHE_TTL, on_chunk=extractor.feed)
+        videos = self.extracted(resp, "nitter_search", lambda html: to_videos(extractor.drain(html), source))
+        
+        if len(videos) > 0:
+            print(f"[NITTER] {instance}: found {len(videos)} tweets" + (" (cached)" if resp.cached else ""))
+        return videos
     
-    print(f"[NITTER] Total: {len(videos)}")
-    return videos
+    async def stream(self):
+        print(f"[NITTER] Racing {len(self.instances)} instances (fanout={NITTER_FANOUT})...")
+        _, videos = await race(self.instances, self.search, fanout=NITTER_FANOUT,
+                               hedge_delay=NITTER_HEDGE_DELAY, deadline=NITTER_DEADLINE,
+                               label="NITTER", health=MIRROR_HEALTH)
+        videos = videos or []
+        print(f"[NITTER] Total: {len(videos)}")
+        for v in videos:
+            yield v
 
 
 async def try_twitter_api() -> list:
@@ -149,154 +214,182 @@ async def try_twitter_api() -> list:
         # 일본 WOEID: 23424856
         url = "https://api.twitter.com/1.1/trends/place.json?id=23424856"
         
-        req = urllib.request.Request(url, headers={
+        body = await HTTP.get_text(url, headers={
             "Authorization": f"Bearer {bearer_token}"
-        })
+        }, timeout=30, profile="simple")
+        data = json.loads(body)
+        trends = data[0].get("trends", [])[:10]
         
-        with urllib.request.urlopen(req, timeout=30) as resp:
-            data = json.loads(resp.read().decode('utf-8'))
-            trends = data[0].get("trends", [])[:10]
+        for trend in trends:
+            # 트렌드 검색으로 비디오 찾기
+            query = urllib.parse.quote(f"{trend['name']} filter:videos")
+            search_url = f"https://api.twitter.com/2/tweets/search/recent?query={query}&max_results=10&expansions=attachments.media_keys&media.fields=url,variants"
+            
+            # ... (API 호출 구현)
             
-            for trend in trends:
-                # 트렌드 검색으로 비디오 찾기
-                query = urllib.parse.quote(f"{trend['name']} filter:videos")
-                search_url = f"https://api.twitter.com/2/tweets/search/recent?query={query}&max_results=10&expansions=attachments.media_keys&media.fields=url,variants"
-                
-                # ... (API 호출 구현)
-                
     except Exception as e:
         print(f"[TWITTER_API] Error: {e}")
     
     return videos
 
 
-async def try_famous_accounts() -> list:
-    """유명 일본 비디오 계정들 크롤링"""
-    videos = []
+class AccountSource(Source):
+    """계정 하나의 /media 페이지 크롤링 (상태가 좋은 Nitter 미러부터 하나씩)"""
+    priority = 1
+    retries = 0
+    instances = ["https://xcancel.com", "https://nitter.privacydev.net"]
     
-    # 일본에서 인기 있는 비디오 공유 계정들
-    accounts = [
-        "video_japan",
-        "bazvideo",
-        "gifmagazine",
-    ]
+    def __init__(self, account: str):
+        self.account = account
+        self.name = f"account_{account}"
     
-    # Nitter를 통해 접근
-    for account in accounts:
-        try:
-            instances = ["https://xcancel.com", "https://nitter.privacydev.net"]
-            for instance in instances:
-                try:
-                    url = f"{instance}/{account}/media"
-                    req = urllib.request.Request(url, headers={"User-Agent": "Mozilla/5.0"})
-                    
-                    with urllib.request.urlopen(req, timeout=15) as resp:
-                        html = resp.read().decode('utf-8', errors='ignore')
-                        
-                        matches = re.findall(r'/status/(\d+)', html)
-                        for tid in matches[:10]:
-                            if tid not in [v["id"] for v in videos]:
-                                videos.append({
-                                    "id": tid,
-                                    "video_url": None,
-                                    "tweet_url": f"https://twitter.com/{account}/status/{tid}",
-                                    "source": f"account_{account}"
-                                })
-                        
-                        if len(matches) > 0:
-                            print(f"[ACCOUNTS] {account}: {len(matches)} videos")
-                            break
-                            
-                except:
-                    continue
-                    
-        except Exception as e:
-            print(f"[ACCOUNTS] {account}: {str(e)[:30]}")
+    async def crawl(self, instance: str) -> list:
+        url = f"{instance}/{self.account}/media"
+        extractor = StreamExtractor(kinds=("tweet", "status"), quota=ACCOUNT_MEDIA_QUOTA)
+        
+        def parse(html: str) -> list:
+            return [{
+                "id": m.id,
+                "video_url": None,
+                "tweet_url": f"https://twitter.com/{self.account}/status/{m.id}",
+                "source": self.name
+            } for m in extractor.drain(html)]
+        
+        resp = await self.fetch(url, timeout=15, profile="simple", ttl=ACCOUNT_CACHE_TTL,
+                                on_chunk=extractor.feed)
+        videos = self.extracted(resp, "account_media", parse)
+        
+        if len(videos) > 0:
+            print(f"[ACCOUNTS] {self.account}: {len(videos)} videos" + (" (cached)" if resp.cached else ""))
+        return videos
     
-    return videos
+    async def stream(self):
+        _, videos = await race(self.instances, self.crawl, fanout=1, deadline=NITTER_DEADLINE,
+                               label=f"ACCOUNTS {self.account}", health=MIRROR_HEALTH)
+        for v in videos or []:
+            yield v
 
 
-async def fetch_github_cache() -> list:
+class GithubCacheSource(Source):
     """GitHub 캐시"""
-    videos = []
+    priority = 0
     
-    sources = [
-        ("https://raw.githubusercontent.com/PineAppleHollyday1/twitter-realtime-100-twidouga.net-/main/realtime_t.php", "github_pineapple"),
-    ]
+    def __init__(self, url: str, name: str):
+        self.url = url
+        self.name = name
     
-    for url, source in sources:
+    async def stream(self):
+        extractor = StreamExtractor(kinds=("twimg", "tweet"))
         try:
-            req = urllib.request.Request(url, headers={"User-Agent": "Mozilla/5.0"})
-            with urllib.request.urlopen(req, timeout=20) as resp:
-                html = resp.read().decode("utf-8", errors="ignore")
-                videos.extend(extract_videos(html, source))
-                print(f"[GITHUB] {source}: {len(videos)} videos")
+            resp = await self.fetch(self.url, timeout=20, profile="simple", ttl=GITHUB_CACHE_TTL,
+                                    on_chunk=extractor.feed)
+            videos = self.extracted(resp, "media_videos", lambda html: to_videos(extractor.drain(html), self.name))
         except Exception as e:
-            print(f"[GITHUB] {source}: {str(e)[:30]}")
-    
-    return videos
+            print(f"[GITHUB] {self.name}: {str(e)[:30]}")
+            return
+        print(f"[GITHUB] {self.name}: {len(videos)} videos" + (" (not modified)" if resp.cached else ""))
+        for v in videos:
+            yield v
 
 
-async def main():
-    all_videos = []
-    seen_ids = set()
-    
-    # === 1. FlareSolverr ===
-    for url in ["https://twidouga.net/realtime_t.php"]:
-        html = await try_flaresolverr(url)
-        if html:
-            vids = extract_videos(html, "twidouga_flaresolverr")
-            for v in vids:
-                if v["id"] not in seen_ids:
-                    seen_ids.add(v["id"])
-                    all_videos.append(v)
-            if vids:
-                break
-    
-    # === 2. Nitter ===
-    if len(all_videos) == 0:
-        nitter_vids = await try_nitter_search()
-        for v in nitter_vids:
-            if v["id"] not in seen_ids:
-                seen_ids.add(v["id"])
-                all_videos.append(v)
-    
-    # === 3. 유명 계정 ===
-    if len(all_videos) < 20:
-        account_vids = await try_famous_accounts()
-        for v in account_vids:
-            if v["id"] not in seen_ids:
-                seen_ids.add(v["id"])
-                all_videos.append(v)
-    
-    # === 4. GitHub 캐시 (항상) ===
-    github_vids = await fetch_github_cache()
-    for v in github_vids:
-        if v["id"] not in seen_ids:
-            seen_ids.add(v["id"])
-            all_videos.append(v)
+def build_sources() -> list:
+    return [
+        TwidougaSource(),
+        NitterSearchSource(),
+        *(AccountSource(account) for account in FAMOUS_ACCOUNTS),
+        *(GithubCacheSource(url, name) for url, name in GITHUB_SOURCES),
+    ]
+
+
+def new_collector() -> VideoCollector:
+    """이번 실행 후보 풀 (직접 mp4가 있는 영상 우선, 같은 미디어는 변형 정책에 따라 합침)"""
+    return VideoCollector(SOURCE_QUOTAS, capacity=MAX_CANDIDATES,
+                          key=lambda v: v.video_url is not None,
+                          merge=merge_variants(VARIANT_MAX_PIXELS))
+
+
+async def publish(records: list) -> dict:
+    """수집 결과를 저장소에 반영하고 videos.json / delta.json / urls.txt 작성"""
+    # === 저장소 반영 (공개 목록은 저장소의 최신 행) ===
+    with TELEMETRY.stage("store"):
+        store = VideoStore("twitter")
+        new_count = store.upsert(drop_linked_tweets(records))
+        pruned = store.prune()
+        all_videos = store.freshest(PUBLISH_LIMIT, max_age=PUBLISH_MAX_AGE)
+        all_videos.sort(key=lambda x: (x["video_url"] is None, x["source"]))
+        delta = store.publish(all_videos)
+        store.close()
+    print(f"[STORE] {new_count} new, {pruned} pruned, "
+          f"delta +{len(delta['added'])} / -{len(delta['removed'])}")
     
     # === 저장 ===
-    all_videos.sort(key=lambda x: (x["video_url"] is None, x["source"]))
-    all_videos = all_videos[:100]
-    
     output = {
         "updated_at": datetime.now(timezone.utc).isoformat(),
         "count": len(all_videos),
-        "sources_used": list(set(v["source"] for v in all_videos)),
+        "sources_used": sorted(set(v["source"] for v in all_videos)),
         "videos": all_videos,
     }
     
-    with open("videos.json", "w", encoding="utf-8") as f:
-        json.dump(output, f, ensure_ascii=False, indent=2)
+    # 내용이 그대로면 이전 파일(updated_at 포함)을 그대로 두고 delta도 건드리지 않음
+    if write_json("videos.json", output, records_key="videos"):
+        write_delta("delta.json", delta, output["updated_at"])
     
     urls = [v["video_url"] or v["tweet_url"] for v in all_videos]
-    with open("urls.txt", "w", encoding="utf-8") as f:
-        f.write("\n".join(urls))
+    write_text("urls.txt", "\n".join(urls))
+    
+    return output
+
+
+async def main():
+    collector = new_collector()
+    started = time.monotonic()
+    
+    # 모든 소스를 우선순위 순으로 동시에 시작하고, 도착하는 대로 병합
+    # - Nitter: FlareSolverr가 결과를 내면 취소
+    # - 유명 계정: FlareSolverr + Nitter 결과가 충분하면 취소
+    # - GitHub 캐시: 항상
+    sources = sorted(build_sources(), key=lambda s: -s.priority)
+    tasks = {SCHEDULER.start(source): source for source in sources}
+    by_name = {source.name: task for task, source in tasks.items()}
+    flare, nitter = by_name["flaresolverr"], by_name["nitter"]
+    accounts = [task for task, source in tasks.items() if isinstance(source, AccountSource)]
+    
+    with TELEMETRY.stage("collect"):
+        primary_count = 0
+        pending = set(tasks)
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                if task.cancelled():
+                    print(f"[MAIN] {task.get_name()}: cancelled")
+                    continue
+                added = collector.extend(task.result())
+                print(f"[MAIN] {task.get_name()}: +{added} ({time.monotonic() - started:.1f}s)")
+                if task in (flare, nitter):
+                    primary_count += added
+                if task is flare and added and not nitter.done():
+                    nitter.cancel()
+            if primary_count >= ENOUGH_PRIMARY_VIDEOS:
+                for task in accounts:
+                    if not task.done():
+                        task.cancel()
+    
+    HTTP.close()
+    MIRROR_HEALTH.save()
+    
+    output = await publish(collector.to_dicts())
     
-    print(f"\n=== FINAL: {len(all_videos)} videos ===")
+    print(f"\n=== FINAL: {output['count']} videos ===")
     print(f"Sources: {output['sources_used']}")
+    print(f"HTTP: {HTTP.summary()}")
+    print(f"Elapsed: {time.monotonic() - started:.1f}s")
+    TELEMETRY.save(HTTP.stats)
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--profile", action="store_true",
+                        help="전략마다 cProfile, 전체에 tracemalloc을 걸고 hotspot 출력")
+    if parser.parse_args().profile:
+        TELEMETRY.enable_profiling()
+    asyncio.run(main())
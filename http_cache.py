@@ -0,0 +1,139 @@
+"""
+조건부 요청 응답 캐시 (URL 기준, 디스크 저장)
+
+- ETag / Last-Modified를 저장했다가 If-None-Match / If-Modified-Since로 재검증
+- 304 응답이면 저장된 본문과 추출 결과를 그대로 재사용 (재파싱 생략)
+- 소스별 TTL 안이면 요청 자체를 생략
+- 전체 크기가 max_bytes를 넘으면 가장 오래 쓰지 않은 항목부터 삭제 (LRU)
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+
+CACHE_DIR = ".http_cache"
+MAX_CACHE_BYTES = 32 * 1024 * 1024
+
+
+class ResponseCache:
+    def __init__(self, directory: str = CACHE_DIR, max_bytes: int = MAX_CACHE_BYTES):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        os.makedirs(directory, exist_ok=True)
+
+    def _paths(self, url: str):
+        key = hashlib.sha1(url.encode("utf-8")).hexdigest()
+        base = os.path.join(self.directory, key)
+        return f"{base}.json", f"{base}.body"
+
+    def _write_meta(self, path: str, meta: dict):
+        tmp = f"{path}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(meta, f, ensure_ascii=False)
+        os.replace(tmp, path)
+
+    def lookup(self, url: str):
+        """저장된 항목 (meta dict) 또는 None"""
+        meta_path, body_path = self._paths(url)
+        try:
+            with open(meta_path, encoding="utf-8") as f:
+                meta = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if meta.get("url") != url or not os.path.exists(body_path):
+            return None
+        return meta
+
+    def is_fresh(self, meta: dict, ttl: float) -> bool:
+        return time.time() - meta["stored_at"] < ttl
+
+    def validators(self, meta: dict) -> dict:
+        headers = {}
+        if meta.get("etag"):
+            headers["If-None-Match"] = meta["etag"]
+        if meta.get("last_modified"):
+            headers["If-Modified-Since"] = meta["last_modified"]
+        return headers
+
+    def body(self, url: str) -> bytes:
+        with open(self._paths(url)[1], "rb") as f:
+            return f.read()
+
+    def touch(self, meta: dict, revalidated: bool = False):
+        """마지막 사용 시각 갱신 (304로 재검증됐으면 저장 시각도 갱신)"""
+        now = time.time()
+        meta["accessed_at"] = now
+        if revalidated:
+            meta["stored_at"] = now
+        with self._lock:
+            self._write_meta(self._paths(meta["url"])[0], meta)
+
+    def store(self, url: str, headers: dict, body: bytes):
+        """200 응답 저장 (이전 추출 결과는 폐기)"""
+        meta_path, body_path = self._paths(url)
+        now = time.time()
+        meta = {
+            "url": url,
+            "etag": headers.get("etag"),
+            "last_modified": headers.get("last-modified"),
+            "stored_at": now,
+            "accessed_at": now,
+            "extracted": {},
+        }
+        with self._lock:
+            with open(body_path, "wb") as f:
+                f.write(body)
+            self._write_meta(meta_path, meta)
+
+    def extracted(self, resp, name: str, extract):
+        """
+        응답에서 추출한 결과 재사용
+        resp가 캐시에서 나온 응답(TTL 이내 또는 304)이고 같은 이름의 추출 결과가 있으면 그대로 반환,
+        아니면 extract(html)을 실행해 저장 (결과는 JSON 직렬화 가능해야 함)
+        """
+        meta = getattr(resp, "cache_meta", None)
+        if meta is None:
+            return extract(resp.text())
+        if resp.cached and name in meta["extracted"]:
+            return meta["extracted"][name]
+        result = extract(resp.text())
+        meta["extracted"][name] = result
+        with self._lock:
+            self._write_meta(self._paths(meta["url"])[0], meta)
+        return result
+
+    def evict(self):
+        """전체 크기가 max_bytes 이하가 될 때까지 LRU 순으로 삭제"""
+        entries = []
+        total = 0
+        for name in os.listdir(self.directory):
+            if not name.endswith(".json"):
+                continue
+            meta_path = os.path.join(self.directory, name)
+            body_path = meta_path[:-len(".json")] + ".body"
+            try:
+                size = os.path.getsize(meta_path) + os.path.getsize(body_path)
+                with open(meta_path, encoding="utf-8") as f:
+                    accessed = json.load(f).get("accessed_at", 0)
+            except (OSError, ValueError):
+                size, accessed = 0, 0
+            entries.append((accessed, size, meta_path, body_path))
+            total += size
+
+        entries.sort()
+        removed = 0
+        for accessed, size, meta_path, body_path in entries:
+            if total <= self.max_bytes:
+                break
+            for path in (meta_path, body_path):
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+            total -= size
+            removed += 1
+        if removed:
+            print(f"[CACHE] Evicted {removed} entries ({total:,} bytes kept)")
@@ -0,0 +1,359 @@
+"""
+공용 HTTP 클라이언트 - fetch_videos.py / fetch_tiktok.py에서 함께 사용
+
+- 호스트별 keep-alive 커넥션 풀 (같은 호스트 재요청 시 TCP+TLS 재사용)
+- gzip / deflate 압축 협상 (brotli 모듈이 있으면 br도)
+- 응답 크기 상한 (압축 해제 후 기준)
+- 두 스크립트가 복사해 쓰던 User-Agent / 헤더 프로필 통합
+- 전송 바이트(wire) vs 디코딩 바이트 통계
+- 블로킹 요청은 제한된 스레드 풀에서 실행해 asyncio에서 사용
+- ResponseCache를 붙이면 ttl을 준 GET 요청은 조건부 요청 + 디스크 캐시 사용
+- on_chunk 콜백으로 본문을 받는 중에 처리, 콜백이 True를 반환하면 나머지는 받지 않음
+- telemetry(Telemetry)를 주면 요청마다 상태 / DNS / 연결 / TTFB / 전체 시간 / 바이트 기록
+- upstream을 주면 모든 요청을 그 주소로 보내고 원래 호스트는 X-Upstream-Host로 전달
+  (bench/의 로컬 스탠드인 서버 등 오프라인 테스트용)
+"""
+
+import asyncio
+import codecs
+import http.client
+import contextvars
+import json
+import socket
+import ssl
+import threading
+import time
+import urllib.parse
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+# 헤더 프로필
+PROFILES = {
+    "browser": {
+        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 Chrome/120.0.0.0",
+        "Accept": "text/html,application/xhtml+xml",
+    },
+    "simple": {
+        "User-Agent": "Mozilla/5.0",
+    },
+    "json": {
+        "User-Agent": "Mozilla/5.0",
+        "Accept": "application/json",
+        "Content-Type": "application/json",
+    },
+}
+
+ACCEPT_ENCODING = "gzip, deflate, br" if brotli else "gzip, deflate"
+
+# 응답 본문 상한 (압축 해제 후)
+MAX_RESPONSE_BYTES = 8 * 1024 * 1024
+
+MAX_REDIRECTS = 5
+CHUNK_SIZE = 64 * 1024
+
+# 연결이 끊긴 재사용 커넥션은 한 번 다시 시도
+_STALE_ERRORS = (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError)
+
+
+class HttpError(Exception):
+    """4xx/5xx 응답"""
+
+    def __init__(self, status: int, reason: str, url: str):
+        super().__init__(f"HTTP Error {status}: {reason}")
+        self.status = status
+        self.reason = reason
+        self.url = url
+
+
+class ResponseTooLarge(Exception):
+    """응답이 max_bytes를 넘음"""
+
+
+class Response:
+    def __init__(self, url: str, status: int, headers: dict, body: bytes, wire_bytes: int):
+        self.url = url
+        self.status = status
+        self.headers = headers
+        self.body = body
+        self.wire_bytes = wire_bytes
+        # on_chunk가 중간에 멈췄으면 False
+        self.complete = True
+        # 캐시에서 나온 응답이면 True (TTL 이내 또는 304 재검증)
+        self.cached = False
+        self.cache_meta = None
+        # 텔레메트리 레코드 (실제로 요청을 보낸 응답만)
+        self.telemetry = None
+
+    def text(self) -> str:
+        return self.body.decode("utf-8", errors="ignore")
+
+    def json(self):
+        return json.loads(self.body)
+
+
+class _Decoder:
+    """Content-Encoding에 맞춰 청크 단위로 압축 해제"""
+
+    def __init__(self, encoding: str):
+        self.encoding = encoding
+        if encoding == "gzip":
+            self._z = zlib.decompressobj(16 + zlib.MAX_WBITS)
+        elif encoding == "deflate":
+            self._z = None  # zlib 헤더 유무를 첫 청크에서 판단
+        elif encoding == "br" and brotli:
+            self._z = brotli.Decompressor()
+        else:
+            self._z = None
+
+    def feed(self, data: bytes) -> bytes:
+        if self.encoding == "deflate" and self._z is None:
+            wbits = zlib.MAX_WBITS if data[:1] == b"\x78" else -zlib.MAX_WBITS
+            self._z = zlib.decompressobj(wbits)
+        if self._z is None:
+            return data
+        if self.encoding == "br":
+            return self._z.process(data)
+        return self._z.decompress(data)
+
+    def flush(self) -> bytes:
+        if self._z is None or self.encoding == "br":
+            return b""
+        return self._z.flush()
+
+
+def _ms(started: float) -> float:
+    return round((time.perf_counter() - started) * 1000, 1)
+
+
+class HttpClient:
+    def __init__(self, workers: int = 16, max_idle_per_host: int = 4,
+                 max_bytes: int = MAX_RESPONSE_BYTES, cache=None, telemetry=None,
+                 upstream: str = None):
+        self.max_idle_per_host = max_idle_per_host
+        self.max_bytes = max_bytes
+        self.cache = cache
+        self.telemetry = telemetry
+        self.upstream = urllib.parse.urlsplit(upstream) if upstream else None
+        self._idle = {}
+        self._lock = threading.Lock()
+        self._ssl = ssl.create_default_context()
+        self._pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="http")
+        self.stats = {"requests": 0, "reused": 0, "wire_bytes": 0, "decoded_bytes": 0,
+                      "cache_hits": 0, "not_modified": 0}
+
+    # --- 커넥션 풀 ---
+
+    def _checkout(self, key: tuple, timeout: float):
+        with self._lock:
+            idle = self._idle.get(key)
+            conn = idle.pop() if idle else None
+        if conn is not None:
+            if conn.sock is not None:
+                conn.sock.settimeout(timeout)
+            return conn, True
+        scheme, host, port = key
+        if scheme == "https":
+            conn = http.client.HTTPSConnection(host, port, timeout=timeout, context=self._ssl)
+        else:
+            conn = http.client.HTTPConnection(host, port, timeout=timeout)
+        return conn, False
+
+    def _checkin(self, key: tuple, conn):
+        with self._lock:
+            idle = self._idle.setdefault(key, [])
+            if len(idle) < self.max_idle_per_host:
+                idle.append(conn)
+                return
+        conn.close()
+
+    def _connect(self, conn, timing: dict):
+        """DNS 조회와 연결(TCP + TLS)을 따로 재면서 연결"""
+        def create_connection(address, timeout, source_address=None):
+            started = time.perf_counter()
+            infos = socket.getaddrinfo(address[0], address[1], 0, socket.SOCK_STREAM)
+            timing["dns_ms"] = _ms(started)
+            error = None
+            for *_, sockaddr in infos:
+                try:
+                    return socket.create_connection(sockaddr[:2], timeout, source_address)
+                except OSError as e:
+                    error = e
+            raise error
+
+        conn._create_connection = create_connection
+        started = time.perf_counter()
+        conn.connect()
+        timing["connect_ms"] = round(_ms(started) - (timing["dns_ms"] or 0), 1)
+
+    def close(self):
+        with self._lock:
+            conns = [c for idle in self._idle.values() for c in idle]
+            self._idle.clear()
+        for conn in conns:
+            conn.close()
+        self._pool.shutdown(wait=False, cancel_futures=True)
+        if self.cache:
+            self.cache.evict()
+
+    # --- 요청 ---
+
+    def _read_body(self, resp, url: str, on_chunk=None):
+        """(본문, 전송 바이트, 끝까지 받았는지)"""
+        decoder = _Decoder(resp.getheader("Content-Encoding", "").strip().lower())
+        # 리다이렉트 / 에러 본문은 콜백에 넘기지 않음
+        text = codecs.getincrementaldecoder("utf-8")("ignore") if on_chunk and resp.status == 200 else None
+        chunks = []
+        wire = decoded = 0
+        while True:
+            data = resp.read(CHUNK_SIZE)
+            if not data:
+                break
+            wire += len(data)
+            out = decoder.feed(data)
+            decoded += len(out)
+            if decoded > self.max_bytes:
+                raise ResponseTooLarge(f"{url}: over {self.max_bytes} bytes")
+            chunks.append(out)
+            if text is not None and on_chunk(text.decode(out)):
+                return b"".join(chunks), wire, False
+        tail = decoder.flush()
+        chunks.append(tail)
+        if text is not None:
+            on_chunk(text.decode(tail, final=True))
+        return b"".join(chunks), wire, True
+
+    def _send(self, method: str, url: str, headers: dict, data: bytes, timeout: float,
+              on_chunk=None) -> Response:
+        parts = urllib.parse.urlsplit(url)
+        host = parts.hostname
+        path = parts.path or "/"
+        if parts.query:
+            path += "?" + parts.query
+        if self.upstream:
+            headers = dict(headers, **{"X-Upstream-Host": parts.netloc})
+            parts = self.upstream
+        port = parts.port or (443 if parts.scheme == "https" else 80)
+        key = (parts.scheme, parts.hostname, port)
+
+        started = time.perf_counter()
+        timing = {"dns_ms": None, "connect_ms": None, "ttfb_ms": None}
+        reused = False
+        try:
+            for attempt in range(2):
+                conn, reused = self._checkout(key, timeout)
+                try:
+                    if conn.sock is None:
+                        self._connect(conn, timing)
+                    conn.request(method, path, body=data, headers=headers)
+                    resp = conn.getresponse()
+                    timing["ttfb_ms"] = _ms(started)
+                    body, wire, complete = self._read_body(resp, url, on_chunk)
+                except _STALE_ERRORS:
+                    conn.close()
+                    if reused and attempt == 0:
+                        continue
+                    raise
+                except Exception:
+                    conn.close()
+                    raise
+                break
+        except Exception as e:
+            if self.telemetry is not None:
+                self.telemetry.record(host=host, method=method, status=None, reused=reused,
+                                      total_ms=_ms(started), bytes=0, error=type(e).__name__, **timing)
+            raise
+
+        if resp.will_close or not complete:
+            conn.close()
+        else:
+            self._checkin(key, conn)
+
+        with self._lock:
+            self.stats["requests"] += 1
+            self.stats["reused"] += int(reused)
+            self.stats["wire_bytes"] += wire
+            self.stats["decoded_bytes"] += len(body)
+
+        response_headers = {k.lower(): v for k, v in resp.getheaders()}
+        response = Response(url, resp.status, response_headers, body, wire)
+        response.complete = complete
+        if self.telemetry is not None:
+            response.telemetry = self.telemetry.record(
+                host=host, method=method, status=resp.status, reused=reused,
+                total_ms=_ms(started), bytes=wire, **timing)
+        return response
+
+    def _from_cache(self, url: str, meta: dict, revalidated: bool) -> Response:
+        self.cache.touch(meta, revalidated)
+        resp = Response(url, 200, {}, self.cache.body(url), 0)
+        resp.cached = True
+        resp.cache_meta = meta
+        with self._lock:
+            self.stats["not_modified" if revalidated else "cache_hits"] += 1
+        return resp
+
+    def request(self, method: str, url: str, headers: dict = None, data: bytes = None,
+                timeout: float = 15, profile: str = "browser", ttl: float = None,
+                on_chunk=None) -> Response:
+        """
+        블로킹 요청 (리다이렉트 추적, 4xx/5xx는 HttpError)
+        ttl: 캐시를 쓸 GET 요청이면 초 단위 신선도 (0이면 항상 조건부 재검증)
+        on_chunk: 200 응답 본문을 디코딩된 문자열 청크로 받는 콜백 (캐시 응답이면 호출되지 않음)
+        """
+        merged = dict(PROFILES[profile])
+        merged["Accept-Encoding"] = ACCEPT_ENCODING
+        merged.update(headers or {})
+
+        cache_url = url if self.cache and method == "GET" and ttl is not None else None
+        meta = self.cache.lookup(cache_url) if cache_url else None
+        if meta:
+            if self.cache.is_fresh(meta, ttl):
+                return self._from_cache(cache_url, meta, revalidated=False)
+            merged.update(self.cache.validators(meta))
+
+        for _ in range(MAX_REDIRECTS + 1):
+            resp = self._send(method, url, merged, data, timeout, on_chunk)
+            if resp.status == 304 and meta:
+                return self._from_cache(cache_url, meta, revalidated=True)
+            location = resp.headers.get("location")
+            if resp.status in (301, 302, 303, 307, 308) and location:
+                url = urllib.parse.urljoin(url, location)
+                if resp.status == 303 or (resp.status in (301, 302) and method == "POST"):
+                    method, data = "GET", None
+                continue
+            if resp.status >= 400:
+                if resp.telemetry is not None:
+                    resp.telemetry["error"] = "HttpError"
+                reason = http.client.responses.get(resp.status, "")
+                raise HttpError(resp.status, reason, url)
+            if cache_url and resp.status == 200:
+                self.cache.store(cache_url, resp.headers, resp.body)
+                resp.cache_meta = self.cache.lookup(cache_url)
+            return resp
+        raise HttpError(resp.status, "Too many redirects", url)
+
+    async def fetch(self, url: str, headers: dict = None, data: bytes = None,
+                    timeout: float = 15, profile: str = "browser", ttl: float = None,
+                    on_chunk=None) -> Response:
+        """이벤트 루프를 막지 않도록 스레드 풀에서 요청 (contextvars는 그대로 넘김)"""
+        method = "POST" if data is not None else "GET"
+        loop = asyncio.get_running_loop()
+        context = contextvars.copy_context()
+        return await loop.run_in_executor(
+            self._pool, lambda: context.run(
+                self.request, method, url, headers, data, timeout, profile, ttl, on_chunk))
+
+    async def get_text(self, url: str, **kwargs) -> str:
+        return (await self.fetch(url, **kwargs)).text()
+
+    def summary(self) -> str:
+        s = self.stats
+        saved = 1 - s["wire_bytes"] / s["decoded_bytes"] if s["decoded_bytes"] else 0
+        return (f"{s['requests']} requests ({s['reused']} reused connections), "
+                f"{s['wire_bytes']:,} bytes on the wire / {s['decoded_bytes']:,} decoded "
+                f"({saved:.0%} saved), cache: {s['cache_hits']} fresh / {s['not_modified']} not modified")
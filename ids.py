@@ -0,0 +1,33 @@
+"""
+영상 ID 규칙 - 같은 영상은 실행이 바뀌어도 같은 ID
+
+- video.twimg.com의 amplify_video/<id>, ext_tw_video/<id> 경로면 숫자 미디어 ID를 그대로 사용
+- 숫자 ID가 없으면 (쿼리 제외) URL의 BLAKE2b 다이제스트를 고정 20자리 10진수로
+- 트윗 ID(TWEET_PATTERN)와 같은 10진수 문자열 네임스페이스를 공유
+  트윗/미디어 ID는 63비트 스노플레이크라 최대 19자리이고, 다이제스트 ID는 항상 20자리라 겹치지 않음
+"""
+
+import hashlib
+import re
+
+MEDIA_ID_PATTERN = re.compile(r'/(?:amplify_video|ext_tw_video)/(\d+)/')
+
+DIGEST_ID_WIDTH = 20
+_DIGEST_MIN = 10 ** (DIGEST_ID_WIDTH - 1)
+
+
+def media_id(url: str):
+    """twimg 미디어 ID (없으면 None)"""
+    match = MEDIA_ID_PATTERN.search(url)
+    return match.group(1) if match else None
+
+
+def digest_id(text: str) -> str:
+    """고정 20자리 다이제스트 ID (스노플레이크 범위 밖)"""
+    digest = int.from_bytes(hashlib.blake2b(text.encode("utf-8"), digest_size=8).digest(), "big")
+    return str(_DIGEST_MIN + digest % (9 * _DIGEST_MIN))
+
+
+def video_id(url: str) -> str:
+    """영상 URL의 안정적인 ID"""
+    return media_id(url) or digest_id(url.split("?", 1)[0])
@@ -0,0 +1,124 @@
+"""
+TikTok 영상 생존 확인 - 죽은 링크를 공개 목록에서 제외
+
+- oEmbed(작은 JSON)로 영상마다 확인, 실제 사용자명 / 제목도 함께 얻음
+- 공용 HTTP 클라이언트의 커넥션 풀 위에서 동시 요청 수 제한
+- 결과는 TTL 캐시(tiktok_liveness.json)에 저장해 영상마다 하루 한 번만 재확인
+- 전체 소요 시간은 deadline으로 제한 (확인하지 못한 영상은 그대로 유지)
+"""
+
+import asyncio
+import json
+import os
+import time
+import urllib.parse
+
+from http_client import HttpError
+
+LIVENESS_PATH = "tiktok_liveness.json"
+LIVENESS_TTL = 24 * 3600
+
+OEMBED_URL = "https://www.tiktok.com/oembed?url="
+VERIFY_CONCURRENCY = 16
+VERIFY_DEADLINE = 60.0
+PROBE_TIMEOUT = 10
+
+# 이 상태 코드면 영상이 없는 것으로 판단 (그 외 오류는 판단 보류)
+DEAD_STATUSES = (400, 404, 410)
+
+
+class LivenessCache:
+    def __init__(self, path: str = LIVENESS_PATH, ttl: float = LIVENESS_TTL):
+        self.path = path
+        self.ttl = ttl
+        self.entries = {}
+        try:
+            with open(path, encoding="utf-8") as f:
+                self.entries = json.load(f)
+        except (OSError, ValueError):
+            pass
+
+    def get(self, video_id: str):
+        entry = self.entries.get(video_id)
+        if entry and time.time() - entry["checked_at"] < self.ttl:
+            return entry
+        return None
+
+    def put(self, video_id: str, alive: bool, username: str = "", title: str = ""):
+        self.entries[video_id] = {
+            "alive": alive,
+            "username": username,
+            "title": title,
+            "checked_at": time.time(),
+        }
+
+    def save(self):
+        # 만료된 항목은 버림
+        now = time.time()
+        entries = {k: v for k, v in self.entries.items() if now - v["checked_at"] < self.ttl}
+        tmp = f"{self.path}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(entries, f, ensure_ascii=False, indent=2, sort_keys=True)
+        os.replace(tmp, self.path)
+
+
+async def probe_tiktok(client, video: dict, cache: LivenessCache):
+    """oEmbed로 확인 후 캐시에 기록, 판단할 수 없으면 아무것도 기록하지 않음"""
+    url = OEMBED_URL + urllib.parse.quote(video["url"], safe="")
+    try:
+        data = (await client.fetch(url, timeout=PROBE_TIMEOUT, profile="simple")).json()
+    except HttpError as e:
+        if e.status in DEAD_STATUSES:
+            cache.put(video["id"], False)
+        return
+    except Exception:
+        # 네트워크 오류 / 잘못된 JSON은 판단 보류
+        return
+    username = data.get("author_unique_id") or ""
+    cache.put(video["id"], bool(data.get("html") or username), username, (data.get("title") or "")[:80])
+
+
+def _apply(video: dict, entry: dict) -> dict:
+    """확인된 사용자명 / 제목 반영 (@a 같은 임시 사용자명 교체)"""
+    video = dict(video)
+    if entry["username"]:
+        video["username"] = entry["username"]
+        video["url"] = f"https://www.tiktok.com/@{entry['username']}/video/{video['id']}"
+    if entry["title"] and not video.get("title"):
+        video["title"] = entry["title"]
+    return video
+
+
+async def verify_tiktok(client, videos: list, cache: LivenessCache,
+                        concurrency: int = VERIFY_CONCURRENCY, deadline: float = VERIFY_DEADLINE):
+    """(살아 있는 영상 목록, 죽은 영상 ID 목록) - 확인하지 못한 영상은 살아 있는 쪽에 포함"""
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def probe(video):
+        async with semaphore:
+            await probe_tiktok(client, video, cache)
+
+    pending = [v for v in videos if cache.get(v["id"]) is None]
+    print(f"[VERIFY] {len(videos) - len(pending)} cached, probing {len(pending)} "
+          f"(concurrency={concurrency}, deadline={deadline:g}s)")
+
+    if pending:
+        tasks = [asyncio.create_task(probe(v)) for v in pending]
+        _, unfinished = await asyncio.wait(tasks, timeout=deadline)
+        for task in unfinished:
+            task.cancel()
+        if unfinished:
+            print(f"[VERIFY] Deadline reached, {len(unfinished)} left unverified")
+
+    alive, dead = [], []
+    for video in videos:
+        entry = cache.get(video["id"])
+        if entry is None:
+            alive.append(video)
+        elif entry["alive"]:
+            alive.append(_apply(video, entry))
+        else:
+            dead.append(video["id"])
+
+    print(f"[VERIFY] {len(alive)} kept, {len(dead)} dead")
+    return alive, dead
@@ -0,0 +1,108 @@
+"""
+twimg 미디어 정규화 - 실제 영상 하나당 레코드 하나
+
+- 같은 amplify_video/<id>, ext_tw_video/<id>의 해상도(vid/avc1/<WxH>) / ?tag= 변형을 미디어 키로 묶음
+- 미디어 키마다 정책에 따라 변형 하나 선택 (최대 해상도, 또는 max_pixels 이하에서 최대)
+- 페이지 안에서 가까이 있는 트윗 링크를 미디어에 연결하고, 연결된 트윗 레코드는 제거
+"""
+
+import bisect
+import re
+
+from ids import video_id
+
+RESOLUTION_PATTERN = re.compile(r'/(\d{2,5})x(\d{2,5})/')
+TWEET_ID_PATTERN = re.compile(r'/status/(\d+)')
+
+# 미디어 URL과 트윗 링크가 이 글자 수 이내면 같은 항목으로 봄
+LINK_WINDOW = 1500
+
+
+def media_key(url: str) -> str:
+    return video_id(url)
+
+
+def pixels(url: str) -> int:
+    """경로의 WxH 해상도 (없으면 0)"""
+    match = RESOLUTION_PATTERN.search(url)
+    return int(match.group(1)) * int(match.group(2)) if match else 0
+
+
+def select_variant(urls: list, max_pixels: int = None) -> str:
+    """
+    max_pixels가 없으면 최대 해상도,
+    있으면 그 이하 중 최대 (모두 넘으면 가장 작은 것), 같으면 먼저 나온 것
+    """
+    if max_pixels is None:
+        return max(urls, key=pixels)
+    fitting = [u for u in urls if pixels(u) <= max_pixels]
+    if fitting:
+        return max(fitting, key=pixels)
+    return min(urls, key=pixels)
+
+
+def link_tweets(matches: list) -> dict:
+    """
+    추출기 매치 목록에서 미디어 키 -> 가장 가까운 트윗 매치
+    (트윗 하나는 미디어 하나에만, 거리가 가까운 쌍부터 연결)
+    """
+    media = [m for m in matches if m.kind == "twimg"]
+    tweets = sorted((m for m in matches if m.kind == "tweet"), key=lambda t: t.pos)
+    positions = [t.pos for t in tweets]
+    pairs = []
+    for i, m in enumerate(media):
+        lo = bisect.bisect_left(positions, m.pos - LINK_WINDOW)
+        hi = bisect.bisect_right(positions, m.pos + LINK_WINDOW)
+        pairs.extend((abs(m.pos - positions[j]), i, j) for j in range(lo, hi))
+    pairs.sort()
+    links = {}
+    used = set()
+    for _, i, j in pairs:
+        key = media[i].id
+        if key in links or j in used:
+            continue
+        links[key] = tweets[j]
+        used.add(j)
+    return links
+
+
+def canonicalize(matches: list, max_pixels: int = None):
+    """
+    한 페이지의 매치를 미디어 단위로 정리
+    반환: ([(미디어 키, 선택된 URL, 연결된 트윗 매치 또는 None)], [연결되지 않은 트윗 매치])
+    """
+    variants = {}
+    for m in matches:
+        if m.kind == "twimg":
+            variants.setdefault(m.id, []).append(m.url)
+    links = link_tweets(matches)
+    linked = {t.id for t in links.values()}
+    media = [(key, select_variant(urls, max_pixels), links.get(key)) for key, urls in variants.items()]
+    tweets = [m for m in matches if m.kind == "tweet" and m.id not in linked]
+    return media, tweets
+
+
+def tweet_id_of(record):
+    """레코드(dict / Video)의 tweet_url에서 트윗 ID"""
+    url = record.get("tweet_url") or ""
+    match = TWEET_ID_PATTERN.search(url)
+    return match.group(1) if match else None
+
+
+def merge_variants(max_pixels: int = None):
+    """같은 미디어 키 레코드가 여러 소스에서 오면 정책에 맞는 변형 / 연결된 트윗을 합침"""
+    def merge(existing, new):
+        if not (existing.get("video_url") and new.get("video_url")):
+            return existing
+        existing.video_url = select_variant([existing.video_url, new.video_url], max_pixels)
+        if tweet_id_of(existing) is None and tweet_id_of(new):
+            existing.tweet_url = new.tweet_url
+        return existing
+    return merge
+
+
+def drop_linked_tweets(records: list) -> list:
+    """미디어 레코드에 연결된 트윗의 트윗 전용 레코드(video_url 없음) 제거"""
+    linked = {tweet_id_of(r) for r in records if r.get("video_url")}
+    linked.discard(None)
+    return [r for r in records if r.get("video_url") or r["id"] not in linked]
@@ -0,0 +1,160 @@
+"""
+미러 관리 - Nitter / ProxiTok 같은 미러 목록용 공용 도구
+
+1. 미러 레이스: 가장 먼저 실제 컨텐츠를 돌려준 응답을 사용
+   - fanout개의 미러에 동시에 요청 (hedge_delay > 0이면 간격을 두고 순차 추가)
+   - 실패한 미러는 곧바로 다음 미러로 교체
+   - 첫 성공 응답을 받으면 나머지 요청은 취소
+   - deadline(초)이 지나면 레이스 전체를 포기
+2. 미러 상태 기록 (mirror_health.json)
+   - 미러별 EWMA 지연시간 / 성공률 / 마지막 성공 시각 / 페이지당 결과 수
+   - 초당 기대 결과 수 순으로 미러 정렬
+   - 연속 실패한 미러는 서킷 브레이커로 건너뛰고, 지수적으로 늘어나는 간격으로 재시도
+"""
+
+import asyncio
+import json
+import os
+import time
+
+HEALTH_PATH = "mirror_health.json"
+
+# EWMA 가중치 (최근 결과 반영 비율)
+EWMA_ALPHA = 0.3
+
+# 처음 보는 미러의 기본값 (낙관적으로 잡아서 한 번은 시도되게)
+PRIOR_LATENCY_MS = 3000.0
+PRIOR_SUCCESS = 1.0
+PRIOR_YIELD = 10.0
+
+# 서킷 브레이커: 연속 BREAKER_FAILURES회 실패하면 열림
+# 재시도 간격은 BREAKER_BASE_SECONDS부터 2배씩 늘어나고 BREAKER_MAX_SECONDS에서 멈춤
+BREAKER_FAILURES = 3
+BREAKER_BASE_SECONDS = 30 * 60
+BREAKER_MAX_SECONDS = 7 * 24 * 3600
+
+
+class MirrorHealth:
+    """미러별 상태를 디스크에 저장하고 우선순위를 계산"""
+
+    def __init__(self, path: str = HEALTH_PATH):
+        self.path = path
+        self.mirrors = {}
+        try:
+            with open(path, encoding="utf-8") as f:
+                self.mirrors = json.load(f).get("mirrors", {})
+        except (OSError, ValueError):
+            pass
+
+    def stats(self, mirror: str) -> dict:
+        return self.mirrors.setdefault(mirror, {
+            "latency_ms": PRIOR_LATENCY_MS,
+            "success_rate": PRIOR_SUCCESS,
+            "yield": PRIOR_YIELD,
+            "last_success": None,
+            "failures": 0,
+            "retry_at": 0,
+        })
+
+    def record(self, mirror: str, ok: bool, latency: float, items: int = 0):
+        """요청 결과 기록 (latency: 초, items: 추출된 결과 수)"""
+        s = self.stats(mirror)
+        now = time.time()
+        s["latency_ms"] += EWMA_ALPHA * (latency * 1000 - s["latency_ms"])
+        s["success_rate"] += EWMA_ALPHA * ((1.0 if ok else 0.0) - s["success_rate"])
+        if ok:
+            s["yield"] += EWMA_ALPHA * (items - s["yield"])
+            s["last_success"] = now
+            s["failures"] = 0
+            s["retry_at"] = 0
+        else:
+            s["failures"] += 1
+            if s["failures"] >= BREAKER_FAILURES:
+                backoff = BREAKER_BASE_SECONDS * 2 ** (s["failures"] - BREAKER_FAILURES)
+                s["retry_at"] = now + min(backoff, BREAKER_MAX_SECONDS)
+
+    def expected_rate(self, mirror: str) -> float:
+        """초당 기대 결과 수"""
+        s = self.stats(mirror)
+        return s["success_rate"] * s["yield"] / max(s["latency_ms"] / 1000, 0.05)
+
+    def order(self, mirrors: list) -> list:
+        """브레이커가 닫힌(또는 재시도 시점이 된) 미러를 기대 효율 순으로 정렬"""
+        now = time.time()
+        available = [m for m in mirrors if self.stats(m)["retry_at"] <= now]
+        if not available and mirrors:
+            # 전부 차단된 경우에도 재시도 시점이 가장 가까운 미러 하나는 탐색
+            available = [min(mirrors, key=lambda m: self.stats(m)["retry_at"])]
+        skipped = len(mirrors) - len(available)
+        if skipped:
+            print(f"[HEALTH] Skipping {skipped} circuit-broken mirrors")
+        return sorted(available, key=self.expected_rate, reverse=True)
+
+    def save(self):
+        tmp = f"{self.path}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump({"mirrors": self.mirrors}, f, ensure_ascii=False, indent=2, sort_keys=True)
+        os.replace(tmp, self.path)
+
+
+async def race(mirrors: list, fetch, *, fanout: int = 3, hedge_delay: float = 0.0,
+               deadline: float = 30.0, label: str = "RACE", health: MirrorHealth = None):
+    """
+    mirrors: 우선순위 순서의 미러 목록 (health가 있으면 상태 기록 순으로 재정렬)
+    fetch: async fetch(mirror) -> 결과 (비어 있으면 실패로 간주)
+    반환: (mirror, 결과) / 모두 실패하면 (None, None)
+    """
+    queue = health.order(mirrors) if health else list(mirrors)
+    running = {}
+    launched_at = {}
+    started = time.monotonic()
+    next_launch = started
+
+    def launch():
+        mirror = queue.pop(0)
+        task = asyncio.create_task(fetch(mirror))
+        running[task] = mirror
+        launched_at[task] = time.monotonic()
+
+    try:
+        while queue or running:
+            now = time.monotonic()
+            remaining = deadline - (now - started)
+            if remaining <= 0:
+                print(f"[{label}] Deadline {deadline:g}s reached")
+                if health:
+                    # 마감까지 응답하지 못한 미러는 타임아웃으로 기록
+                    for task, mirror in running.items():
+                        health.record(mirror, False, now - launched_at[task])
+                break
+
+            # 헤지: fanout 한도 안에서 hedge_delay 간격으로 미러 추가
+            while queue and len(running) < fanout and now >= next_launch:
+                launch()
+                next_launch = now + hedge_delay
+
+            wait_for = remaining
+            if queue and len(running) < fanout:
+                wait_for = min(wait_for, max(next_launch - now, 0))
+
+            done, _ = await asyncio.wait(running, timeout=wait_for,
+                                         return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                mirror = running.pop(task)
+                try:
+                    result = task.result()
+                except Exception as e:
+                    print(f"[{label}] {mirror}: {str(e)[:30]}")
+                    result = None
+                if health:
+                    latency = time.monotonic() - launched_at[task]
+                    health.record(mirror, bool(result), latency, len(result or ()))
+                if result:
+                    return mirror, result
+                # 실패한 자리는 헤지 지연 없이 바로 채움
+                next_launch = time.monotonic()
+    finally:
+        for task in running:
+            task.cancel()
+
+    return None, None
@@ -0,0 +1,86 @@
+"""
+공개 파일 작성 - 내용이 그대로면 파일을 건드리지 않음
+
+- 변경 판단: updated_at을 뺀 내용을 키 정렬 / 공백 없는 JSON으로 만든 sha256 (canonical hash)
+- 바뀌었을 때만 임시 파일 + os.replace로 원자적으로 교체 (읽는 쪽이 쓰다 만 파일을 보지 않음)
+- JSON은 보기 좋은 파일 옆에 변형도 함께 작성
+  - .min.json: 공백 없는 JSON
+  - .ndjson: 레코드 한 줄에 하나 (스트리밍으로 읽는 쪽)
+  - .json.gz: 보기 좋은 파일을 미리 압축 (gzip_static 등에서 그대로 서빙)
+"""
+
+import gzip
+import hashlib
+import json
+import os
+
+# 실행마다 바뀌므로 변경 판단에서 제외하는 필드
+VOLATILE_FIELDS = ("updated_at",)
+
+
+def canonical_hash(data) -> str:
+    if isinstance(data, dict):
+        data = {k: v for k, v in data.items() if k not in VOLATILE_FIELDS}
+    body = json.dumps(data, ensure_ascii=False, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(body.encode("utf-8")).hexdigest()
+
+
+def write_atomic(path: str, body: bytes):
+    tmp = f"{path}.tmp"
+    with open(tmp, "wb") as f:
+        f.write(body)
+    os.replace(tmp, path)
+
+
+def variant_paths(path: str, records_key: str = None) -> list:
+    base = path[:-len(".json")] if path.endswith(".json") else path
+    paths = [f"{base}.min.json", f"{path}.gz"]
+    if records_key:
+        paths.append(f"{base}.ndjson")
+    return paths
+
+
+def _unchanged(path: str, data) -> bool:
+    try:
+        with open(path, encoding="utf-8") as f:
+            return canonical_hash(json.load(f)) == canonical_hash(data)
+    except (OSError, ValueError):
+        return False
+
+
+def write_json(path: str, data: dict, records_key: str = None) -> bool:
+    """
+    내용이 바뀌었으면 JSON + 변형 파일을 원자적으로 쓰고 True
+    records_key: .ndjson으로 한 줄씩 쓸 레코드 목록의 키 (없으면 .ndjson 생략)
+    """
+    paths = variant_paths(path, records_key)
+    if _unchanged(path, data) and all(os.path.exists(p) for p in paths):
+        print(f"[OUTPUT] {path}: unchanged, skipped")
+        return False
+
+    pretty = json.dumps(data, ensure_ascii=False, indent=2).encode("utf-8")
+    minified = json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    base = paths[0][:-len(".min.json")]
+    write_atomic(f"{base}.min.json", minified)
+    # mtime=0: 같은 내용이면 같은 바이트
+    write_atomic(f"{path}.gz", gzip.compress(pretty, mtime=0))
+    if records_key:
+        lines = (json.dumps(r, ensure_ascii=False, separators=(",", ":")) for r in data[records_key])
+        write_atomic(f"{base}.ndjson", "".join(f"{line}\n" for line in lines).encode("utf-8"))
+    # 보기 좋은 파일을 마지막에 (변경 판단 기준이므로 변형이 모두 써진 뒤에)
+    write_atomic(path, pretty)
+    print(f"[OUTPUT] {path}: written ({len(pretty):,} bytes, {len(minified):,} minified)")
+    return True
+
+
+def write_text(path: str, text: str) -> bool:
+    """내용이 바뀌었으면 원자적으로 쓰고 True"""
+    body = text.encode("utf-8")
+    try:
+        with open(path, "rb") as f:
+            if f.read() == body:
+                return False
+    except OSError:
+        pass
+    write_atomic(path, body)
+    return True
@@ -0,0 +1,217 @@
+"""
+수집 소스 프레임워크 + 공용 스케줄러 (fetch_videos.py / fetch_tiktok.py에서 함께 사용)
+
+- Source: name / priority / retries를 정하고 stream()에서 영상 레코드를 하나씩 내보내는 작은 클래스
+- Scheduler: 모든 소스의 요청에 같은 정책 적용
+  - 호스트별 동시 요청 수 제한 + 전체 동시 요청 수 제한 (자리가 나면 우선순위가 높은 소스부터)
+  - 호스트별 token bucket 속도 제한
+  - 일시적인 오류(연결 오류, 타임아웃, 429 / 5xx)는 jitter를 준 지수 backoff로 재시도
+- 새 미러 / 플랫폼은 Source 하위 클래스 하나로 추가
+- 소스에서 난 예외는 로그만 남기고 그때까지 나온 레코드는 유지
+"""
+
+import asyncio
+import contextlib
+import heapq
+import http.client
+import itertools
+import random
+import time
+import urllib.parse
+
+from http_client import HttpError
+
+# 호스트별 기본값 (Scheduler의 host_limits / rates로 호스트마다 덮어씀)
+DEFAULT_HOST_CONCURRENCY = 4
+DEFAULT_RATE = 5.0   # 초당 요청 수
+DEFAULT_BURST = 10
+
+DEFAULT_RETRIES = 2
+BACKOFF_BASE = 0.5   # 초, 재시도마다 두 배 (full jitter)
+
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+
+def is_retryable(error: Exception) -> bool:
+    if isinstance(error, HttpError):
+        return error.status in RETRY_STATUSES
+    return isinstance(error, (OSError, http.client.HTTPException))
+
+
+class TokenBucket:
+    """rate개/초로 채워지고 최대 burst개까지 모이는 토큰, 요청마다 하나씩 사용"""
+
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+
+    async def take(self):
+        while True:
+            now = time.monotonic()
+            self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return
+            await asyncio.sleep((1 - self.tokens) / self.rate)
+
+
+class PriorityLimiter:
+    """동시 실행 수 제한 - 자리가 나면 우선순위가 높은 대기자부터 (같으면 먼저 온 순서)"""
+
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self.active = 0
+        self._waiters = []
+        self._seq = itertools.count()
+
+    async def acquire(self, priority: int = 0):
+        if self.active < self.capacity and not self._waiters:
+            self.active += 1
+            return
+        future = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (-priority, next(self._seq), future))
+        try:
+            await future
+        except asyncio.CancelledError:
+            # 자리를 넘겨받은 뒤에 취소됐으면 다음 대기자에게 넘김
+            if future.done() and not future.cancelled():
+                self.release()
+            raise
+
+    def release(self):
+        while self._waiters:
+            _, _, future = heapq.heappop(self._waiters)
+            if not future.done():
+                # 자리를 그대로 넘기므로 active는 유지
+                future.set_result(None)
+                return
+        self.active -= 1
+
+
+class Source:
+    """
+    수집 소스 하나
+    하위 클래스는 name / priority (/ retries)를 정하고 stream()을 구현,
+    요청은 fetch()로 보내면 스케줄러의 동시 실행 / 속도 제한 / 재시도가 적용됨
+    """
+
+    name = "source"
+    # 높을수록 먼저 시작하고 대기 중인 요청도 먼저 처리
+    priority = 0
+    # None이면 스케줄러 기본값 (미러 레이스처럼 다른 미러로 넘어가는 소스는 0)
+    retries = None
+    scheduler = None
+
+    async def stream(self):
+        """영상 레코드(dict)를 하나씩 내보내는 async generator"""
+        raise NotImplementedError
+        yield
+
+    async def fetch(self, url: str, **kwargs):
+        return await self.scheduler.fetch(url, priority=self.priority, retries=self.retries, **kwargs)
+
+    def slot(self, host: str):
+        """HTTP 클라이언트를 거치지 않는 작업(yt-dlp 등)에도 호스트별 제한 적용"""
+        return self.scheduler.slot(host, self.priority)
+
+    def extracted(self, resp, name: str, parse) -> list:
+        """캐시된 추출 결과 재사용 + 요청 기록에 추출 수 반영"""
+        client = self.scheduler.client
+        records = client.cache.extracted(resp, name, parse) if client.cache else parse(resp.text())
+        if client.telemetry is not None:
+            client.telemetry.matched(resp, len(records))
+        return records
+
+
+class Scheduler:
+    """
+    client: HttpClient
+    concurrency: 전체 동시 요청 수 (보통 HTTP 클라이언트 워커 수)
+    host_limits: {호스트: 동시 요청 수}, rates: {호스트: (초당 요청 수, burst)}
+    """
+
+    def __init__(self, client, concurrency: int = 16, host_limits: dict = None, rates: dict = None,
+                 retries: int = DEFAULT_RETRIES, backoff: float = BACKOFF_BASE):
+        self.client = client
+        self.host_limits = host_limits or {}
+        self.rates = rates or {}
+        self.retries = retries
+        self.backoff = backoff
+        self.retried = 0
+        self._global = PriorityLimiter(concurrency)
+        self._hosts = {}
+        self._buckets = {}
+
+    def _host(self, host: str):
+        if host not in self._hosts:
+            self._hosts[host] = PriorityLimiter(self.host_limits.get(host, DEFAULT_HOST_CONCURRENCY))
+            self._buckets[host] = TokenBucket(*self.rates.get(host, (DEFAULT_RATE, DEFAULT_BURST)))
+        return self._hosts[host], self._buckets[host]
+
+    @contextlib.asynccontextmanager
+    async def slot(self, host: str, priority: int = 0):
+        limiter, bucket = self._host(host)
+        await limiter.acquire(priority)
+        try:
+            await bucket.take()
+            yield
+        finally:
+            limiter.release()
+
+    async def fetch(self, url: str, *, priority: int = 0, retries: int = None, **kwargs):
+        """client.fetch와 같은 인자, 호스트 / 전체 제한 안에서 요청하고 일시적인 오류는 재시도"""
+        host = urllib.parse.urlsplit(url).hostname
+        retries = self.retries if retries is None else retries
+        for attempt in range(retries + 1):
+            try:
+                async with self.slot(host, priority):
+                    await self._global.acquire(priority)
+                    try:
+                        return await self.client.fetch(url, **kwargs)
+                    finally:
+                        self._global.release()
+            except Exception as e:
+                if attempt == retries or not is_retryable(e):
+                    raise
+            self.retried += 1
+            await asyncio.sleep(random.uniform(0, self.backoff * 2 ** attempt))
+
+    def start(self, source: Source) -> asyncio.Task:
+        """소스 하나를 태스크로 실행 (결과: 레코드 목록, 태스크 이름은 소스 이름)"""
+        source.scheduler = self
+
+        async def drain():
+            records = []
+            try:
+                async for record in source.stream():
+                    records.append(record)
+            except Exception as e:
+                print(f"[SCHEDULER] {source.name}: {str(e)[:60]}")
+            return records
+
+        telemetry = self.client.telemetry
+        coro = telemetry.track(source.name, drain()) if telemetry is not None else drain()
+        return asyncio.create_task(coro, name=source.name)
+
+    async def run(self, sources: list, collector) -> dict:
+        """우선순위 순으로 모두 시작해 나오는 대로 collector에 추가, {소스 이름: 추가된 수}"""
+        async def consume(source):
+            source.scheduler = self
+            added = 0
+            try:
+                async for record in source.stream():
+                    added += collector.add(record)
+            except Exception as e:
+                print(f"[SCHEDULER] {source.name}: {str(e)[:60]}")
+            print(f"[SCHEDULER] {source.name}: +{added}")
+            return added
+
+        telemetry = self.client.telemetry
+        ordered = sorted(sources, key=lambda s: -s.priority)
+        results = await asyncio.gather(*(
+            telemetry.track(s.name, consume(s)) if telemetry is not None else consume(s)
+            for s in ordered))
+        return {s.name: added for s, added in zip(ordered, results)}
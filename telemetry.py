@@ -0,0 +1,195 @@
+"""
+요청 단위 텔레메트리 + 실행 요약 / 프로파일링
+
+- 나가는 요청마다 JSONL 한 줄 (HttpClient가 기록, 소스는 track()으로 실행한 전략 이름)
+  source, host, method, status, reused, dns_ms, connect_ms, ttfb_ms, total_ms, bytes, matches, error
+- 전략 / 단계별 소요 시간과 소스별 집계를 실행 요약 JSON으로 저장
+- enable_profiling() 후에는 전략마다 cProfile, 실행 전체에 tracemalloc을 걸고 상위 hotspot 출력
+  (전략 안에서 만든 태스크도 같은 전략의 프로파일러로, 스레드 풀에서 도는 부분은 제외)
+"""
+
+import asyncio
+import contextlib
+import contextvars
+import cProfile
+import io
+import json
+import os
+import pstats
+import statistics
+import threading
+import time
+import tracemalloc
+from collections import Counter
+from datetime import datetime, timezone
+
+REQUEST_LOG_PATH = "request_log.jsonl"
+RUN_SUMMARY_PATH = "run_summary.json"
+
+# --profile 출력에서 보여줄 상위 항목 수
+PROFILE_TOP = 15
+
+# 지금 실행 중인 전략 이름 (태스크 / 스레드 풀 호출로 이어짐)
+current_source = contextvars.ContextVar("source", default="unknown")
+
+
+class _Profiled:
+    """코루틴이 실행되는 구간(step)에만 프로파일러를 켬 - 동시에 도는 다른 전략과 섞이지 않도록"""
+
+    def __init__(self, coro, profiler: cProfile.Profile):
+        self.coro = coro
+        self.profiler = profiler
+
+    def __await__(self):
+        it = self.coro.__await__()
+        send, message = it.send, None
+        while True:
+            self.profiler.enable()
+            try:
+                signal = send(message)
+            except StopIteration as e:
+                return e.value
+            finally:
+                self.profiler.disable()
+            try:
+                message = yield signal
+                send = it.send
+            except BaseException as e:
+                message = e
+                send = it.throw
+
+
+async def _profiled(coro, profiler: cProfile.Profile):
+    return await _Profiled(coro, profiler)
+
+
+class Telemetry:
+    def __init__(self, path: str = REQUEST_LOG_PATH, summary_path: str = RUN_SUMMARY_PATH):
+        self.path = path
+        self.summary_path = summary_path
+        self.records = []
+        self.stages = {}
+        self.profiles = {}
+        self.profiling = False
+        self.started_at = datetime.now(timezone.utc).isoformat()
+        self._started = time.monotonic()
+        self._lock = threading.Lock()
+
+    def enable_profiling(self):
+        self.profiling = True
+        tracemalloc.start(10)
+
+    def _task_factory(self, loop, coro, **kwargs):
+        """프로파일 중인 전략 안에서 만든 태스크(미러 레이스, gather 등)도 그 전략으로 집계"""
+        profiler = self.profiles.get(current_source.get())
+        if profiler is not None:
+            coro = _profiled(coro, profiler)
+        return asyncio.Task(coro, loop=loop, **kwargs)
+
+    # --- 기록 ---
+
+    def record(self, **fields) -> dict:
+        """요청 하나 기록, 나중에 matched()로 채울 수 있도록 레코드 반환"""
+        record = {"ts": round(time.time(), 3), "source": current_source.get()}
+        record.update(fields)
+        record.setdefault("matches", None)
+        record.setdefault("error", None)
+        with self._lock:
+            self.records.append(record)
+        return record
+
+    def matched(self, resp, count: int):
+        """응답에서 추출한 항목 수 (캐시에서 바로 나온 응답은 요청이 없으므로 무시)"""
+        if resp is not None and resp.telemetry is not None:
+            resp.telemetry["matches"] = count
+
+    @contextlib.contextmanager
+    def stage(self, name: str):
+        started = time.monotonic()
+        try:
+            yield
+        finally:
+            self.stages[name] = round(time.monotonic() - started, 3)
+
+    async def track(self, name: str, coro):
+        """전략 하나 실행: 요청 기록의 source 지정 + 소요 시간 (+ 프로파일)"""
+        token = current_source.set(name)
+        try:
+            with self.stage(name):
+                if not self.profiling:
+                    return await coro
+                profiler = self.profiles.setdefault(name, cProfile.Profile())
+                loop = asyncio.get_running_loop()
+                if loop.get_task_factory() is None:
+                    loop.set_task_factory(self._task_factory)
+                return await _Profiled(coro, profiler)
+        finally:
+            current_source.reset(token)
+
+    # --- 요약 ---
+
+    def summary(self, http_stats: dict = None) -> dict:
+        sources = {}
+        for record in self.records:
+            entry = sources.setdefault(record["source"], {
+                "requests": 0, "errors": Counter(), "bytes": 0, "matches": 0, "total_ms": []})
+            entry["requests"] += 1
+            entry["bytes"] += record.get("bytes") or 0
+            entry["matches"] += record.get("matches") or 0
+            if record.get("error"):
+                entry["errors"][record["error"]] += 1
+            if record.get("total_ms") is not None:
+                entry["total_ms"].append(record["total_ms"])
+        for entry in sources.values():
+            latencies = entry.pop("total_ms")
+            entry["errors"] = dict(entry["errors"])
+            entry["p50_ms"] = round(statistics.median(latencies), 1) if latencies else None
+            entry["max_ms"] = round(max(latencies), 1) if latencies else None
+        return {
+            "started_at": self.started_at,
+            "elapsed_s": round(time.monotonic() - self._started, 3),
+            "stages": self.stages,
+            "sources": dict(sorted(sources.items())),
+            "http": http_stats or {},
+        }
+
+    def _print_profiles(self):
+        for name, profiler in self.profiles.items():
+            out = io.StringIO()
+            pstats.Stats(profiler, stream=out).sort_stats("cumulative").print_stats(PROFILE_TOP)
+            print(f"\n=== PROFILE: {name} (top {PROFILE_TOP} by cumulative time) ===")
+            print(out.getvalue().strip())
+        if tracemalloc.is_tracing():
+            current, peak = tracemalloc.get_traced_memory()
+            print(f"\n=== MEMORY: {current / 1e6:.1f} MB current / {peak / 1e6:.1f} MB peak ===")
+            for stat in tracemalloc.take_snapshot().statistics("lineno")[:PROFILE_TOP]:
+                print(f"  {stat}")
+
+    def save(self, http_stats: dict = None):
+        """요청 기록(JSONL, 실행마다 새로)과 실행 요약 저장, 요약 출력"""
+        summary = self.summary(http_stats)
+        tmp = f"{self.path}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            for record in self.records:
+                f.write(json.dumps(record, ensure_ascii=False) + "\n")
+        os.replace(tmp, self.path)
+        with open(self.summary_path, "w", encoding="utf-8") as f:
+            json.dump(summary, f, ensure_ascii=False, indent=2)
+
+        print(f"[TELEMETRY] {len(self.records)} requests -> {self.path}")
+        for name, seconds in summary["stages"].items():
+            print(f"  stage {name}: {seconds:.2f}s")
+        for name, entry in summary["sources"].items():
+            errors = ", ".join(f"{k}={v}" for k, v in entry["errors"].items()) or "no errors"
+            print(f"  {name}: {entry['requests']} requests, {entry['bytes']:,} bytes, "
+                  f"{entry['matches']} matches, p50 {entry['p50_ms']}ms ({errors})")
+        if self.profiling:
+            self._print_profiles()
+
+    def reset(self):
+        """저장한 기록을 비우고 새로 시작 (상주 모드에서 공개할 때마다)"""
+        with self._lock:
+            self.records = []
+        self.stages = {}
+        self.started_at = datetime.now(timezone.utc).isoformat()
+        self._started = time.monotonic()
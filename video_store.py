@@ -0,0 +1,135 @@
+"""
+영상 저장소 (SQLite, WAL 모드) - 실행 간 이력 유지
+
+- 매 실행 결과를 upsert (배치 트랜잭션), 영상별 first_seen / last_seen 기록
+- (platform, id) 기본 키 + source / first_seen / last_seen 인덱스
+- 공개 JSON은 가장 최근 N개 행의 materialized view
+- 직전 공개 목록과 비교한 delta (추가 / 삭제) 생성
+"""
+
+import json
+import sqlite3
+import time
+
+from output import write_json
+
+DB_PATH = "videos.db"
+BATCH_SIZE = 500
+
+# 이 기간 동안 한 번도 보이지 않은 행은 삭제
+RETENTION_SECONDS = 30 * 24 * 3600
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS videos (
+    platform   TEXT NOT NULL,
+    id         TEXT NOT NULL,
+    source     TEXT NOT NULL,
+    data       TEXT NOT NULL,
+    first_seen REAL NOT NULL,
+    last_seen  REAL NOT NULL,
+    PRIMARY KEY (platform, id)
+);
+CREATE INDEX IF NOT EXISTS idx_videos_source ON videos (platform, source);
+CREATE INDEX IF NOT EXISTS idx_videos_first_seen ON videos (platform, first_seen);
+CREATE INDEX IF NOT EXISTS idx_videos_last_seen ON videos (platform, last_seen);
+
+CREATE TABLE IF NOT EXISTS published (
+    platform TEXT NOT NULL,
+    id       TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    PRIMARY KEY (platform, id)
+);
+"""
+
+
+class VideoStore:
+    def __init__(self, platform: str, path: str = DB_PATH):
+        self.platform = platform
+        self.conn = sqlite3.connect(path)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(SCHEMA)
+
+    def upsert(self, videos: list, seen_at: float = None) -> int:
+        """이번 실행에서 본 영상 저장, 새로 추가된 영상 수 반환"""
+        seen_at = seen_at or time.time()
+        before = self.count()
+        for i in range(0, len(videos), BATCH_SIZE):
+            rows = [
+                (self.platform, v["id"], v.get("source", "unknown"),
+                 json.dumps(v, ensure_ascii=False), seen_at, seen_at)
+                for v in videos[i:i + BATCH_SIZE]
+            ]
+            with self.conn:
+                self.conn.executemany("""
+                    INSERT INTO videos (platform, id, source, data, first_seen, last_seen)
+                    VALUES (?, ?, ?, ?, ?, ?)
+                    ON CONFLICT (platform, id) DO UPDATE SET
+                        source = excluded.source,
+                        data = excluded.data,
+                        last_seen = excluded.last_seen
+                """, rows)
+        return self.count() - before
+
+    def count(self) -> int:
+        return self.conn.execute(
+            "SELECT COUNT(*) FROM videos WHERE platform = ?", (self.platform,)).fetchone()[0]
+
+    def freshest(self, limit: int, max_age: float = None) -> list:
+        """
+        가장 최근에 본 영상 limit개 (같으면 처음 발견된 시각이 늦은 순)
+        max_age: 처음 발견된 지 이보다 오래된 영상은 제외 (초)
+        """
+        oldest = time.time() - max_age if max_age else 0
+        rows = self.conn.execute("""
+            SELECT data FROM videos
+            WHERE platform = ? AND first_seen >= ?
+            ORDER BY last_seen DESC, first_seen DESC
+            LIMIT ?
+        """, (self.platform, oldest, limit))
+        return [json.loads(data) for (data,) in rows]
+
+    def publish(self, videos: list) -> dict:
+        """공개 목록 교체 후 직전 목록 대비 delta 반환"""
+        previous = {row[0] for row in self.conn.execute(
+            "SELECT id FROM published WHERE platform = ?", (self.platform,))}
+        current = {v["id"] for v in videos}
+        with self.conn:
+            self.conn.execute("DELETE FROM published WHERE platform = ?", (self.platform,))
+            self.conn.executemany(
+                "INSERT INTO published (platform, id, position) VALUES (?, ?, ?)",
+                [(self.platform, v["id"], i) for i, v in enumerate(videos)])
+        return {
+            "added": [v for v in videos if v["id"] not in previous],
+            "removed": sorted(previous - current),
+        }
+
+    def remove(self, ids: list) -> int:
+        """죽은 영상 등 더 이상 공개하면 안 되는 행 삭제"""
+        with self.conn:
+            cur = self.conn.executemany(
+                "DELETE FROM videos WHERE platform = ? AND id = ?",
+                [(self.platform, video_id) for video_id in ids])
+        return cur.rowcount
+
+    def prune(self, retention: float = RETENTION_SECONDS) -> int:
+        with self.conn:
+            cur = self.conn.execute(
+                "DELETE FROM videos WHERE platform = ? AND last_seen < ?",
+                (self.platform, time.time() - retention))
+        return cur.rowcount
+
+    def close(self):
+        # WAL 내용을 본 파일에 반영해 커밋되는 파일이 항상 완결되도록
+        self.conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        self.conn.close()
+
+
+def write_delta(path: str, delta: dict, updated_at: str):
+    write_json(path, {
+        "updated_at": updated_at,
+        "added_count": len(delta["added"]),
+        "removed_count": len(delta["removed"]),
+        "added": delta["added"],
+        "removed": delta["removed"],
+    })